@@ -0,0 +1,274 @@
+"""Local stand-ins for Ollama and Jira used by the benchmark harness"""
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+STATUSES = ['To Do', 'In Progress', 'In Review', 'Blocked', 'Done']
+PRIORITIES = ['Blocker', 'Critical', 'Major', 'Normal', 'Minor']
+PEOPLE = ['Alex Carter', 'Sam Lee', 'Priya Shah', 'Jordan Kim', 'Morgan Diaz', 'Taylor Brooks']
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token) used to pace the fake model"""
+    return max(1, len(text) // 4)
+
+def synthetic_transcript(lines: int, seed: int = 0) -> str:
+    """Build a meeting transcript with a timestamped speaker turn per line"""
+    rng = random.Random(seed)
+    topics = ['the login timeout', 'the billing export', 'flaky CI runs', 'the onboarding email',
+              'the search latency regression', 'the mobile crash on resume', 'the quarterly report']
+    actions = ['will look into', 'needs to fix', 'should write up a ticket for', 'will follow up on',
+               'is blocked on', 'agreed to own']
+    out = []
+    for i in range(lines):
+        minutes, seconds = divmod(i * 17, 60)
+        speaker = rng.choice(PEOPLE)
+        out.append(f"[00:{minutes % 60:02d}:{seconds:02d}] {speaker}: I think {rng.choice(PEOPLE)} "
+                   f"{rng.choice(actions)} {rng.choice(topics)} before Friday.")
+    return "\n".join(out)
+
+def synthetic_issues(count: int, seed: int = 0) -> List[dict]:
+    """Build raw Jira search results with the fields status reports read"""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    issues = []
+    for i in range(1, count + 1):
+        updated = now - timedelta(days=rng.randint(0, 60), minutes=rng.randint(0, 1440))
+        assignee = rng.choice(PEOPLE + [None])
+        issues.append({
+            'key': f'BENCH-{i}',
+            'fields': {
+                'summary': f'Synthetic issue {i}',
+                'project': {'key': 'BENCH'},
+                'status': {'name': rng.choice(STATUSES)},
+                'priority': {'name': rng.choice(PRIORITIES)},
+                'assignee': {'displayName': assignee} if assignee else None,
+                'created': (updated - timedelta(days=rng.randint(0, 90))).strftime('%Y-%m-%dT%H:%M:%S.000+0000'),
+                'updated': updated.strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+            }
+        })
+    return issues
+
+def synthetic_issue_texts(count: int, seed: int = 0) -> List[tuple]:
+    """Build (key, title, description) tuples with realistic overlap in wording for the duplicate index"""
+    rng = random.Random(seed)
+    verbs = ['Fix', 'Investigate', 'Add', 'Update', 'Remove', 'Document', 'Migrate', 'Speed up', 'Test']
+    areas = ['login', 'billing', 'search', 'export', 'onboarding', 'checkout', 'notifications', 'reporting',
+             'mobile', 'admin', 'api', 'dashboard', 'permissions', 'audit', 'import', 'webhooks']
+    things = ['timeout', 'crash', 'latency', 'retry logic', 'error message', 'pagination', 'cache', 'rate limit',
+              'translations', 'dark mode', 'csv format', 'email template', 'feature flag', 'metrics', 'alerts']
+    texts = []
+    for i in range(count):
+        area, thing = rng.choice(areas), rng.choice(things)
+        title = f"{rng.choice(verbs)} {area} {thing} for {rng.choice(areas)} v{rng.randint(1, 500)}"
+        description = (f"{rng.choice(PEOPLE)} reported the {area} {thing} during {rng.choice(PEOPLE)}'s demo; "
+                       f"ticket ref {rng.randint(1000, 99999)}, affects {rng.choice(areas)} and {rng.choice(areas)}.")
+        texts.append((f'BENCH-{i + 1}', title, description))
+    return texts
+
+class _FakeServer:
+    """Run a ThreadingHTTPServer on an ephemeral port in a background thread"""
+
+    handler = None
+
+    def __init__(self):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self.handler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self):
+        with self._lock:
+            self.requests += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get('Content-Length', 0))
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def _send_json(self, payload, status: int = 200):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+class _OllamaHandler(_JSONHandler):
+    def do_GET(self):
+        fake = self.server.fake
+        if self.path == '/':
+            data = b'Ollama is running'
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        elif self.path == '/api/tags':
+            self._send_json({'models': [{'model': fake.model, 'name': fake.model, 'digest': 'sha256:bench'}]})
+        elif self.path == '/api/ps':
+            self._send_json({'models': [{'model': fake.model, 'name': fake.model}]})
+        else:
+            self._send_json({'error': 'not found'}, 404)
+
+    def do_POST(self):
+        fake = self.server.fake
+        if self.path != '/api/generate':
+            self._send_json({'error': 'not found'}, 404)
+            return
+        fake.count()
+        request = self._read_json()
+        prompt = (request.get('system') or '') + (request.get('prompt') or '')
+        if not prompt:
+            # Warm-up request: report the model as loaded
+            self._send_json({'model': fake.model, 'response': '', 'done': True})
+            return
+
+        text = fake.respond(request)
+        prompt_tokens = estimate_tokens(prompt)
+        eval_tokens = estimate_tokens(text)
+        time.sleep(fake.latency + prompt_tokens / fake.prompt_tokens_per_second)
+        stats = {
+            'prompt_eval_count': prompt_tokens,
+            'eval_count': eval_tokens,
+            'prompt_eval_duration': int(prompt_tokens / fake.prompt_tokens_per_second * 1e9),
+            'eval_duration': int(eval_tokens / fake.tokens_per_second * 1e9),
+            'load_duration': 0
+        }
+        stats['total_duration'] = stats['prompt_eval_duration'] + stats['eval_duration'] + int(fake.latency * 1e9)
+
+        if request.get('stream', True):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            pieces = [text[i:i + 16] for i in range(0, len(text), 16)]
+            for piece in pieces:
+                time.sleep(estimate_tokens(piece) / fake.tokens_per_second)
+                self._write_chunk({'model': fake.model, 'response': piece, 'done': False})
+            self._write_chunk(dict(stats, model=fake.model, response='', done=True))
+            self.wfile.write(b'0\r\n\r\n')
+        else:
+            time.sleep(eval_tokens / fake.tokens_per_second)
+            self._send_json(dict(stats, model=fake.model, response=text, done=True))
+
+    def _write_chunk(self, payload: dict):
+        data = json.dumps(payload).encode('utf-8') + b'\n'
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b'\r\n')
+        self.wfile.flush()
+
+class FakeOllama(_FakeServer):
+    """Ollama-compatible /api/generate with configurable latency and token rates
+
+    Extraction requests (format=json) get one issue per lines_per_issue
+    transcript lines; anything else gets a short prose report.
+    """
+
+    handler = _OllamaHandler
+
+    def __init__(self, model: str = 'bench', latency: float = 0.05, tokens_per_second: float = 400,
+                 prompt_tokens_per_second: float = 4000, lines_per_issue: int = 20):
+        super().__init__()
+        self.model = model
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.prompt_tokens_per_second = prompt_tokens_per_second
+        self.lines_per_issue = lines_per_issue
+
+    def respond(self, request: dict) -> str:
+        prompt = request.get('prompt') or ''
+        if request.get('format') != 'json':
+            return "Overall the project is on track. Several high priority issues remain open and need owners."
+        transcript = prompt.split('Meeting Transcript:', 1)[-1]
+        lines = [line for line in transcript.splitlines() if line.strip()]
+        issues = [{
+            'type': 'Task',
+            'title': f'Follow up on item {i + 1}',
+            'description': lines[min(i * self.lines_per_issue, len(lines) - 1)] if lines else '',
+            'priority': PRIORITIES[i % len(PRIORITIES)],
+            'labels': ['meeting', 'bench']
+        } for i in range(max(1, len(lines) // self.lines_per_issue))]
+        return json.dumps({'issues': issues})
+
+class _JiraHandler(_JSONHandler):
+    def do_GET(self):
+        fake = self.server.fake
+        url = urlparse(self.path)
+        if url.path != '/rest/api/2/search':
+            self._send_json({'errorMessages': ['not found']}, 404)
+            return
+        fake.count()
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        issues = fake.match(params.get('jql', ''))
+        start = int(params.get('startAt', 0))
+        limit = int(params.get('maxResults', 50))
+        fields = params.get('fields', '*all')
+        page = issues[start:start + limit]
+        if fields != '*all':
+            wanted = set(fields.split(','))
+            page = [{'key': issue['key'], 'fields': {k: v for k, v in issue['fields'].items() if k in wanted}}
+                    for issue in page]
+        time.sleep(fake.latency)
+        self._send_json({'startAt': start, 'maxResults': limit, 'total': len(issues), 'issues': page})
+
+    def do_POST(self):
+        fake = self.server.fake
+        if self.path != '/rest/api/2/issue/bulk':
+            self._send_json({'errorMessages': ['not found']}, 404)
+            return
+        fake.count()
+        updates = self._read_json().get('issueUpdates', [])
+        time.sleep(fake.latency)
+        created = []
+        for _ in updates:
+            key = fake.next_key()
+            created.append({'id': key.split('-')[1], 'key': key, 'self': f"{fake.url}/rest/api/2/issue/{key}"})
+        self._send_json({'issues': created, 'errors': []}, 201)
+
+class FakeJira(_FakeServer):
+    """Jira REST stub serving search pages over a synthetic issue set and accepting bulk creates"""
+
+    handler = _JiraHandler
+
+    def __init__(self, issues: List[dict] = None, latency: float = 0.02):
+        super().__init__()
+        self.issues = issues or []
+        self.latency = latency
+        self._next = 100000
+
+    def next_key(self) -> str:
+        with self._lock:
+            self._next += 1
+            return f'NEW-{self._next}'
+
+    def match(self, jql: str) -> List[dict]:
+        """Only "key in (...)" is evaluated; every other JQL matches the whole issue set"""
+        keys = re.search(r'key in \(([^)]*)\)', jql)
+        if keys:
+            wanted = {key.strip() for key in keys.group(1).split(',')}
+            return [issue for issue in self.issues if issue['key'] in wanted]
+        return self.issues
@@ -0,0 +1,205 @@
+"""End-to-end benchmarks for meet2jira against local fake Ollama and Jira servers
+
+Usage (from the repository root):
+    python benchmarks/run.py --transcript-lines 50 200 800 --issue-counts 100 1000 5000 --json baseline.json
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from fakes import FakeJira, FakeOllama, synthetic_issue_texts, synthetic_issues, synthetic_transcript
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def measure(func, repeat: int) -> dict:
+    """Time repeat calls, then run once more under tracemalloc for peak memory"""
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - started)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'runs': repeat,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p90_ms': percentile(latencies, 90) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'mean_ms': statistics.mean(latencies) * 1000,
+        'peak_mib': peak / (1024 * 1024)
+    }
+
+def bench_transcripts(orchestrator, model: str, sizes: list, repeat: int) -> list:
+    results = []
+    for lines in sizes:
+        transcript = synthetic_transcript(lines)
+        created = []
+        def run():
+            created[:] = orchestrator.process_transcript(transcript, model=model, approve='all')[0]
+        stats = measure(run, repeat)
+        stats.update(case='process_transcript', size=lines, unit='lines',
+                     throughput=f"{len(created) / (stats['mean_ms'] / 1000):.1f} issues/s")
+        results.append(stats)
+    return results
+
+def bench_reports(orchestrator, fake_jira: FakeJira, model: str, sizes: list, repeat: int) -> list:
+    results = []
+    for count in sizes:
+        fake_jira.issues = synthetic_issues(count)
+        jql = f'project = BENCH AND size = {count}'
+        stats = measure(lambda: orchestrator.generate_status_report(jql, model=model), repeat)
+        stats.update(case='generate_status_report', size=count, unit='issues',
+                     throughput=f"{count / (stats['mean_ms'] / 1000):.0f} issues/s")
+        results.append(stats)
+    return results
+
+def _peak_rss_mib() -> float:
+    """This process's RSS high-water mark (VmHWM, Linux)
+
+    Unlike ru_maxrss, VmHWM starts afresh on exec, so a spawned child does
+    not inherit the benchmark process's peak.
+    """
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError('VmHWM not available')
+
+def _report_rss(jql: str, model: str, workdir: str) -> tuple:
+    """Run one report in a fresh process and return (seconds, RSS growth in MiB) for it
+
+    A small report runs first so imports and connections are already
+    counted in the starting high-water mark.
+    """
+    os.chdir(workdir)
+    from meet2jira.orchestrator import Meet2JiraOrchestrator
+    orchestrator = Meet2JiraOrchestrator(use_cache=False)
+    orchestrator.generate_status_report(jql, model=model, max_issues=50)
+    before = _peak_rss_mib()
+    start = time.perf_counter()
+    orchestrator.generate_status_report(jql, model=model)
+    return time.perf_counter() - start, _peak_rss_mib() - before
+
+def bench_report_rss(fake_jira: FakeJira, model: str, sizes: list, workdir: str) -> list:
+    """Measure process RSS growth of one report per issue set size, in a child process apart from the fakes"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    results = []
+    for count in sizes:
+        fake_jira.issues = synthetic_issues(count)
+        jql = f'project = BENCH AND rss = {count}'
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+            elapsed, growth = pool.submit(_report_rss, jql, model, workdir).result()
+        results.append({'case': 'report_rss', 'size': count, 'unit': 'issues', 'runs': 1,
+                        'p50_ms': elapsed * 1000, 'p90_ms': elapsed * 1000, 'p99_ms': elapsed * 1000,
+                        'mean_ms': elapsed * 1000, 'peak_mib': growth,
+                        'throughput': f"{count / elapsed:.0f} issues/s"})
+    return results
+
+def bench_report_sets(orchestrator, fake_jira: FakeJira, model: str, sizes: list, repeat: int) -> list:
+    """Time one report per person generated one by one and as a report set sharing a single search"""
+    from fakes import PEOPLE
+    reports = [{'name': person, 'jql': f'project = BENCH AND assignee = "{person}"'} for person in PEOPLE]
+    results = []
+    for count in sizes:
+        fake_jira.issues = synthetic_issues(count)
+        def sequential():
+            for report in reports:
+                orchestrator.generate_status_report(report['jql'], model=model)
+        for case, func in (('report_set_sequential', sequential),
+                           ('report_set', lambda: orchestrator.generate_report_set(reports, model=model,
+                                                                                   max_workers=len(reports)))):
+            stats = measure(func, repeat)
+            stats.update(case=case, size=count, unit='issues',
+                         throughput=f"{len(reports) / (stats['mean_ms'] / 1000):.1f} reports/s")
+            results.append(stats)
+    return results
+
+def bench_duplicates(sizes: list, repeat: int, workdir: str) -> list:
+    """Time one duplicate lookup per proposal against indexes of synthetic issues"""
+    from meet2jira.dedupe import DuplicateIndex
+    results = []
+    for count in sizes:
+        index = DuplicateIndex(os.path.join(workdir, f'dedupe-{count}.db'))
+        index.add_many(synthetic_issue_texts(count))
+        proposals = synthetic_issue_texts(50, seed=1)
+        stats = measure(lambda: [index.find(title, description) for _, title, description in proposals], repeat)
+        stats.update(case='duplicate_lookup', size=count, unit='issues',
+                     throughput=f"{len(proposals) / (stats['mean_ms'] / 1000):.0f} lookups/s")
+        results.append(stats)
+        index.close()
+    return results
+
+def print_table(results: list):
+    print(f"{'CASE':<24} {'SIZE':>12} {'P50 ms':>9} {'P90 ms':>9} {'P99 ms':>9} {'PEAK MiB':>9}  THROUGHPUT")
+    for r in results:
+        print(f"{r['case']:<24} {str(r['size']) + ' ' + r['unit']:>12} {r['p50_ms']:>9.1f} {r['p90_ms']:>9.1f} "
+              f"{r['p99_ms']:>9.1f} {r['peak_mib']:>9.2f}  {r['throughput']}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark meet2jira against local fake Ollama and Jira servers')
+    parser.add_argument('--transcript-lines', type=int, nargs='*', default=[50, 200, 800],
+                        help='Synthetic transcript sizes in lines')
+    parser.add_argument('--issue-counts', type=int, nargs='*', default=[100, 1000, 5000],
+                        help='Synthetic Jira issue set sizes for reports')
+    parser.add_argument('--report-set-sizes', type=int, nargs='*', default=[1000],
+                        help='Synthetic issue set sizes for a report set of one report per person')
+    parser.add_argument('--rss-issue-counts', type=int, nargs='*', default=[],
+                        help='Issue set sizes to measure report RSS growth for in a child process (e.g. 5000 50000)')
+    parser.add_argument('--duplicate-index-sizes', type=int, nargs='*', default=[],
+                        help='Duplicate index sizes to time lookups against (e.g. 10000 50000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case')
+    parser.add_argument('--latency', type=float, default=0.05, help='Fake Ollama per-request latency in seconds')
+    parser.add_argument('--tokens-per-second', type=float, default=400, help='Fake Ollama generation rate')
+    parser.add_argument('--prompt-tokens-per-second', type=float, default=4000,
+                        help='Fake Ollama prompt processing rate')
+    parser.add_argument('--jira-latency', type=float, default=0.02, help='Fake Jira per-request latency in seconds')
+    parser.add_argument('--chunk-size', type=int, default=0, help='Passed to Meet2JiraOrchestrator')
+    parser.add_argument('--stream', action='store_true', help='Stream model output while parsing')
+    parser.add_argument('--async', dest='use_async', action='store_true', help='Use the async Ollama client')
+    parser.add_argument('--json', help='Also write the results to this JSON file')
+    args = parser.parse_args()
+    json_path = os.path.abspath(args.json) if args.json else None
+    logging.basicConfig(level=logging.WARNING)
+
+    with FakeOllama(latency=args.latency, tokens_per_second=args.tokens_per_second,
+                    prompt_tokens_per_second=args.prompt_tokens_per_second) as fake_ollama, \
+         FakeJira(latency=args.jira_latency) as fake_jira, \
+         tempfile.TemporaryDirectory() as workdir:
+        # The ollama client reads OLLAMA_HOST when it is first imported
+        os.environ.update(OLLAMA_HOST=fake_ollama.url, JIRA_URL=fake_jira.url, JIRA_PAT='bench',
+                          JIRA_PROJECT_KEY='BENCH')
+        # Run from a scratch directory so the report database stays out of the checkout
+        os.chdir(workdir)
+        from meet2jira.orchestrator import Meet2JiraOrchestrator
+
+        orchestrator = Meet2JiraOrchestrator(chunk_size=args.chunk_size, use_cache=False,
+                                             use_async=args.use_async, stream=args.stream)
+        results = bench_transcripts(orchestrator, fake_ollama.model, args.transcript_lines, args.repeat)
+        results += bench_reports(orchestrator, fake_jira, fake_ollama.model, args.issue_counts, args.repeat)
+        results += bench_report_sets(orchestrator, fake_jira, fake_ollama.model, args.report_set_sizes, args.repeat)
+        results += bench_report_rss(fake_jira, fake_ollama.model, args.rss_issue_counts, workdir)
+        results += bench_duplicates(args.duplicate_index_sizes, args.repeat, workdir)
+        orchestrator.report_storage.close()
+
+    print_table(results)
+    print(f"\nFake Ollama requests: {fake_ollama.requests}, fake Jira requests: {fake_jira.requests}")
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump({'args': vars(args), 'results': results}, f, indent=2)
+
+if __name__ == '__main__':
+    main()
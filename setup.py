@@ -5,17 +5,19 @@ setup(
     version='0.1.0',
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
+    package_data={'meet2jira': ['prompts/*.txt']},
     install_requires=[
         'ollama',
         'python-dotenv',
         'requests',
         'argparse',
-        'atlassian-python-api'
+        'atlassian-python-api',
+        'PyYAML'
     ],
     entry_points={
         'console_scripts': [
             'meet2jira=meet2jira.cli:main',
         ],
     },
-    python_requires='>=3.8',
+    python_requires='>=3.9',
 )
@@ -0,0 +1,120 @@
+import heapq
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Status names treated as finished when computing open workload and staleness
+DONE_STATUSES = {'done', 'closed', 'resolved', 'cancelled', 'canceled', "won't do", 'complete', 'completed'}
+
+# Priorities whose open issues are always surfaced to the LLM
+HIGH_PRIORITIES = {'blocker', 'critical', 'highest', 'high'}
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Jira timestamp such as 2024-01-01T10:00:00.000+0000 into an aware datetime"""
+    if not value:
+        return None
+    for fmt in ('%Y-%m-%dT%H:%M:%S.%f%z', '%Y-%m-%dT%H:%M:%S%z'):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def _top(counter: Counter, limit: int) -> Dict[str, int]:
+    """Keep the largest entries of a counter, folding the rest into "(other)" """
+    top = dict(counter.most_common(limit))
+    rest = sum(counter.values()) - sum(top.values())
+    if rest:
+        top['(other)'] = rest
+    return top
+
+class ReportAggregator:
+    """Compute exact report statistics in Python so the LLM only has to write the narrative"""
+
+    def __init__(self, now: Optional[datetime] = None, stale_days: int = 14, max_items: int = 25,
+                 max_groups: int = 15):
+        self.now = now or datetime.now(timezone.utc)
+        self.stale_days = stale_days
+        self.max_items = max_items
+        self.max_groups = max_groups
+        self.issue_count = 0
+        self.status_counts = Counter()
+        self.priority_counts = Counter()
+        self.assignee_counts = Counter()
+        self.open_by_assignee = Counter()
+        self._stale = []
+        self.stale_count = 0
+        self._high_priority = []
+        self.high_priority_count = 0
+
+    def add(self, issue: dict):
+        """Fold one projected issue (see jira_client.project_issue) into the statistics"""
+        key = issue['key']
+        status = issue['status']
+        assignee = issue['assignee'] or 'Unassigned'
+        priority = issue.get('priority') or 'None'
+        is_open = status.lower() not in DONE_STATUSES
+
+        self.issue_count += 1
+        self.status_counts[status] += 1
+        self.priority_counts[priority] += 1
+        self.assignee_counts[assignee] += 1
+        if is_open:
+            self.open_by_assignee[assignee] += 1
+
+        brief = {'key': key, 'summary': issue['summary'], 'status': status, 'assignee': assignee}
+        if not is_open:
+            return
+        updated = _parse_timestamp(issue.get('updated'))
+        if updated is not None:
+            idle_days = (self.now - updated).days
+            if idle_days >= self.stale_days:
+                self.stale_count += 1
+                # Min-heap on idle days keeps the stalest max_items issues
+                entry = (idle_days, key, dict(brief, days_since_update=idle_days))
+                if len(self._stale) < self.max_items:
+                    heapq.heappush(self._stale, entry)
+                else:
+                    heapq.heappushpop(self._stale, entry)
+        if priority.lower() in HIGH_PRIORITIES:
+            self.high_priority_count += 1
+            if len(self._high_priority) < self.max_items:
+                self._high_priority.append(dict(brief, priority=priority))
+
+    def build(self, previous_report: Optional[dict] = None, changes: Optional[dict] = None) -> Dict[str, Any]:
+        """Return the size-bounded report context; changes comes from ReportStorage.diff_reports"""
+        context = {
+            'issue_count': self.issue_count,
+            'counts': {
+                'by_status': _top(self.status_counts, self.max_groups),
+                'by_priority': _top(self.priority_counts, self.max_groups),
+                'by_assignee': _top(self.assignee_counts, self.max_groups)
+            },
+            'open_issues_by_assignee': _top(self.open_by_assignee, self.max_groups),
+            'stale_issues': {
+                'threshold_days': self.stale_days,
+                'count': self.stale_count,
+                'stalest': [entry[2] for entry in sorted(self._stale, reverse=True)]
+            },
+            'open_high_priority': {
+                'count': self.high_priority_count,
+                'issues': self._high_priority
+            },
+            'previous_report': None
+        }
+        if previous_report is not None and changes is not None:
+            context['previous_report'] = {
+                'created_at': str(previous_report['created_at']),
+                'issue_count': self.issue_count - changes['added']['count'] + changes['removed']['count']
+            }
+            context['changes'] = {
+                name: dict(change, issues=change['issues'][:self.max_items])
+                for name, change in changes.items()
+            }
+            transitions = Counter(changes['status_changed'].get('transitions', {}))
+            context['changes']['status_changed']['transitions'] = _top(transitions, self.max_groups)
+        return context
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+def default_cache_path() -> str:
+    """Location of the response cache, honouring MEET2JIRA_CACHE_DIR and XDG_CACHE_HOME"""
+    cache_dir = os.getenv('MEET2JIRA_CACHE_DIR') or os.path.join(
+        os.getenv('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache'), 'meet2jira')
+    return os.path.join(cache_dir, 'llm_cache.db')
+
+class ResponseCache:
+    """Persistent content-addressed cache for LLM responses with LRU eviction and a TTL"""
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024,
+                 ttl: float = 7 * 24 * 3600):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path or default_cache_path()
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize cache table if it doesn't exist"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+            conn.commit()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash the request inputs (model digest, full prompt, options) into a cache key"""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired"""
+        now = time.time()
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and now - row[1] <= self.ttl:
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+                with self._lock:
+                    self.hits += 1
+                return row[0]
+            if row:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value: str):
+        """Store a response and evict least recently used entries beyond max_bytes"""
+        now = time.time()
+        size = len(value.encode('utf-8'))
+        with sqlite3.connect(self.db_path, timeout=10) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now)
+            )
+            conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently accessed entries until the cache fits in max_bytes"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.logger.debug(f"Evicted {len(evicted)} cached responses")
+
+    def clear(self):
+        """Remove every cached response"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for this process"""
+        return {'hits': self.hits, 'misses': self.misses}
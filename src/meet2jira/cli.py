@@ -1,11 +1,235 @@
 import argparse
+import glob
 import logging
-from .orchestrator import Meet2JiraOrchestrator
-from .models import list_models
+import os
+import sys
+from .timings import RunRecorder
+
+def print_cache_stats(stats: dict):
+    print(f"LLM cache: {stats['hits']} hits, {stats['misses']} misses")
+
+def parse_keep_alive(value: str):
+    """Accept Ollama keep_alive durations ("30m", "1h") or plain seconds ("-1" keeps the model loaded)"""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+def collect_transcripts(args) -> list:
+    """Resolve --transcript-dir/--pattern and --transcript-list into transcript file paths"""
+    paths = []
+    if args.transcript_dir:
+        paths.extend(sorted(
+            path for path in glob.glob(os.path.join(args.transcript_dir, args.pattern))
+            if os.path.isfile(path)
+        ))
+    if args.transcript_list:
+        if args.transcript_list == '-':
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.transcript_list, 'r') as f:
+                lines = f.read().splitlines()
+        paths.extend(line.strip() for line in lines if line.strip())
+    return paths
+
+def run_batch(orchestrator, args):
+    """Run batch mode and report throughput on stderr"""
+    paths = collect_transcripts(args)
+    if args.output == '-':
+        summary = orchestrator.process_batch(paths, model=args.model, dry_run=args.dry_run,
+                                             max_workers=args.workers, output=sys.stdout)
+    else:
+        with open(args.output, 'w') as output:
+            summary = orchestrator.process_batch(paths, model=args.model, dry_run=args.dry_run,
+                                                 max_workers=args.workers, output=output)
+    print(f"Processed {summary['processed']} transcripts ({summary['failed']} failed) "
+          f"in {summary['elapsed_seconds']:.1f}s: "
+          f"{summary['transcripts_per_minute']:.2f} transcripts/minute", file=sys.stderr)
+
+def print_issue(issue: dict):
+    print(f"- Title: {issue['title']}")
+    if issue.get('duplicate_of'):
+        duplicate = issue['duplicate_of']
+        print(f"  Possible duplicate of {duplicate['key']} ({duplicate['similarity']:.0%} similar): "
+              f"{duplicate['summary']}")
+    print(f"  Type: {issue['type']}")
+    print(f"  Priority: {issue['priority']}")
+    print(f"  Labels: {', '.join(issue['labels'])}")
+    print(f"  Description:\n{issue['description']}\n")
+    print("-" * 40)
+
+def build_preprocessor(args):
+    """Translate --preprocess/--relevance-filter into a TranscriptPreprocessor, or None when disabled"""
+    if not args.preprocess and args.relevance_filter is None:
+        return None
+    from .preprocess import TranscriptPreprocessor, DEFAULT_KEYWORDS
+    keywords = None
+    if args.relevance_filter is not None:
+        keywords = [k.strip() for k in args.relevance_filter.split(',') if k.strip()] or DEFAULT_KEYWORDS
+    return TranscriptPreprocessor(keywords=keywords)
+
+def print_preprocess_stats(parser):
+    stats = parser.last_preprocess_stats if parser is not None else None
+    if stats:
+        print(f"Preprocessing ({stats['format']}): {stats['input_turns']} -> {stats['output_turns']} turns, "
+              f"~{stats['tokens_before']} -> ~{stats['tokens_after']} tokens")
+
+def print_prompt_estimate(parser):
+    estimate = parser.last_prompt_estimate if parser is not None else None
+    if estimate:
+        print(f"Prompt estimate: ~{estimate['prompt_tokens']} tokens (num_ctx {estimate['num_ctx']})")
+
+def print_results(results: list, dry_run: bool):
+    if dry_run:
+        print(f"Would create {len(results)} Jira issues:")
+        for result in results:
+            print_issue(result)
+    else:
+        print(f"Created {len(results)} Jira issues:")
+        for result in results:
+            print(f"- {result['key']}: {result['self']}")
+
+def print_report(report: dict):
+    print("\nStatus Report:")
+    print("-" * 40)
+    print(report['summary'])
+    print("-" * 40)
+    print(f"\nGenerated from {report['issue_count']} issues matching JQL: {report['jql']}")
+
+def run_report_set(orchestrator, args):
+    """Generate every report in the --report-set file from one shared Jira search"""
+    from .report_set import load_report_set
+    report_set = load_report_set(args.report_set)
+    reports = orchestrator.generate_report_set(report_set['reports'], model=args.model,
+                                               superset=report_set['superset'], max_workers=args.workers)
+    for report in reports:
+        print(f"\n=== {report['name']} ===")
+        if 'error' in report:
+            print(f"Error: {report['error']} ({report['jql']})")
+        else:
+            print_report(report)
+
+def serve(argv: list):
+    """Run the long-lived HTTP daemon (meet2jira serve)"""
+    from .server import Meet2JiraServer, DEFAULT_HOST, DEFAULT_PORT
+    parser = argparse.ArgumentParser(prog='meet2jira serve',
+                                     description='Keep the meet2jira pipeline warm behind a local HTTP API')
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Address to listen on (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('--model', '-m', default='llama2', help='Default Ollama model for requests that do not name one')
+    parser.add_argument('--workers', type=int, default=1, help='Jobs processed concurrently (default: 1)')
+    parser.add_argument('--max-pending', type=int, default=32, help='Queued jobs allowed before requests get 503')
+    parser.add_argument('--chunk-size', type=int, default=0, help='Split transcripts longer than this many characters')
+    parser.add_argument('--parallel', type=int, default=None, help='Chunks sent to Ollama concurrently')
+    parser.add_argument('--max-context', type=int, default=24576, help='Largest num_ctx requested from Ollama')
+    parser.add_argument('--keep-alive', type=parse_keep_alive, default=-1,
+                        help='How long Ollama keeps the model loaded after a request (default: -1, forever)')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk LLM response cache')
+    parser.add_argument('--prompt-dir', help='Directory of prompt templates overriding the packaged ones')
+    parser.add_argument('--preprocess', action='store_true', help='Clean up transcripts before prompting')
+    parser.add_argument('--relevance-filter', nargs='?', const='', metavar='KEYWORDS',
+                        help='Keep only turns mentioning these comma-separated keywords (implies --preprocess)')
+    args = parser.parse_args(argv)
+
+    from .orchestrator import Meet2JiraOrchestrator
+    orchestrator = Meet2JiraOrchestrator(chunk_size=args.chunk_size, max_workers=args.parallel,
+                                         use_cache=not args.no_cache, keep_alive=args.keep_alive,
+                                         max_ctx=args.max_context, prompt_dir=args.prompt_dir,
+                                         preprocessor=build_preprocessor(args))
+    server = Meet2JiraServer(orchestrator, host=args.host, port=args.port, model=args.model,
+                             workers=args.workers, max_pending=args.max_pending)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+def run(orchestrator, args, transcript: str, approve: str, batch: bool):
+    """Run the requested command against a local orchestrator"""
+    if args.sync_duplicates:
+        indexed = orchestrator.sync_duplicate_index(args.sync_duplicates)
+        print(f"Indexed {indexed} issues for duplicate detection")
+        if not (transcript or args.report or args.report_set or args.resume or batch):
+            return
+
+    if batch:
+        run_batch(orchestrator, args)
+        return
+
+    if args.resume:
+        results, _ = orchestrator.resume_run(args.resume, approve=approve)
+        print_results(results, dry_run=False)
+        return
+
+    if args.report_set:
+        run_report_set(orchestrator, args)
+        if args.verbose and orchestrator.cache is not None:
+            print_cache_stats(orchestrator.cache.stats())
+        return
+    
+    if args.report:
+        report = orchestrator.generate_status_report(args.jql, model=args.model, max_issues=args.max_issues,
+                                                     incremental=args.incremental)
+        print_report(report)
+        if args.verbose:
+            print_prompt_estimate(orchestrator.parser)
+            if orchestrator.cache is not None:
+                print_cache_stats(orchestrator.cache.stats())
+        return
+    elif args.stream and args.dry_run:
+        # Print proposals while the model is still generating the rest
+        results = []
+        for issue in orchestrator.iter_issues(transcript, model=args.model):
+            print_issue(issue)
+            results.append(issue)
+        print(f"Would create {len(results)} Jira issues")
+        if args.verbose and orchestrator.parser.last_time_to_first_issue is not None:
+            print(f"Time to first issue: {orchestrator.parser.last_time_to_first_issue:.2f}s")
+        if args.verbose:
+            print_preprocess_stats(orchestrator.parser)
+        return
+    else:
+        results, llm_response = orchestrator.process_transcript(transcript, model=args.model, dry_run=args.dry_run,
+                                                                approve=approve)
+
+    if args.verbose:
+        print("\nParsed Transcript:")
+        print("-" * 40)
+        print(transcript)
+        print("-" * 40)
+        print("\nLLM Response:")
+        print("-" * 40)
+        try:
+            import json
+            print(json.dumps(llm_response, indent=2))
+        except json.JSONDecodeError:
+            print(llm_response)
+        print("-" * 40)
+        print_preprocess_stats(orchestrator.parser)
+        print_prompt_estimate(orchestrator.parser)
+        if orchestrator.cache is not None:
+            print_cache_stats(orchestrator.cache.stats())
+        print()
+    
+    # Output results
+    print_results(results, args.dry_run)
+
+def emit_timings(timings: RunRecorder, args):
+    """Print the per-stage timing table to stderr and/or write the run record as JSON"""
+    if args.timings:
+        print(timings.format_table(), file=sys.stderr)
+    if args.timings_json == '-':
+        print(timings.to_json())
+    elif args.timings_json:
+        with open(args.timings_json, 'w') as f:
+            f.write(timings.to_json())
 
 def main():
     # Configure logging
     logging.basicConfig(level=logging.INFO)
+
+    if sys.argv[1:2] == ['serve']:
+        serve(sys.argv[2:])
+        return
     
     # Set up argument parser
     parser = argparse.ArgumentParser(description='Process meeting transcripts into Jira issues')
@@ -16,22 +240,108 @@ def main():
     parser.add_argument('--transcript', '-t', required=False, help='Meeting transcript text or path to transcript file')
     parser.add_argument('--report', '-r', action='store_true', help='Generate status report from Jira issues')
     parser.add_argument('--jql', '-j', required=False, help='JQL query for report generation')
+    parser.add_argument('--max-issues', type=int, default=None,
+                        help='Maximum number of issues to include in a report (default: all matching issues)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Refresh the previous report for this JQL by fetching only issues updated since it ran')
+    parser.add_argument('--report-set', metavar='FILE',
+                        help='Generate every named JQL report in this YAML file from one Jira search, summarising '
+                             '--workers reports at a time')
+    parser.add_argument('--compact-reports', action='store_true',
+                        help='Prune and downsample stored report snapshots, then reclaim disk space')
+    parser.add_argument('--keep-days', type=int, default=None,
+                        help='With --compact-reports, delete reports older than this many days (the latest per JQL is '
+                             'kept) and completed transcript runs not touched for this long')
+    parser.add_argument('--downsample-after-days', type=int, default=None,
+                        help='With --compact-reports, keep one report per day for reports older than this many days')
+    parser.add_argument('--chunk-size', type=int, default=0,
+                        help='Split transcripts longer than this many characters into overlapping chunks (0 disables)')
+    parser.add_argument('--parallel', type=int, default=None,
+                        help='Number of chunks to send to Ollama concurrently (default: $OLLAMA_NUM_PARALLEL or 1)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Use the asyncio Ollama client; --parallel caps in-flight requests')
+    parser.add_argument('--stream', action='store_true',
+                        help='Stream the model output and show each issue as soon as it is generated')
+    parser.add_argument('--max-context', type=int, default=24576,
+                        help='Largest num_ctx requested from Ollama; each request is sized to its prompt up to this '
+                             'limit, and longer transcripts are split into chunks (default: 24576)')
+    parser.add_argument('--keep-alive', type=parse_keep_alive, default=None,
+                        help='How long Ollama keeps the model loaded after a request, e.g. 30m or -1 for forever')
+    parser.add_argument('--resident', action='store_true',
+                        help='Leave the Ollama server running and the model loaded after exit so later runs start warm')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk LLM response cache')
+    parser.add_argument('--prompt-dir', default=os.getenv('MEET2JIRA_PROMPT_DIR'),
+                        help='Directory with system_prompt.txt/report_prompt.txt overriding the packaged templates '
+                             '(default: $MEET2JIRA_PROMPT_DIR)')
+    parser.add_argument('--preprocess', action='store_true',
+                        help='Detect VTT/SRT/plain transcripts and strip timestamps, filler words and repeated '
+                             'speaker tags before prompting; --verbose reports the token reduction')
+    parser.add_argument('--relevance-filter', nargs='?', const='', metavar='KEYWORDS',
+                        help='Keep only turns mentioning one of these comma-separated keywords, plus their '
+                             'neighbours (built-in action words when none are given; implies --preprocess)')
+    parser.add_argument('--sync-duplicates', metavar='JQL',
+                        help='Index Jira issues matching this JQL for duplicate detection; repeat syncs fetch only '
+                             'issues updated since the last one')
+    parser.add_argument('--no-duplicate-check', action='store_true',
+                        help='Do not compare proposed issues with previously created or synced issues')
+    parser.add_argument('--skip-duplicates', action='store_true',
+                        help='With --yes or --approve, do not create proposals flagged as likely duplicates')
+    parser.add_argument('--resume', metavar='RUN_ID',
+                        help='Continue an interrupted transcript run from its last completed step; parsed issues and '
+                             'earlier approvals are reused and no issue is created twice')
+    parser.add_argument('--timings', action='store_true',
+                        help='Print per-stage timings and Ollama token rates to stderr after the run')
+    parser.add_argument('--timings-json', help='Write the timing and token record as JSON to this file (- for stdout)')
+    parser.add_argument('--server', default=os.getenv('MEET2JIRA_SERVER'),
+                        help='Forward reports and non-interactive transcript runs to a running "meet2jira serve" '
+                             'daemon at this URL (default: $MEET2JIRA_SERVER)')
+    parser.add_argument('--transcript-dir', help='Process every transcript file in this directory (batch mode)')
+    parser.add_argument('--pattern', default='*', help='Glob pattern for files in --transcript-dir (default: *)')
+    parser.add_argument('--transcript-list', help='File listing transcript paths, one per line, or - for stdin (batch mode)')
+    parser.add_argument('--output', '-o', default='-', help='JSON Lines output file for batch results (default: stdout)')
+    parser.add_argument('--workers', type=int, default=2,
+                        help='Number of transcripts processed concurrently in batch mode, or of report summaries '
+                             'generated concurrently with --report-set')
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help='Create all proposed issues without prompting (required for batch mode without --dry-run)')
+    parser.add_argument('--approve', help='Create only these proposed issues without prompting, e.g. "1,3-5"')
     args = parser.parse_args()
 
+    batch = bool(args.transcript_dir or args.transcript_list)
+
     # Validate arguments
-    if not args.list_models and not args.transcript and not args.report:
-        parser.error('Either --transcript, --report, or --list-models is required')
+    if (not args.list_models and not args.transcript and not args.report and not batch and not args.compact_reports
+            and not args.sync_duplicates and not args.report_set and not args.resume):
+        parser.error('Either --transcript, --transcript-dir, --transcript-list, --report, --report-set, '
+                     '--resume, --compact-reports, --sync-duplicates, or --list-models is required')
+    if batch and not (args.dry_run or args.yes):
+        parser.error('Batch mode requires --dry-run or --yes since issues cannot be approved interactively')
     if args.report and not args.jql:
         parser.error('--jql is required when generating reports')
+    if args.sync_duplicates and args.no_duplicate_check:
+        parser.error('--sync-duplicates builds the duplicate index that --no-duplicate-check turns off')
 
     # List models if requested
     if args.list_models:
+        from .models import list_models
         list_models()
         return
 
+    if args.compact_reports:
+        from .report_storage import ReportStorage
+        from .run_journal import RunJournal
+        if args.keep_days is not None:
+            # Pruned before compaction so its VACUUM also reclaims the journal's space
+            removed_runs = RunJournal().prune(args.keep_days)
+            print(f"Removed {removed_runs} completed transcript runs")
+        storage = ReportStorage()
+        stats = storage.compact(keep_days=args.keep_days, downsample_after_days=args.downsample_after_days)
+        print(f"Removed {stats['removed_reports']} reports and {stats['removed_versions']} stored issue versions")
+        return
+
     # Get transcript content if not in report mode
     transcript = None
-    if not args.report:
+    if args.transcript and not args.report and not batch:
         try:
             with open(args.transcript, 'r') as f:
                 transcript = f.read()
@@ -39,49 +349,44 @@ def main():
             # If not a valid file path, treat as direct text
             transcript = args.transcript
 
-    # Process request
-    orchestrator = Meet2JiraOrchestrator()
-    
-    if args.report:
-        report = orchestrator.generate_status_report(args.jql, model=args.model)
-        print("\nStatus Report:")
-        print("-" * 40)
-        print(report['summary'])
-        print("-" * 40)
-        print(f"\nGenerated from {report['issue_count']} issues matching JQL: {report['jql']}")
+    # A running daemon already has the model, Jira session and database warm
+    approve = 'all' if args.yes else args.approve
+    if args.server and not batch and (args.report or args.dry_run or approve is not None):
+        from .server import forward
+        if args.report:
+            print_report(forward(args.server, '/reports', {
+                'jql': args.jql, 'model': args.model, 'max_issues': args.max_issues, 'incremental': args.incremental
+            }))
+            return
+        payload = {'transcript': transcript, 'model': args.model}
+        if not args.dry_run:
+            payload['approve'] = approve
+        response = forward(args.server, '/transcripts', payload)
+        results = response.get('issues', response.get('created', []))
+        print_results(results, args.dry_run)
         return
-    else:
-        results, llm_response = orchestrator.process_transcript(transcript, model=args.model, dry_run=args.dry_run)
 
-    if args.verbose:
-        print("\nParsed Transcript:")
-        print("-" * 40)
-        print(transcript)
-        print("-" * 40)
-        print("\nLLM Response:")
-        print("-" * 40)
-        try:
-            import json
-            print(json.dumps(llm_response, indent=2))
-        except json.JSONDecodeError:
-            print(llm_response)
-        print("-" * 40)
-        print()
-    
-    # Output results
-    if args.dry_run:
-        print(f"Would create {len(results)} Jira issues:")
-        for result in results:
-            print(f"- Title: {result['title']}")
-            print(f"  Type: {result['type']}")
-            print(f"  Priority: {result['priority']}")
-            print(f"  Labels: {', '.join(result['labels'])}")
-            print(f"  Description:\n{result['description']}\n")
-            print("-" * 40)
-    else:
-        print(f"Created {len(results)} Jira issues:")
-        for result in results:
-            print(f"- {result['key']}: {result['self']}")
+    # Process request
+    timings = RunRecorder() if args.timings or args.timings_json else None
+    # Imported here rather than at the top so --help, --compact-reports and --server forwarding skip ollama
+    from .orchestrator import Meet2JiraOrchestrator
+    orchestrator = Meet2JiraOrchestrator(chunk_size=args.chunk_size, max_workers=args.parallel,
+                                         use_cache=not args.no_cache, use_async=args.use_async,
+                                         stream=args.stream, keep_alive=args.keep_alive,
+                                         resident=args.resident, timings=timings, max_ctx=args.max_context,
+                                         prompt_dir=args.prompt_dir, preprocessor=build_preprocessor(args),
+                                         detect_duplicates=not args.no_duplicate_check,
+                                         skip_duplicates=args.skip_duplicates)
+    try:
+        run(orchestrator, args, transcript, approve, batch)
+    except (Exception, KeyboardInterrupt):
+        if orchestrator.last_run_id:
+            print(f"\nRun {orchestrator.last_run_id} was interrupted; continue it with "
+                  f"meet2jira --resume {orchestrator.last_run_id}", file=sys.stderr)
+        raise
+    finally:
+        if timings is not None:
+            emit_timings(timings, args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,46 @@
+import os
+import re
+from typing import Any, Dict, Optional
+
+# Default location of the settings file, relative to the working directory; $MEET2JIRA_CONFIG overrides it
+DEFAULT_SETTINGS_PATH = os.path.join('config', 'settings.yaml')
+
+# ${VAR} or ${VAR:default}
+REFERENCE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)(?::([^}]*))?\}")
+
+def _expand(value: Any) -> Any:
+    """Substitute environment references in every string of a parsed settings tree"""
+    if isinstance(value, dict):
+        return {key: _expand(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_expand(item) for item in value]
+    if not isinstance(value, str) or '${' not in value:
+        return value
+    expanded = REFERENCE.sub(lambda match: os.getenv(match.group(1), match.group(2) or ''), value)
+    if REFERENCE.fullmatch(value.strip()):
+        # A value that is a single reference takes the type its text implies ("3" -> 3, "0.7" -> 0.7)
+        import yaml
+        try:
+            typed = yaml.safe_load(expanded)
+        except yaml.YAMLError:
+            return expanded
+        return typed if isinstance(typed, (int, float, bool)) else expanded
+    return expanded
+
+def load_settings(path: Optional[str] = None) -> Dict[str, Any]:
+    """Read settings.yaml with ${VAR:default} references expanded; {} when there is no settings file"""
+    path = path or os.getenv('MEET2JIRA_CONFIG') or DEFAULT_SETTINGS_PATH
+    if not os.path.isfile(path):
+        return {}
+    import yaml
+    with open(path, 'r') as f:
+        return _expand(yaml.safe_load(f) or {})
+
+def setting(settings: Dict[str, Any], dotted: str, default: Any = None) -> Any:
+    """Look up a nested setting such as 'app.max_retries', falling back to default when unset or empty"""
+    value = settings
+    for part in dotted.split('.'):
+        if not isinstance(value, dict) or value.get(part) in (None, ''):
+            return default
+        value = value[part]
+    return value
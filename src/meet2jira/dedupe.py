@@ -0,0 +1,214 @@
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import zlib
+from array import array
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from .timings import RunRecorder
+
+# Descriptions beyond this are mostly boilerplate and only slow signing down
+MAX_DESCRIPTION_CHARS = 1000
+
+STOPWORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'in', 'into', 'is', 'it', 'its', 'of',
+    'on', 'or', 'that', 'the', 'this', 'to', 'was', 'we', 'will', 'with', 'our', 'should', 'need', 'needs'
+))
+
+def shingles(title: str, description: str = '') -> set:
+    """Distinct content words of an issue's title and the start of its description
+
+    Single words rather than word pairs, so reworded action items
+    ("fix the login timeout" / "login timeout fix") still overlap.
+    """
+    text = f"{title or ''} {(description or '')[:MAX_DESCRIPTION_CHARS]}".lower()
+    return {word for word in re.findall(r"[a-z0-9]+", text) if len(word) > 1 and word not in STOPWORDS}
+
+class DuplicateIndex:
+    """MinHash/LSH index of existing issues used to flag re-raised action items
+
+    Each issue's title and description are reduced to a MinHash signature of
+    num_perm values. Signatures are split into bands of rows values; issues
+    sharing any band bucket become candidates, and a candidate whose
+    estimated Jaccard similarity reaches threshold is reported as a likely
+    duplicate. With 32 bands of 3 rows, pairs at 0.5 similarity share a
+    bucket 98% of the time and pairs sharing a single common word almost
+    never do. Buckets live in an indexed SQLite table, so a lookup is a
+    handful of index probes however many issues are stored. Buckets filled
+    by boilerplate shared across most issues are skipped, as are all but
+    the max_candidates issues sharing the most bands.
+    """
+
+    def __init__(self, db_path: str = "meet2jira_reports.db", num_perm: int = 96, bands: int = 32,
+                 threshold: float = 0.5, max_candidates: int = 16, max_bucket_size: int = 256,
+                 timings: Optional[RunRecorder] = None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        # Buckets holding more issues than this come from boilerplate words shared by everything; skip them
+        self.max_bucket_size = max_bucket_size
+        self.timings = timings or RunRecorder(enabled=False)
+        # Lane masks for counting equal signature values with big-integer arithmetic (see _similarity)
+        self._low_bits = int.from_bytes(b'\xff\xff\xff\x7f' * num_perm, 'little')
+        self._top_bits = self._low_bits ^ ((1 << 32 * num_perm) - 1)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS duplicate_issues (
+                    issue_key TEXT PRIMARY KEY,
+                    summary TEXT,
+                    signature BLOB NOT NULL,
+                    indexed_at TIMESTAMP NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS duplicate_buckets (
+                    bucket INTEGER NOT NULL,
+                    issue_key TEXT NOT NULL,
+                    PRIMARY KEY (bucket, issue_key)
+                ) WITHOUT ROWID
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_buckets_key ON duplicate_buckets(issue_key)")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS duplicate_bucket_sizes (
+                    bucket INTEGER PRIMARY KEY,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS duplicate_syncs (
+                    jql_filter TEXT PRIMARY KEY,
+                    synced_at TIMESTAMP NOT NULL
+                )
+            """)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def signature(self, title: str, description: str = '') -> Optional[array]:
+        """MinHash signature of an issue's words, or None when it has none
+
+        A single SHAKE-128 digest per word supplies all num_perm hash values,
+        and the per-position minimum is taken in C by min over zip.
+        """
+        size = 4 * self.num_perm
+        hashed = [array('I', hashlib.shake_128(word.encode('utf-8')).digest(size))
+                  for word in shingles(title, description)]
+        if not hashed:
+            return None
+        return array('I', map(min, *hashed)) if len(hashed) > 1 else hashed[0]
+
+    def _buckets(self, signature: array) -> List[int]:
+        """One bucket id per band: the band number in the high bits, a hash of its rows in the low ones"""
+        data = signature.tobytes()
+        width = self.rows * signature.itemsize
+        return [band << 32 | zlib.crc32(data[band * width:(band + 1) * width]) for band in range(self.bands)]
+
+    def _similarity(self, signature: int, other: bytes) -> float:
+        """Fraction of equal values in two signatures, compared without unpacking them
+
+        XOR the signatures as big integers; adding 0x7FFFFFFF to the low 31
+        bits of a 32-bit lane carries into its top bit (and never past it)
+        exactly when the lane is non-zero, so counting top bits counts the
+        values that differ.
+        """
+        diff = signature ^ int.from_bytes(other, 'little')
+        differing = bin((((diff & self._low_bits) + self._low_bits) | diff) & self._top_bits).count('1')
+        return 1 - differing / self.num_perm
+
+    def add(self, key: str, title: str, description: str = ''):
+        """Index (or re-index) a single issue"""
+        self.add_many([(key, title, description)])
+
+    def add_many(self, issues: Iterable[Tuple[str, str, str]]) -> int:
+        """Index (key, title, description) tuples in one transaction, replacing existing entries
+
+        A key given more than once (a paged search can return an issue updated
+        mid-sync twice) is indexed from its last occurrence.
+        """
+        now = datetime.utcnow().isoformat()
+        latest = {key: (title, description) for key, title, description in issues}
+        rows = []
+        buckets = []
+        for key, (title, description) in latest.items():
+            signature = self.signature(title, description)
+            if signature is None:
+                continue
+            rows.append((key, title, signature.tobytes(), now))
+            buckets.extend((bucket, key) for bucket in self._buckets(signature))
+        if not rows:
+            return 0
+        sizes = Counter(bucket for bucket, _ in buckets)
+        with self.timings.span('dedupe.add', issues=len(rows)), self._lock, self.conn:
+            keys = [(row[0],) for row in rows]
+            self.conn.executemany("""
+                UPDATE duplicate_bucket_sizes SET size = size - 1
+                WHERE bucket IN (SELECT bucket FROM duplicate_buckets WHERE issue_key = ?)
+            """, keys)
+            self.conn.executemany("DELETE FROM duplicate_buckets WHERE issue_key = ?", keys)
+            self.conn.executemany("INSERT OR REPLACE INTO duplicate_issues VALUES (?, ?, ?, ?)", rows)
+            self.conn.executemany("INSERT INTO duplicate_buckets VALUES (?, ?)", buckets)
+            self.conn.executemany("""
+                INSERT INTO duplicate_bucket_sizes VALUES (?, ?)
+                ON CONFLICT(bucket) DO UPDATE SET size = size + excluded.size
+            """, sizes.items())
+        return len(rows)
+
+    def find(self, title: str, description: str = '') -> Optional[Dict]:
+        """Return the most similar indexed issue at or above threshold as {'key', 'summary', 'similarity'}"""
+        signature = self.signature(title, description)
+        if signature is None:
+            return None
+        buckets = self._buckets(signature)
+        with self.timings.span('dedupe.lookup') as span, self._lock:
+            # Rank candidates by shared bands in SQL and verify only the best few signatures
+            candidates = self.conn.execute(f"""
+                SELECT i.issue_key, i.summary, i.signature
+                FROM (
+                    SELECT issue_key, COUNT(*) AS shared FROM duplicate_buckets
+                    WHERE bucket IN (
+                        SELECT bucket FROM duplicate_bucket_sizes
+                        WHERE bucket IN ({','.join('?' * len(buckets))}) AND size <= ?
+                    )
+                    GROUP BY issue_key ORDER BY shared DESC LIMIT ?
+                ) c JOIN duplicate_issues i ON i.issue_key = c.issue_key
+            """, buckets + [self.max_bucket_size, self.max_candidates]).fetchall()
+            span['candidates'] = len(candidates)
+        best = None
+        mine = int.from_bytes(signature.tobytes(), 'little')
+        for row in candidates:
+            similarity = self._similarity(mine, row['signature'])
+            if similarity >= self.threshold and (best is None or similarity > best['similarity']):
+                best = {'key': row['issue_key'], 'summary': row['summary'], 'similarity': round(similarity, 2)}
+        return best
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM duplicate_issues").fetchone()[0]
+
+    def last_synced(self, jql: str) -> Optional[datetime]:
+        """When the given JQL was last synced into the index"""
+        with self._lock:
+            row = self.conn.execute("SELECT synced_at FROM duplicate_syncs WHERE jql_filter = ?", (jql,)).fetchone()
+        return datetime.fromisoformat(row['synced_at']) if row else None
+
+    def mark_synced(self, jql: str, synced_at: datetime):
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO duplicate_syncs VALUES (?, ?)", (jql, synced_at.isoformat()))
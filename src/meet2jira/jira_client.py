@@ -1,21 +1,40 @@
 import os
 import logging
-from typing import List
-from atlassian import Jira
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Sequence
+from requests import HTTPError
+from .config import load_settings
+from .records import IssueRecord
+from .retry import RetryPolicy
+from .timings import RunRecorder
+
+# Jira rejects bulk create requests with more than 50 issues
+BULK_CREATE_LIMIT = 50
+
+# Fields read by status reports; fetching only these keeps search payloads small
+REPORT_FIELDS = ('status', 'assignee', 'summary', 'priority', 'created', 'updated')
+
+def project_issue(issue: dict) -> IssueRecord:
+    """Reduce a raw Jira issue to the flat fields reports and snapshots use"""
+    return IssueRecord.from_raw(issue)
 
 class JiraClient:
-    def __init__(self):
+    def __init__(self, timings: Optional[RunRecorder] = None, retry: Optional[RetryPolicy] = None):
         self.logger = logging.getLogger(__name__)
+        self.timings = timings or RunRecorder(enabled=False)
+        # Every Jira request goes through one policy so rate limits and the circuit breaker span all threads
+        self.retry = retry or RetryPolicy.from_settings(load_settings(), timings=self.timings)
+        # atlassian pulls in a large dependency tree; import it only when a client is built
+        from atlassian import Jira
         self.client = Jira(
             url=os.getenv('JIRA_URL'),
             token=os.getenv('JIRA_PAT')
         )
 
-    def create_issue(self, issue_data: dict) -> dict:
-        """Create a Jira issue from parsed meeting data"""
-        self.logger.info(f"Creating Jira issue: {issue_data['title']}")
-        
-        fields = {
+    def _issue_fields(self, issue_data: dict) -> dict:
+        """Map parsed meeting data onto Jira issue fields"""
+        return {
             "project": {"key": os.getenv('JIRA_PROJECT_KEY')},
             "summary": issue_data['title'],
             "description": issue_data['description'],
@@ -24,25 +43,118 @@ class JiraClient:
             "labels": issue_data['labels']
         }
 
-        return self.client.issue_create(fields=fields)
+    def create_issue(self, issue_data: dict) -> dict:
+        """Create a Jira issue from parsed meeting data"""
+        self.logger.info(f"Creating Jira issue: {issue_data['title']}")
+        
+        fields = self._issue_fields(issue_data)
+
+        with self.timings.span('jira.create', issues=1):
+            return self.retry.call(self.client.issue_create, fields=fields, idempotent=False)
 
-    def get_issues_by_jql(self, jql: str, max_results: int = 100) -> List[dict]:
-        """Execute JQL query and return paginated results"""
+    def create_issues(self, issues: List[dict], batch_size: int = BULK_CREATE_LIMIT) -> dict:
+        """Create issues via the bulk endpoint; created and error entries carry the input 'index'"""
+        batch_size = min(batch_size, BULK_CREATE_LIMIT)
+        created = []
+        errors = []
+        for start in range(0, len(issues), batch_size):
+            batch = issues[start:start + batch_size]
+            self.logger.info(f"Creating {len(batch)} Jira issues in bulk")
+            try:
+                with self.timings.span('jira.create', issues=len(batch)):
+                    response = self.retry.call(self.client.create_issues,
+                                               [{"fields": self._issue_fields(issue)} for issue in batch],
+                                               idempotent=False)
+            except HTTPError as e:
+                # Jira answers 400 with the same body when every item in the batch fails
+                try:
+                    response = e.response.json()
+                except Exception:
+                    response = None
+                if not isinstance(response, dict) or 'errors' not in response:
+                    errors.extend(
+                        {"index": start + offset, "title": issue['title'], "error": str(e)}
+                        for offset, issue in enumerate(batch)
+                    )
+                    continue
+
+            failed = {}
+            for item in response.get('errors', []):
+                offset = item.get('failedElementNumber', 0)
+                element_errors = item.get('elementErrors', {})
+                messages = list(element_errors.get('errors', {}).values()) + element_errors.get('errorMessages', [])
+                failed[offset] = "; ".join(messages) or f"HTTP {item.get('status')}"
+
+            # Successful items come back in request order, skipping the failed ones
+            succeeded = [offset for offset in range(len(batch)) if offset not in failed]
+            for offset, result in zip(succeeded, response.get('issues', [])):
+                created.append(dict(result, index=start + offset))
+            errors.extend(
+                {"index": start + offset, "title": batch[offset]['title'], "error": message}
+                for offset, message in sorted(failed.items())
+            )
+
+        return {"created": created, "errors": errors}
+
+    def iter_recently_created(self, minutes: int, fields: Optional[Sequence[str]] = ('summary',)) -> Iterator[dict]:
+        """Yield issues the current user created in the configured project within the last minutes"""
+        jql = (f'project = "{os.getenv("JIRA_PROJECT_KEY")}" AND reporter = currentUser() '
+               f'AND created >= "-{minutes}m"')
+        return self.iter_issues_by_jql(jql, fields=fields)
+
+    def _fetch_page(self, jql: str, fields: str, start: int, limit: int) -> dict:
+        """Fetch a single page of search results"""
+        with self.timings.span('jira.search_page', start=start, limit=limit):
+            return self.retry.call(self.client.jql, jql, fields=fields, start=start, limit=limit)
+
+    def iter_issues_by_jql(self, jql: str, fields: Optional[Sequence[str]] = REPORT_FIELDS,
+                           max_results: Optional[int] = None, page_size: int = 50,
+                           max_workers: int = 4) -> Iterator[dict]:
+        """Yield issues matching the JQL, fetching later pages concurrently once the total is known"""
         self.logger.info(f"Executing JQL query: {jql}")
-        
-        issues = []
-        start_at = 0
-        
-        while True:
-            results = self.client.jql(
-                jql, 
-                start=start_at, 
-                limit=min(50, max_results - start_at))
-            
-            issues.extend(results['issues'])
-            start_at += len(results['issues'])
-            
-            if start_at >= results['total'] or start_at >= max_results:
-                break
-                
+        field_list = ",".join(fields) if fields else "*all"
+        limit = page_size if max_results is None else min(page_size, max_results)
+
+        first = self._fetch_page(jql, field_list, 0, limit)
+        total = first['total'] if max_results is None else min(first['total'], max_results)
+        issues = first['issues'][:total]
+        yield from issues
+
+        # The server may cap the page size below what we asked for
+        step = len(issues)
+        if not step or step >= total:
+            return
+
+        starts = iter(range(step, total, step))
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Keep at most max_workers pages in flight so memory stays bounded by the window
+            for start in starts:
+                pending.append((start, executor.submit(self._fetch_page, jql, field_list, start, min(step, total - start))))
+                if len(pending) >= max_workers:
+                    break
+            while pending:
+                start, future = pending.popleft()
+                expected = min(step, total - start)
+                page = future.result()['issues'][:expected]
+                yield from page
+                # Fill any gap left by a short page before moving on
+                fetched = len(page)
+                while fetched < expected:
+                    gap = self._fetch_page(jql, field_list, start + fetched, expected - fetched)['issues']
+                    if not gap:
+                        break
+                    yield from gap[:expected - fetched]
+                    fetched += len(gap)
+                next_start = next(starts, None)
+                if next_start is not None:
+                    pending.append((next_start, executor.submit(
+                        self._fetch_page, jql, field_list, next_start, min(step, total - next_start))))
+
+    def get_issues_by_jql(self, jql: str, max_results: Optional[int] = None,
+                          fields: Optional[Sequence[str]] = REPORT_FIELDS) -> List[dict]:
+        """Execute JQL query and return all (or the first max_results) matching issues"""
+        with self.timings.span('jira.search') as span:
+            issues = list(self.iter_issues_by_jql(jql, fields=fields, max_results=max_results))
+            span['issues'] = len(issues)
         return issues
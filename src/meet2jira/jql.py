@@ -0,0 +1,217 @@
+import re
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+ORDER_BY = re.compile(r"\s+order\s+by\s+.*$", flags=re.IGNORECASE | re.DOTALL)
+
+TOKEN = re.compile(r"""\s*(?:
+    (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<op>!=|!~|>=|<=|[=~<>(),])
+  | (?P<word>[^\s"'=!~<>(),]+)
+)""", re.VERBOSE)
+
+# JQL field name -> Jira field id holding its value ('key' is read from the issue itself)
+FIELDS = {
+    'project': 'project',
+    'status': 'status',
+    'statuscategory': 'status',
+    'assignee': 'assignee',
+    'reporter': 'reporter',
+    'priority': 'priority',
+    'resolution': 'resolution',
+    'issuetype': 'issuetype',
+    'type': 'issuetype',
+    'labels': 'labels',
+    'component': 'components',
+    'fixversion': 'fixVersions',
+    'key': None,
+    'issuekey': None
+}
+
+# Attributes of Jira objects a JQL value may name (user display name or account id, project key, name or id, ...)
+IDENTIFIERS = ('id', 'key', 'name', 'displayName', 'accountId', 'emailAddress', 'value')
+
+# Unquoted values that stand for an empty field rather than a name; 'unresolved' only on resolution
+EMPTY_VALUES = ('empty', 'null')
+
+class JQLNotSupported(ValueError):
+    """The query uses JQL the local evaluator does not implement (functions, dates, text search, ...)"""
+
+def split_order_by(jql: str) -> Tuple[str, str]:
+    """Split a JQL query into its filter and any trailing ORDER BY clause"""
+    match = ORDER_BY.search(jql)
+    if not match:
+        return jql, ""
+    return jql[:match.start()], match.group(0)
+
+def union_jql(queries: Iterable[str]) -> str:
+    """One query matching every issue any of the given queries matches"""
+    filters = list(dict.fromkeys(split_order_by(jql)[0].strip() for jql in queries))
+    if len(filters) == 1:
+        return filters[0]
+    return " OR ".join(f"({jql})" for jql in filters)
+
+def _identifiers(value) -> List[str]:
+    """Lower-cased names a raw Jira field value can be matched by; empty when the field is empty"""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [name for item in value for name in _identifiers(item)]
+    if isinstance(value, dict):
+        return [str(value[attr]).lower() for attr in IDENTIFIERS if value.get(attr) is not None]
+    return [str(value).lower()]
+
+def _field_values(field: str) -> Callable[[dict], List[str]]:
+    if field in ('key', 'issuekey'):
+        # An issue can be named by its key or its numeric id
+        return lambda issue: [issue['key'].lower()] + ([str(issue['id'])] if issue.get('id') is not None else [])
+    field_id = FIELDS[field]
+    if field == 'statuscategory':
+        return lambda issue: _identifiers((issue['fields'].get('status') or {}).get('statusCategory'))
+    return lambda issue: _identifiers(issue['fields'].get(field_id))
+
+class CompiledJQL:
+    """A JQL filter evaluated against raw Jira issues (as returned by search) without a server round trip
+
+    Supports field = / != value, [not] in (...), is [not] EMPTY/NULL, AND, OR,
+    NOT and parentheses over the fields in FIELDS. Values match an object's
+    id, key or name; EMPTY, NULL and (on resolution) Unresolved stand for an
+    empty field. Like Jira, != and not in never match issues where the field
+    is empty. Anything else raises JQLNotSupported, so callers can fall back
+    to asking Jira.
+    """
+
+    def __init__(self, jql: str):
+        self.jql = jql
+        self.fields: Set[str] = set()
+        self._tokens = self._tokenize(split_order_by(jql)[0])
+        self._pos = 0
+        if not self._tokens:
+            raise JQLNotSupported("Empty query")
+        self._matches = self._or()
+        if self._pos != len(self._tokens):
+            raise JQLNotSupported(f"Unexpected {self._tokens[self._pos][1]!r}")
+
+    def matches(self, issue: dict) -> bool:
+        return self._matches(issue)
+
+    @staticmethod
+    def _tokenize(jql: str) -> List[Tuple[str, str]]:
+        tokens = []
+        pos = 0
+        jql = jql.rstrip()
+        while pos < len(jql):
+            match = TOKEN.match(jql, pos)
+            if not match or match.end() == pos:
+                raise JQLNotSupported(f"Cannot read query at {jql[pos:]!r}")
+            kind = match.lastgroup
+            text = match.group(kind)
+            if kind == 'string':
+                text = re.sub(r"\\(.)", r"\1", text[1:-1])
+            tokens.append((kind, text))
+            pos = match.end()
+        return tokens
+
+    def _peek(self, *keywords: str) -> bool:
+        """Whether the next token is one of the given keywords (case-insensitive) or operators"""
+        if self._pos >= len(self._tokens):
+            return False
+        kind, text = self._tokens[self._pos]
+        return kind != 'string' and text.lower() in keywords
+
+    def _take(self, *keywords: str) -> str:
+        if self._pos >= len(self._tokens):
+            raise JQLNotSupported("Query ends unexpectedly")
+        kind, text = self._tokens[self._pos]
+        if keywords and not self._peek(*keywords):
+            raise JQLNotSupported(f"Expected {' or '.join(keywords)}, got {text!r}")
+        self._pos += 1
+        return text
+
+    def _or(self):
+        terms = [self._and()]
+        while self._peek('or'):
+            self._take()
+            terms.append(self._and())
+        return terms[0] if len(terms) == 1 else lambda issue: any(term(issue) for term in terms)
+
+    def _and(self):
+        terms = [self._not()]
+        while self._peek('and'):
+            self._take()
+            terms.append(self._not())
+        return terms[0] if len(terms) == 1 else lambda issue: all(term(issue) for term in terms)
+
+    def _not(self):
+        if self._peek('not'):
+            self._take()
+            term = self._not()
+            return lambda issue: not term(issue)
+        if self._peek('('):
+            self._take()
+            term = self._or()
+            self._take(')')
+            return term
+        return self._clause()
+
+    def _value(self, field: str) -> Optional[str]:
+        """The next value lower-cased, or None when it stands for an empty field"""
+        kind, text = self._tokens[self._pos] if self._pos < len(self._tokens) else (None, None)
+        if kind not in ('string', 'word'):
+            raise JQLNotSupported(f"Expected a value, got {text!r}")
+        self._pos += 1
+        if self._peek('('):
+            raise JQLNotSupported(f"JQL functions such as {text}() are not evaluated locally")
+        value = text.lower()
+        if field == 'resolution' and value == 'unresolved':
+            if kind == 'string':
+                # Quoted, it could name a real resolution as well as mean "no resolution"
+                raise JQLNotSupported(f"{text!r} on resolution is not evaluated locally")
+            return None
+        if kind == 'word' and value in EMPTY_VALUES:
+            return None
+        return value
+
+    def _clause(self):
+        field = self._take().lower()
+        if field not in FIELDS:
+            raise JQLNotSupported(f"Field {field!r} is not evaluated locally")
+        if FIELDS[field]:
+            self.fields.add(FIELDS[field])
+        values = _field_values(field)
+
+        if self._peek('is'):
+            self._take()
+            negate = self._peek('not')
+            if negate:
+                self._take()
+            self._take('empty', 'null')
+            return (lambda issue: bool(values(issue))) if negate else (lambda issue: not values(issue))
+
+        negate = self._peek('not')
+        if negate:
+            self._take()
+            self._take('in')
+        if negate or self._peek('in'):
+            if not negate:
+                self._take()
+            self._take('(')
+            wanted = {self._value(field)}
+            while self._peek(','):
+                self._take()
+                wanted.add(self._value(field))
+            self._take(')')
+        else:
+            operator = self._take('=', '!=')
+            negate = operator == '!='
+            wanted = {self._value(field)}
+
+        # None in wanted means the value list includes EMPTY, which a negation already excludes
+        empty = None in wanted
+        wanted.discard(None)
+        if negate:
+            return lambda issue: bool(actual := values(issue)) and wanted.isdisjoint(actual)
+        return lambda issue: (not (actual := values(issue)) and empty) or not wanted.isdisjoint(actual)
+
+def compile_jql(jql: str) -> CompiledJQL:
+    """Compile a JQL filter for local evaluation, raising JQLNotSupported when it cannot be"""
+    return CompiledJQL(jql)
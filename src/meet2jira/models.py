@@ -1,6 +1,5 @@
-from .orchestrator import Meet2JiraOrchestrator
-
 def list_models():
+    from .orchestrator import Meet2JiraOrchestrator
     try:
         orchestrator = Meet2JiraOrchestrator()
         orchestrator.start_ollama()
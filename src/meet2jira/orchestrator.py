@@ -1,31 +1,109 @@
+import asyncio
 import logging
 import subprocess
 import atexit
 import os
+import sys
+import json
 import time
 import requests
+import math
+import threading
+import itertools
 import uuid
-from typing import List, Dict, Optional
-from .parser import MeetingParser
-from .jira_client import JiraClient
+import ollama
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Iterable, Iterator, TextIO, Tuple
+from .parser import MeetingParser, AsyncMeetingParser
+from .preprocess import TranscriptPreprocessor
+from .jira_client import JiraClient, project_issue, REPORT_FIELDS
+from .records import IssueRecord
+from .jql import JQLNotSupported, compile_jql, split_order_by, union_jql
 from .report_storage import ReportStorage
+from .cache import ResponseCache
+from .dedupe import DuplicateIndex
+from .run_journal import RunJournal, PARSING, COMPLETED
+from .aggregation import ReportAggregator
+from .timings import RunRecorder
+
+def ollama_base_url() -> str:
+    """Ollama server URL, honouring OLLAMA_HOST the same way the ollama client does"""
+    host = os.getenv('OLLAMA_HOST') or 'localhost:11434'
+    if '://' not in host:
+        host = f'http://{host}'
+    if host.count(':') < 2:
+        host = f'{host}:11434'
+    return host.rstrip('/')
 
 class Meet2JiraOrchestrator:
-    def __init__(self):
+    def __init__(self, chunk_size: int = 0, max_workers: Optional[int] = None, use_cache: bool = True,
+                 use_async: bool = False, stream: bool = False, keep_alive=None, resident: bool = False,
+                 startup_timeout: float = 30, timings: Optional[RunRecorder] = None, max_ctx: int = 24576,
+                 prompt_dir: Optional[str] = None, preprocessor: Optional[TranscriptPreprocessor] = None,
+                 detect_duplicates: bool = True, skip_duplicates: bool = False, use_journal: bool = True):
         self.logger = logging.getLogger(__name__)
-        self.jira_client = JiraClient()
-        self.report_storage = ReportStorage()
+        self.use_async = use_async
+        self.stream = stream
+        self.incremental_margin_minutes = 5
+        # Keys completed from the stored snapshot per query during an incremental refresh
+        self.snapshot_batch_size = 500
+        # Resident mode leaves the server running and the model loaded between invocations
+        self.resident = resident
+        self.keep_alive = -1 if keep_alive is None and resident else keep_alive
+        self.startup_timeout = startup_timeout
+        # Per-stage spans and Ollama token counts for --timings; disabled unless a recorder is passed
+        self.timings = timings or RunRecorder(enabled=False)
+        self._jira_client = None
+        self.report_storage = ReportStorage(timings=self.timings)
+        self.cache = ResponseCache() if use_cache else None
+        # Proposals resembling an indexed issue are flagged with 'duplicate_of'; skipped on auto-approval if asked
+        self.duplicate_index = DuplicateIndex(timings=self.timings) if detect_duplicates else None
+        self.skip_duplicates = skip_duplicates
+        # Non-dry runs are journaled so an interrupted run can be resumed with resume_run
+        self.journal = RunJournal() if use_journal else None
+        self.last_run_id = None
         self.parser = None
+        self.parser_options = {'chunk_size': chunk_size, 'max_workers': max_workers, 'cache': self.cache,
+                               'keep_alive': self.keep_alive, 'timings': self.timings, 'max_ctx': max_ctx,
+                               'prompt_dir': prompt_dir, 'preprocessor': preprocessor}
         self.ollama_process = None
+        self._warm_models = set()
         atexit.register(self.cleanup_ollama)
         
+    @property
+    def jira_client(self) -> JiraClient:
+        """Jira session, created on first use so dry runs need neither atlassian nor Jira credentials"""
+        if self._jira_client is None:
+            self._jira_client = JiraClient(timings=self.timings)
+        return self._jira_client
+
+    @jira_client.setter
+    def jira_client(self, client: JiraClient):
+        self._jira_client = client
+
     def check_ollama_status(self):
         """Check if Ollama service is running"""
         try:
-            response = requests.get('http://localhost:11434', timeout=2)
+            response = requests.get(ollama_base_url(), timeout=2)
             return response.ok
         except (requests.ConnectionError, requests.Timeout):
             return False
+
+    def _wait_for_ollama(self) -> bool:
+        """Poll the server with exponential backoff until it answers or startup_timeout passes"""
+        deadline = time.monotonic() + self.startup_timeout
+        delay = 0.05
+        while True:
+            if self.check_ollama_status():
+                return True
+            # Give up at once if the server process already exited (port in use, binary missing a lib, ...)
+            if self.ollama_process is not None and self.ollama_process.poll() is not None:
+                return False
+            if time.monotonic() + delay > deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
             
     def start_ollama(self):
         """Start Ollama service in background if not running"""
@@ -37,14 +115,45 @@ class Meet2JiraOrchestrator:
                 stderr=subprocess.DEVNULL,
                 start_new_session=True
             )
-            # Wait for service to become available
-            time.sleep(2)
-            if not self.check_ollama_status():
+            started = time.monotonic()
+            with self.timings.span('ollama.start'):
+                ready = self._wait_for_ollama()
+            if not ready:
                 raise RuntimeError("Failed to start Ollama service")
+            self.logger.info(f"Ollama service ready after {time.monotonic() - started:.2f}s")
+
+    def warm_up(self, model: str, transcript: Optional[str] = None):
+        """Load the model with the num_ctx the first real request will use, so that request skips the cold load"""
+        try:
+            options = self._get_parser(model).warm_up_options(model, transcript)
+            loaded = {entry.get('model') or entry.get('name'): entry.get('context_length')
+                      for entry in ollama.ps().get('models', [])}
+            context_length = loaded.get(model, loaded.get(f"{model}:latest", -1))
+            # A model already loaded at that size only needs a request when its keep_alive should be extended
+            if self.keep_alive is None and context_length in (None, options['num_ctx']):
+                return
+            kwargs = {} if self.keep_alive is None else {'keep_alive': self.keep_alive}
+            started = time.monotonic()
+            ollama.generate(model=model, prompt='', options=options, **kwargs)
+            self.logger.info(f"Model {model} ready (num_ctx {options['num_ctx']}) after "
+                             f"{time.monotonic() - started:.2f}s")
+        except Exception as e:
+            # The real request will surface any problem with the model
+            self.logger.debug(f"Model warm-up failed: {str(e)}")
+
+    def _prepare(self, model: str, transcript: Optional[str] = None):
+        """Make sure the server is up, build the parser and start loading the model in the background"""
+        self.start_ollama()
+        self._get_parser(model)
+        if model not in self._warm_models:
+            self._warm_models.add(model)
+            threading.Thread(target=self.warm_up, args=(model, transcript), daemon=True).start()
                 
     def cleanup_ollama(self):
         """Clean up Ollama process on exit"""
-        if self.ollama_process:
+        if self.ollama_process and self.resident:
+            self.logger.info("Leaving Ollama service running (resident mode)")
+        elif self.ollama_process:
             self.logger.info("Stopping Ollama service...")
             self.ollama_process.terminate()
             try:
@@ -52,85 +161,555 @@ class Meet2JiraOrchestrator:
             except subprocess.TimeoutExpired:
                 self.ollama_process.kill()
 
-    def generate_status_report(self, jql: str, model: str = 'llama2') -> dict:
-        """Generate a status report from Jira issues matching the JQL"""
-        self.start_ollama()
-        self.parser = MeetingParser(model=model)
+    def _get_parser(self, model: str) -> MeetingParser:
+        """Return the parser for the given model, creating it on first use"""
+        if self.parser is None or self.parser.model != model:
+            parser_class = AsyncMeetingParser if self.use_async else MeetingParser
+            self.parser = parser_class(model=model, **self.parser_options)
+        return self.parser
+
+    def _parse(self, transcript: str, model: str) -> dict:
+        """Parse a transcript with the sync or async parser"""
+        if self.use_async:
+            return asyncio.run(self.parser.parse_async(transcript, model=model))
+        return self.parser.parse(transcript, model=model)
+
+    @staticmethod
+    def _restrict_jql(jql: str, clause: str) -> str:
+        """AND an extra clause onto a JQL query, keeping any ORDER BY at the end"""
+        base, order_by = split_order_by(jql)
+        return f"({base}) AND {clause}{order_by}"
+
+    def _iter_issues_by_key(self, keys: List[str], fields: Iterable[str] = REPORT_FIELDS) -> Iterator[dict]:
+        """Fetch specific issues with "key in (...)" queries of at most 100 keys"""
+        for start in range(0, len(keys), 100):
+            yield from self.jira_client.iter_issues_by_jql(f"key in ({', '.join(keys[start:start + 100])})",
+                                                           fields=tuple(fields))
+
+    def _refresh_snapshot(self, jql: str, previous_report: dict) -> Iterator[IssueRecord]:
+        """Yield the stored snapshot brought up to date by fetching only issues updated since it was taken
+
+        Current keys are read page by page; each batch is completed from the
+        updated issues, the stored snapshot and, for keys neither has, a
+        fetch by key.
+        """
+        taken_at = previous_report['created_at']
+        if isinstance(taken_at, str):
+            taken_at = datetime.fromisoformat(taken_at)
+        # Relative JQL dates avoid server/client timezone mismatches; pad for clock skew
+        minutes = math.ceil((datetime.utcnow() - taken_at).total_seconds() / 60) + self.incremental_margin_minutes
+        changed = {
+            issue['key']: project_issue(issue)
+            for issue in self.jira_client.iter_issues_by_jql(self._restrict_jql(jql, f'updated >= "-{minutes}m"'))
+        }
+
+        # A key-only query detects issues that left the filter without showing up as updated
+        current_keys = (issue['key'] for issue in self.jira_client.iter_issues_by_jql(jql, fields=('key',)))
+        added = 0
+        while True:
+            keys = list(itertools.islice(current_keys, self.snapshot_batch_size))
+            if not keys:
+                break
+            stored = self.report_storage.get_report_records(
+                previous_report['report_id'], [key for key in keys if key not in changed])
+            # Issues that joined the filter without an update (e.g. a sprint change) are fetched by key
+            unknown = [key for key in keys if key not in changed and key not in stored]
+            fetched = {issue['key']: project_issue(issue) for issue in self._iter_issues_by_key(unknown)}
+            added += len(unknown)
+            for key in keys:
+                record = changed.get(key) or stored.get(key) or fetched.get(key)
+                if record is not None:
+                    yield record
+
+        self.logger.info(f"Incremental refresh: {len(changed)} updated, {added} added")
+
+    def generate_status_report(self, jql: str, model: str = 'llama2', max_issues: Optional[int] = None,
+                               incremental: bool = False) -> dict:
+        """Generate a status report from Jira issues matching the JQL
+
+        Issues stream from Jira into the report storage and the aggregator a
+        page at a time, so memory stays bounded by the page size rather than
+        the number of matching issues.
+        """
+        self._prepare(model)
         
-        # Get current issues from Jira
-        issues = self.jira_client.get_issues_by_jql(jql)
-        if not issues:
-            return {"error": "No issues found matching the JQL query"}
-            
         # Get previous report for comparison
-        previous_report = self.report_storage.get_previous_report(jql)
-        
-        # Generate report ID and save current state
-        report_id = str(uuid.uuid4())
-        self.report_storage.save_report(report_id, jql, issues)
-        
-        # Prepare context for LLM
-        report_context = {
-            'current_issues': [
-                {
-                    'key': issue['key'],
-                    'status': issue['fields']['status']['name'],
-                    'assignee': issue['fields']['assignee']['displayName'] if issue['fields']['assignee'] else 'Unassigned',
-                    'summary': issue['fields']['summary'],
-                    'priority': issue['fields']['priority']['name'],
-                    'created': issue['fields']['created'],
-                    'updated': issue['fields']['updated']
-                }
-                for issue in issues
-            ],
-            'previous_report': previous_report['issues'] if previous_report else None
-        }
+        previous_report = self.report_storage.get_previous_report(jql, include_issues=False)
+
+        # Get current issues from Jira, reusing the previous snapshot when refreshing incrementally
+        if incremental and previous_report:
+            records = self._refresh_snapshot(jql, previous_report)
+        else:
+            records = (project_issue(issue)
+                       for issue in self.jira_client.iter_issues_by_jql(jql, max_results=max_issues))
+        first = next(records, None)
+        if first is None:
+            return {"error": "No issues found matching the JQL query"}
+
+        report_id, report_context = self._build_report(jql, itertools.chain([first], records), previous_report)
         
         # Generate summary using LLM
-        summary = self.parser.generate_report_summary(report_context, model=model)
+        if self.use_async:
+            summary = asyncio.run(self.parser.generate_report_summary_async(report_context, model=model))
+        else:
+            summary = self.parser.generate_report_summary(report_context, model=model)
         
         return {
             'report_id': report_id,
             'jql': jql,
-            'issue_count': len(issues),
+            'issue_count': report_context['issue_count'],
             'summary': summary,
             'previous_report': previous_report
         }
 
-    def process_transcript(self, transcript: str, model: str = 'llama2', dry_run: bool = False) -> tuple[List[Dict], str]:
+    def _build_report(self, jql: str, issues: Iterable[IssueRecord],
+                      previous_report: Optional[dict]) -> Tuple[str, dict]:
+        """Save the snapshot and compute the bounded context the LLM summarises, in one pass over issues"""
+        report_id = str(uuid.uuid4())
+
+        # Compute exact counts and changes locally; the LLM only sees the bounded summary
+        aggregator = ReportAggregator()
+        def aggregated():
+            for issue in issues:
+                aggregator.add(issue)
+                yield issue
+
+        with self.timings.span('report.aggregate') as span:
+            self.report_storage.save_report(report_id, jql, aggregated())
+            span['issues'] = aggregator.issue_count
+        changes = None
+        if previous_report:
+            changes = self.report_storage.diff_reports(previous_report['report_id'], report_id,
+                                                       limit=aggregator.max_items)
+        return report_id, aggregator.build(previous_report, changes)
+
+    def _fetch_report_set(self, reports: List[Dict], superset: Optional[str]) -> Dict[str, List[IssueRecord]]:
+        """Fetch the issues of every report with one search and split them by report name
+
+        Membership is decided locally for JQL the evaluator understands, as
+        each raw issue arrives, so only its projected record is kept; the
+        rest cost a key-only query each, plus a fetch of any keys the shared
+        search did not return.
+        """
+        compiled = {}
+        fields = set(REPORT_FIELDS)
+        for report in reports:
+            try:
+                compiled[report['name']] = compile_jql(report['jql'])
+                fields |= compiled[report['name']].fields
+            except JQLNotSupported as e:
+                self.logger.info(f"Matching report '{report['name']}' by key: {str(e)}")
+                compiled[report['name']] = None
+
+        query = superset or union_jql(report['jql'] for report in reports)
+        predicates = [(name, predicate) for name, predicate in compiled.items() if predicate is not None]
+        members = {report['name']: [] for report in reports}
+        records = {}
+        with self.timings.span('report_set.fetch') as span:
+            for issue in self.jira_client.iter_issues_by_jql(query, fields=tuple(sorted(fields))):
+                if issue['key'] in records:
+                    continue
+                records[issue['key']] = project_issue(issue)
+                for name, predicate in predicates:
+                    if predicate.matches(issue):
+                        members[name].append(issue['key'])
+            span['issues'] = len(records)
+
+        for report in reports:
+            if compiled[report['name']] is None:
+                members[report['name']] = [issue['key'] for issue in
+                                           self.jira_client.iter_issues_by_jql(report['jql'], fields=('key',))]
+
+        missing = list(dict.fromkeys(key for keys in members.values() for key in keys if key not in records))
+        for issue in self._iter_issues_by_key(missing):
+            records[issue['key']] = project_issue(issue)
+
+        return {name: [records[key] for key in keys if key in records] for name, keys in members.items()}
+
+    async def _summarize_all_async(self, contexts: List[dict], model: str, max_workers: int) -> list:
+        slots = asyncio.Semaphore(max_workers)
+
+        async def summarize(context):
+            async with slots:
+                return await self.parser.generate_report_summary_async(context, model=model)
+
+        return await asyncio.gather(*(summarize(context) for context in contexts), return_exceptions=True)
+
+    def _summarize_all(self, contexts: List[dict], model: str, max_workers: int) -> list:
+        """Summarise report contexts concurrently, returning a summary or the exception for each"""
+        if self.use_async:
+            return asyncio.run(self._summarize_all_async(contexts, model, max_workers))
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.parser.generate_report_summary, context, model=model)
+                       for context in contexts]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+        return results
+
+    def generate_report_set(self, reports: List[Dict], model: str = 'llama2', superset: Optional[str] = None,
+                            max_workers: int = 4) -> List[dict]:
+        """Generate several named reports ({'name', 'jql'}) from one Jira search, summarising them concurrently
+
+        Results come back in input order with the same keys as
+        generate_status_report plus 'name'; a report that fails or matches
+        nothing carries an 'error' instead.
+        """
+        self._prepare(model)
+        issues_by_report = self._fetch_report_set(reports, superset)
+
+        results = []
+        contexts = []
+        for report in reports:
+            jql = report['jql']
+            issues = issues_by_report[report['name']]
+            result = {'name': report['name'], 'jql': jql}
+            results.append(result)
+            if not issues:
+                result['error'] = "No issues found matching the JQL query"
+                continue
+            previous_report = self.report_storage.get_previous_report(jql, include_issues=False)
+            report_id, context = self._build_report(jql, issues, previous_report)
+            result.update(report_id=report_id, issue_count=len(issues), previous_report=previous_report)
+            contexts.append((result, context))
+
+        with self.timings.span('report_set.summarize', reports=len(contexts)):
+            summaries = self._summarize_all([context for _, context in contexts], model, max_workers)
+        for (result, _), summary in zip(contexts, summaries):
+            if isinstance(summary, Exception):
+                self.logger.error(f"Failed to summarise report '{result['name']}': {str(summary)}")
+                result['error'] = str(summary)
+            else:
+                result['summary'] = summary
+        return results
+
+    def flag_duplicate(self, issue: Dict) -> Dict:
+        """Attach the closest indexed issue as 'duplicate_of' when the proposal looks like a repeat"""
+        if self.duplicate_index is not None:
+            match = self.duplicate_index.find(issue.get('title', ''), issue.get('description', ''))
+            if match:
+                issue['duplicate_of'] = match
+        return issue
+
+    def _index_created(self, issues: List[Dict], created: List[Dict]):
+        """Add newly created issues to the duplicate index so later meetings see them"""
+        if self.duplicate_index is not None and created:
+            self.duplicate_index.add_many(
+                (item['key'], issues[item['index']]['title'], issues[item['index']]['description'])
+                for item in created
+            )
+
+    def _auto_approvable(self, issue: Dict) -> bool:
+        if self.skip_duplicates and issue.get('duplicate_of'):
+            self.logger.info(f"Skipped likely duplicate of {issue['duplicate_of']['key']}: {issue['title']}")
+            return False
+        return True
+
+    def sync_duplicate_index(self, jql: str) -> int:
+        """Index existing Jira issues matching the JQL; repeat syncs fetch only issues updated since the last"""
+        started = datetime.utcnow()
+        query = jql
+        last_synced = self.duplicate_index.last_synced(jql)
+        if last_synced is not None:
+            minutes = math.ceil((started - last_synced).total_seconds() / 60) + self.incremental_margin_minutes
+            query = self._restrict_jql(jql, f'updated >= "-{minutes}m"')
+        with self.timings.span('dedupe.sync'):
+            indexed = self.duplicate_index.add_many(
+                (issue['key'], issue['fields'].get('summary'), issue['fields'].get('description'))
+                for issue in self.jira_client.iter_issues_by_jql(query, fields=('summary', 'description'))
+            )
+        self.duplicate_index.mark_synced(jql, started)
+        self.logger.info(f"Indexed {indexed} issues for duplicate detection")
+        return indexed
+
+    def iter_issues(self, transcript: str, model: str = 'llama2') -> Iterator[Dict]:
+        """Yield parsed issues, streaming them from the model as they complete when enabled"""
+        self._prepare(model, transcript)
+        if self.stream:
+            issues = self.parser.parse_stream(transcript, model=model)
+        else:
+            issues = self._parse(transcript, model)['issues']
+        for issue in issues:
+            yield self.flag_duplicate(issue)
+
+    def parse_selection(self, approve: Optional[str]) -> Optional[set]:
+        """Turn an --approve value like "1,3-5" into a set of 1-based proposal numbers"""
+        if approve is None or approve == 'all':
+            return None
+        selected = set()
+        try:
+            for part in approve.split(','):
+                part = part.strip()
+                if '-' in part:
+                    first, last = part.split('-', 1)
+                    selected.update(range(int(first), int(last) + 1))
+                elif part:
+                    selected.add(int(part))
+        except ValueError:
+            raise ValueError(f"Invalid approve value {approve!r}; expected 'all' or numbers such as \"1,3-5\"") from None
+        return selected
+
+    def process_transcript(self, transcript: str, model: str = 'llama2', dry_run: bool = False,
+                           approve: Optional[str] = None) -> tuple[List[Dict], str]:
         """Process meeting transcript and create Jira issues"""
-        self.start_ollama()
-        self.parser = MeetingParser(model=model)
         self.logger.info("Processing meeting transcript")
-        
-        # Parse transcript into actionable items
-        parsed_issues = self.parser.parse(transcript, model=model)
-        
-        # Create Jira issues for each actionable item
-        created_issues = []
-        for issue in parsed_issues['issues']:
-            if dry_run:
-                created_issues.append(issue)
-            else:
-                # Show issue details and prompt for approval
-                print(f"\nProposed Jira Issue:")
-                print(f"Title: {issue['title']}")
-                print(f"Type: {issue['type']}")
-                print(f"Priority: {issue['priority']}")
-                print(f"Labels: {', '.join(issue['labels'])}")
-                print(f"Description:\n{issue['description']}\n")
-                
-                response = input("Create this issue? (y/n): ").strip().lower()
-                if response == 'y':
-                    try:
-                        result = self.jira_client.create_issue(issue)
-                        created_issues.append(result)
-                        self.logger.info(f"Created issue: {result['key']}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to create issue: {str(e)}")
-                        continue
+        # Reject a bad selection before a run is journaled that could never be resumed with it
+        selection = self.parse_selection(approve)
+        run_id = None
+        if self.journal is not None and not dry_run:
+            run_id = self.journal.start_run(transcript, model)
+            self.logger.info(f"Started run {run_id}; continue it with --resume {run_id} if it is interrupted")
+        self.last_run_id = run_id
+        return self._process_run(run_id, transcript, model, dry_run, approve, selection)
+
+    def resume_run(self, run_id: str, approve: Optional[str] = None) -> tuple[List[Dict], str]:
+        """Continue an interrupted run from its last completed step without creating any issue twice
+
+        Parsed issues and earlier decisions are replayed from the journal;
+        only undecided proposals are prompted for (or selected by approve).
+        """
+        run = self.journal.get_run(run_id) if self.journal is not None else None
+        if run is None:
+            raise ValueError(f"Unknown run: {run_id}")
+        selection = self.parse_selection(approve)
+        self.last_run_id = run_id
+        if run['status'] == COMPLETED:
+            self.logger.info(f"Run {run_id} already completed")
+            return list(self.journal.created(run_id).values()), ""
+        self.logger.info(f"Resuming run {run_id} ({run['status']})")
+        return self._process_run(run_id, run['transcript'], run['model'], False, approve, selection)
+
+    def _run_issues(self, run_id: Optional[str], transcript: str, model: str) -> Iterator[Dict]:
+        """Yield a run's proposals, replaying them from the journal once parsing has finished"""
+        if run_id is None:
+            yield from self.iter_issues(transcript, model=model)
+            return
+        if self.journal.get_run(run_id)['status'] != PARSING:
+            yield from self.journal.issues(run_id)
+            return
+        # A parse that did not finish is started over; the response cache makes a repeat cheap
+        self.journal.restart_parsing(run_id)
+        if self.stream:
+            for position, issue in enumerate(self.iter_issues(transcript, model=model), start=1):
+                self.journal.add_issues(run_id, [issue], start=position)
+                yield issue
+            self.journal.mark_parsed(run_id)
+        else:
+            # Journal the whole response before any prompt can be interrupted
+            issues = list(self.iter_issues(transcript, model=model))
+            self.journal.add_issues(run_id, issues)
+            self.journal.mark_parsed(run_id)
+            yield from issues
+
+    def _process_run(self, run_id: Optional[str], transcript: str, model: str, dry_run: bool,
+                     approve: Optional[str], selection: Optional[set]) -> tuple[List[Dict], str]:
+        """Parse, approve and create a run's issues, journaling each step when run_id is set"""
+        # approve is None to prompt per issue, 'all', or proposal numbers such as "1,3-5" parsed into selection
+        approve_all = approve == 'all'
+        prompting = approve is None
+        decisions = self.journal.decisions(run_id) if run_id is not None else {}
+
+        # Collect approvals as issues are parsed, then create them in bulk
+        proposals = []
+        approved = []
+        try:
+            for number, issue in enumerate(self._run_issues(run_id, transcript, model), start=1):
+                proposals.append(issue)
+                if dry_run:
+                    continue
+                if number in decisions:
+                    if decisions[number]:
+                        approved.append((number, issue))
+                    continue
+                if approve_all or (selection is not None and number in selection):
+                    decision = self._auto_approvable(issue)
+                elif prompting:
+                    decision, approve_all, prompting = self._prompt_approval(number, issue)
                 else:
-                    self.logger.info(f"Skipped creating issue: {issue['title']}")
                     continue
-                
-        return created_issues, ""
+                if run_id is not None:
+                    self.journal.record_decision(run_id, number, decision)
+                if decision:
+                    approved.append((number, issue))
+
+            if dry_run:
+                return proposals, ""
+            created, errors = self._create_run_issues(run_id, approved)
+        except Exception as e:
+            if run_id is not None:
+                self.journal.finish_run(run_id, error=str(e))
+            raise
+        if run_id is not None:
+            self.journal.finish_run(run_id, error=f"{len(errors)} issues failed to create" if errors else None)
+        return created, ""
+
+    def _prompt_approval(self, number: int, issue: Dict) -> tuple[bool, bool, bool]:
+        """Show a proposal and ask whether to create it; returns (approved, approve_all, keep_prompting)"""
+        print(f"\nProposed Jira Issue #{number}:")
+        print(f"Title: {issue['title']}")
+        print(f"Type: {issue['type']}")
+        print(f"Priority: {issue['priority']}")
+        print(f"Labels: {', '.join(issue['labels'])}")
+        print(f"Description:\n{issue['description']}\n")
+        if issue.get('duplicate_of'):
+            duplicate = issue['duplicate_of']
+            print(f"Possible duplicate of {duplicate['key']} ({duplicate['similarity']:.0%} similar): "
+                  f"{duplicate['summary']}\n")
+
+        response = input("Create this issue? (y/n, a = yes to all remaining, q = skip all remaining): ").strip().lower()
+        if response in ('y', 'a'):
+            return True, response == 'a', True
+        self.logger.info(f"Skipped creating issue: {issue['title']}")
+        return False, False, response != 'q'
+
+    def _reconcile_in_flight(self, run_id: str, approved: List[tuple], known: Iterable[str]) -> Dict[int, Dict]:
+        """Find issues whose create request was interrupted before Jira's answer was journaled
+
+        Issues the current user created since the request was sent are
+        matched to the interrupted proposals by exact summary.
+        """
+        in_flight = self.journal.in_flight(run_id)
+        if not in_flight:
+            return {}
+        minutes = math.ceil((datetime.utcnow() - min(in_flight.values())).total_seconds() / 60)
+        candidates = {}
+        known = set(known)
+        for issue in self.jira_client.iter_recently_created(minutes + self.incremental_margin_minutes):
+            if issue['key'] not in known:
+                candidates.setdefault(issue['fields']['summary'], []).append(issue)
+        for matches in candidates.values():
+            matches.sort(key=lambda issue: int(issue.get('id') or 0))
+
+        titles = {number: issue['title'] for number, issue in approved}
+        found = {}
+        for number in sorted(in_flight):
+            matches = candidates.get(titles.get(number))
+            if matches:
+                issue = matches.pop(0)
+                self.journal.record_created(run_id, number, issue['key'], issue.get('self'))
+                found[number] = {'key': issue['key'], 'self': issue.get('self')}
+                self.logger.info(f"Proposal #{number} was already created as {issue['key']}")
+        return found
+
+    def _create_run_issues(self, run_id: Optional[str], approved: List[tuple]) -> tuple[List[Dict], List[Dict]]:
+        """Bulk create the approved (number, issue) pairs, skipping any the journal shows were created"""
+        done = {}
+        if run_id is not None:
+            done = self.journal.created(run_id)
+            done.update(self._reconcile_in_flight(run_id, approved, (entry['key'] for entry in done.values())))
+        pending = [(number, issue) for number, issue in approved if number not in done]
+        errors = []
+        if pending:
+            issues = [issue for _, issue in pending]
+            if run_id is not None:
+                self.journal.mark_creating(run_id, [number for number, _ in pending])
+            result = self.jira_client.create_issues(issues)
+            self._index_created(issues, result['created'])
+            for created in result['created']:
+                number = pending[created['index']][0]
+                done[number] = created
+                if run_id is not None:
+                    self.journal.record_created(run_id, number, created['key'], created.get('self'))
+                self.logger.info(f"Created issue: {created['key']}")
+            for error in result['errors']:
+                if run_id is not None:
+                    self.journal.record_error(run_id, pending[error['index']][0], error['error'])
+                self.logger.error(f"Failed to create issue '{error['title']}': {error['error']}")
+            errors = result['errors']
+        return [done[number] for number, _ in approved if number in done], errors
+
+    def _create_batch_issues(self, path: str, issues: List[Dict], record: dict):
+        """Create the issues parsed from one batch transcript, recording keys and failures"""
+        issues = [issue for issue in issues if self._auto_approvable(issue)]
+        result = self.jira_client.create_issues(issues)
+        self._index_created(issues, result['created'])
+        record['created'] = [{'key': created['key'], 'self': created.get('self')} for created in result['created']]
+        record['errors'] = [{'title': error['title'], 'error': error['error']} for error in result['errors']]
+        for error in result['errors']:
+            self.logger.error(f"Failed to create issue from {path}: {error['error']}")
+
+    def _process_batch_item(self, path: str, model: str, dry_run: bool) -> dict:
+        """Parse one transcript file of a batch and, unless dry-running, create its issues"""
+        started = time.monotonic()
+        record = {'transcript': path}
+        try:
+            with open(path, 'r') as f:
+                transcript = f.read()
+            issues = [self.flag_duplicate(issue) for issue in self.parser.parse(transcript, model=model)['issues']]
+            record.update(status='ok', issues=issues)
+            if not dry_run:
+                self._create_batch_issues(path, issues, record)
+        except Exception as e:
+            self.logger.error(f"Failed to process transcript {path}: {str(e)}")
+            record.update(status='error', error=str(e))
+        record['elapsed_seconds'] = round(time.monotonic() - started, 3)
+        return record
+
+    async def _process_batch_item_async(self, path: str, model: str, dry_run: bool,
+                                        slots: asyncio.Semaphore) -> dict:
+        """Async counterpart of _process_batch_item; Jira calls run in a worker thread"""
+        async with slots:
+            started = time.monotonic()
+            record = {'transcript': path}
+            try:
+                with open(path, 'r') as f:
+                    transcript = f.read()
+                issues = [self.flag_duplicate(issue)
+                          for issue in (await self.parser.parse_async(transcript, model=model))['issues']]
+                record.update(status='ok', issues=issues)
+                if not dry_run:
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(None, self._create_batch_issues, path, issues, record)
+            except Exception as e:
+                self.logger.error(f"Failed to process transcript {path}: {str(e)}")
+                record.update(status='error', error=str(e))
+            record['elapsed_seconds'] = round(time.monotonic() - started, 3)
+            return record
+
+    async def _run_batch_async(self, paths: Iterable[str], model: str, dry_run: bool,
+                               max_workers: int, write) -> None:
+        """Schedule every transcript on the event loop and write records as they finish"""
+        slots = asyncio.Semaphore(max_workers)
+        tasks = [
+            asyncio.ensure_future(self._process_batch_item_async(path, model, dry_run, slots))
+            for path in paths
+        ]
+        for task in asyncio.as_completed(tasks):
+            write(await task)
+
+    def process_batch(self, paths: Iterable[str], model: str = 'llama2', dry_run: bool = True,
+                      max_workers: int = 2, output: TextIO = None) -> dict:
+        """Process many transcripts through one warm parser, writing one JSON line per transcript"""
+        output = output or sys.stdout
+        self._prepare(model)
+        self.logger.info(f"Processing transcript batch with {max_workers} workers")
+
+        started = time.monotonic()
+        processed = failed = 0
+
+        def write(record: dict):
+            nonlocal processed, failed
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            processed += 1
+            if record['status'] != 'ok':
+                failed += 1
+
+        if self.use_async:
+            asyncio.run(self._run_batch_async(paths, model, dry_run, max_workers, write))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._process_batch_item, path, model, dry_run) for path in paths]
+                for future in as_completed(futures):
+                    write(future.result())
+
+        elapsed = time.monotonic() - started
+        return {
+            'processed': processed,
+            'failed': failed,
+            'elapsed_seconds': round(elapsed, 3),
+            'transcripts_per_minute': round(processed * 60 / elapsed, 2) if elapsed else 0.0
+        }
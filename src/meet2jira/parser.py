@@ -1,80 +1,561 @@
+import asyncio
 import logging
 import ollama
 import json
-from typing import Dict, Any
+import math
+import os
+import re
+import time
+from importlib import resources
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+from .cache import ResponseCache
+from .config import load_settings, setting
+from .preprocess import TranscriptPreprocessor
+from .streaming import IssueStreamDecoder
+from .timings import RunRecorder
+from .tokens import TokenEstimator, EXTRACT_OUTPUT_TOKENS, REPORT_OUTPUT_TOKENS
+
+# Lines that open a new speaker turn ("Alex Carter:") or a timestamped cue ("00:12:31")
+SEGMENT_BOUNDARY = re.compile(r"^\s*(\[?\d{1,2}:\d{2}(:\d{2})?|[A-Z][\w .'-]{0,40}:)")
+
+# Report data at the aggregator's default limits, changes since the previous report included
+FULL_REPORT_DATA_CHARS = 21000
+
+def _is_json(text: str) -> bool:
+    """Check whether text decodes as JSON, so malformed responses are never cached"""
+    try:
+        json.loads(text)
+        return True
+    except json.JSONDecodeError:
+        return False
+
+def _split_oversized(segment: str, limit: int) -> List[str]:
+    """Break a segment longer than limit on blank lines, then on lines, then at the last space within limit"""
+    if len(segment) <= limit:
+        return [segment]
+    for separator in ("\n\n", "\n"):
+        parts = [part for part in segment.split(separator) if part.strip()]
+        if len(parts) > 1:
+            return [piece for part in parts for piece in _split_oversized(part, limit)]
+    pieces = []
+    while len(segment) > limit:
+        cut = segment.rfind(" ", 0, limit + 1)
+        cut = cut if cut > 0 else limit
+        pieces.append(segment[:cut])
+        segment = segment[cut:].lstrip()
+    if segment:
+        pieces.append(segment)
+    return pieces
 
 class MeetingParser:
-    def __init__(self, model: str = 'llama2'):
+    def __init__(self, model: str = 'llama2', chunk_size: int = 0, chunk_overlap: int = 2,
+                 max_workers: int = None, cache: Optional[ResponseCache] = None, keep_alive=None,
+                 timings: Optional[RunRecorder] = None, max_ctx: int = 24576,
+                 estimator: Optional[TokenEstimator] = None, prompt_dir: Optional[str] = None,
+                 preprocessor: Optional[TranscriptPreprocessor] = None):
         self.logger = logging.getLogger(__name__)
         self.model = model
-        
-    def _get_llm_prompt(self, transcript: str) -> str:
-        """Generate the LLM prompt using the system prompt template"""
-        with open("prompts/system_prompt.txt") as f:
-            system_prompt = f.read()
-        return f"{system_prompt}\n\nMeeting Transcript:\n{transcript}"
-
-    def _get_report_prompt(self, context: Dict[str, Any]) -> str:
-        """Generate the LLM prompt for report generation"""
-        with open("prompts/report_prompt.txt") as f:
-            report_prompt = f.read()
-        
-        return report_prompt.format(
-            current_issues=json.dumps(context['current_issues'], indent=2),
-            previous_report=json.dumps(context['previous_report'], indent=2) if context['previous_report'] else "No previous report available"
-        )
+        self.cache = cache
+        self.timings = timings or RunRecorder(enabled=False)
+        # How long Ollama keeps the model loaded after each request (e.g. "30m", or -1 for forever)
+        self.keep_alive = keep_alive
+        self._model_digests = {}
+        self.last_raw_response = None
+        self.last_time_to_first_issue = None
+        # chunk_size is measured in characters; 0 disables chunked parsing
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.max_workers = max_workers or int(os.getenv('OLLAMA_NUM_PARALLEL', '1'))
+        # num_ctx is sized per request from the estimated prompt, up to max_ctx
+        self.max_ctx = max_ctx
+        self.estimator = estimator or TokenEstimator()
+        self.last_prompt_estimate = None
+        # Templates come from the package unless a directory of overrides is given here, in the
+        # environment or as llm.prompt_dir in settings.yaml
+        self.prompt_dir = (prompt_dir or os.getenv('MEET2JIRA_PROMPT_DIR')
+                           or setting(load_settings(), 'llm.prompt_dir'))
+        self._templates = {}
+        # Optional cleanup applied to every transcript before prompt construction
+        self.preprocessor = preprocessor
+        self.last_preprocess_stats = None
+
+    def preprocess(self, transcript: str, model: str = None) -> str:
+        """Run the preprocessor over a transcript and record the estimated token reduction"""
+        if self.preprocessor is None:
+            return transcript
+        model = model or self.model
+        with self.timings.span('parser.preprocess') as span:
+            text, stats = self.preprocessor.process(transcript)
+            stats['tokens_before'] = self.estimator.estimate(transcript, model)
+            stats['tokens_after'] = self.estimator.estimate(text, model)
+            span.update(stats)
+        self.last_preprocess_stats = stats
+        if not text.strip():
+            # Nothing survived (usually the relevance filter); let the model see the whole meeting instead
+            self.logger.warning("Preprocessing removed the entire transcript; using it unprocessed")
+            return transcript
+        saved = stats['tokens_before'] - stats['tokens_after']
+        self.logger.info(f"Preprocessed {stats['format']} transcript: ~{stats['tokens_before']} -> "
+                         f"~{stats['tokens_after']} tokens ({saved * 100 // max(1, stats['tokens_before'])}% fewer)")
+        return text
+
+    def _load_template(self, name: str) -> str:
+        """Read a prompt template once per parser, from prompt_dir when set or the packaged defaults"""
+        if name not in self._templates:
+            if self.prompt_dir:
+                with open(os.path.join(self.prompt_dir, name)) as f:
+                    self._templates[name] = f.read()
+            else:
+                self._templates[name] = resources.files(__package__).joinpath('prompts', name).read_text()
+        return self._templates[name]
+
+    def _template_parts(self, name: str, placeholder: str, label: str) -> Tuple[str, str, str]:
+        """Split a template into (system, head, tail) around its data placeholder
+
+        The fixed instructions before the paragraph holding the placeholder go
+        in Ollama's system field, so every request starts with an identical
+        prefix and the server can reuse its KV cache instead of re-reading them.
+        A template without the placeholder gets the data appended under label.
+        """
+        template = self._load_template(name)
+        if placeholder not in template:
+            return template.strip(), f"{label}\n", ""
+        before, _, tail = template.partition(placeholder)
+        system, _, head = before.rpartition("\n\n")
+        return system.strip(), head, tail
+
+    def _get_llm_prompt(self, transcript: str) -> Tuple[str, str]:
+        """Return the (system, prompt) pair for extracting issues from a transcript"""
+        system, head, tail = self._template_parts("system_prompt.txt", "{transcript}", "Meeting Transcript:")
+        return system, f"{head}{transcript}{tail}"
+
+    def _get_report_prompt(self, context: Dict[str, Any]) -> Tuple[str, str]:
+        """Return the (system, prompt) pair for report generation"""
+        system, head, tail = self._template_parts("report_prompt.txt", "{report_data}", "Report Data:")
+        # context is the bounded summary built by aggregation.ReportAggregator
+        return system, f"{head}{json.dumps(context, indent=1)}{tail}"
 
     def generate_report_summary(self, context: Dict[str, Any], model: str = None) -> str:
         """Generate a status report summary from Jira issues using LLM"""
         model = model or self.model
         self.logger.info("Generating status report with LLM")
-        
+
         # Generate prompt and get LLM response
-        prompt = self._get_report_prompt(context)
-        response = ollama.generate(
-            model=model,
-            prompt=prompt,
-            options={"num_ctx": 24576}
-        )
-        
-        return response["response"].strip()
+        with self.timings.span('parser.report_summary', model=model):
+            system, prompt = self._get_report_prompt(context)
+            response = self._generate(model, prompt, self._options(model, prompt, REPORT_OUTPUT_TOKENS, system),
+                                      system=system)
+
+        return response.strip()
+
+    def _model_digest(self, model: str) -> str:
+        """Look up the model digest so cached responses are invalidated when the model changes"""
+        if model not in self._model_digests:
+            digest = model
+            try:
+                for entry in ollama.list().get('models', []):
+                    if entry.get('model') == model or entry.get('name') == model:
+                        digest = entry.get('digest') or model
+                        break
+            except Exception as e:
+                self.logger.debug(f"Could not resolve digest for {model}: {str(e)}")
+            self._model_digests[model] = digest
+        return self._model_digests[model]
+
+    def _options(self, model: str, prompt: str, output_tokens: int, system: str = "") -> Dict[str, Any]:
+        """Size num_ctx to the estimated prompt plus the output budget instead of always using max_ctx"""
+        prompt_tokens = self.estimator.estimate(system + prompt, model)
+        num_ctx = self.estimator.context_size(prompt_tokens + output_tokens, self.max_ctx)
+        if prompt_tokens + output_tokens > self.max_ctx:
+            self.logger.warning(f"Prompt needs ~{prompt_tokens} tokens plus {output_tokens} for the answer, "
+                                f"more than the {self.max_ctx} token context; it may be truncated")
+        self.last_prompt_estimate = {"prompt_tokens": prompt_tokens, "num_ctx": num_ctx}
+        return {"num_ctx": num_ctx}
+
+    def warm_up_options(self, model: str, transcript: Optional[str] = None) -> Dict[str, Any]:
+        """Options for a warm-up request that loads the runner the first real request will use
+
+        Ollama reloads the model when num_ctx changes, so a warm-up has to ask
+        for the same num_ctx. With a transcript that is the size of its first
+        extraction request, after preprocessing; otherwise it is the size
+        last requested, or before any request, that of a report at the
+        aggregator's limits.
+        """
+        if transcript and self.preprocessor is not None:
+            # Same text parse() will size, without recording stats for a request that has not run yet
+            text, _ = self.preprocessor.process(transcript)
+            if text.strip():
+                transcript = text
+        if transcript:
+            chunk_size = self._chunk_size_for(transcript, model, warn=False)
+            if chunk_size:
+                transcript = self.split_transcript(transcript, chunk_size)[0]
+            system, prompt = self._get_llm_prompt(transcript)
+            tokens = self.estimator.estimate(system + prompt, model) + EXTRACT_OUTPUT_TOKENS
+        elif self.last_prompt_estimate is not None:
+            return {"num_ctx": self.last_prompt_estimate["num_ctx"]}
+        else:
+            system, prompt = self._get_report_prompt({})
+            tokens = (self.estimator.estimate(system + prompt, model) + REPORT_OUTPUT_TOKENS
+                      + math.ceil(FULL_REPORT_DATA_CHARS / self.estimator.chars_per_token(model)))
+        return {"num_ctx": self.estimator.context_size(tokens, self.max_ctx)}
+
+    def _cache_lookup(self, model: str, prompt: str, options: Dict[str, Any], format: str = None,
+                      system: str = None):
+        """Return (cache key, cached response) for a request; both are None when caching is off"""
+        if self.cache is None:
+            return None, None
+        # The system and prompt hold the template contents, so template edits change the key too
+        with self.timings.span('cache.lookup') as span:
+            key = self.cache.make_key(self._model_digest(model), system or "", prompt, options, format)
+            cached = self.cache.get(key)
+            span['hit'] = cached is not None
+        if cached is not None:
+            self.logger.info("Using cached LLM response")
+        return key, cached
+
+    def _cache_store(self, key: Optional[str], text: str, format: str = None):
+        """Store a response under key, skipping malformed JSON responses"""
+        if key is not None and (format != "json" or _is_json(text)):
+            self.cache.put(key, text)
+
+    def _request_kwargs(self, format: str = None, system: str = None) -> Dict[str, Any]:
+        """Optional generate() arguments shared by every request"""
+        kwargs = {"format": format} if format else {}
+        if system:
+            kwargs["system"] = system
+        if self.keep_alive is not None:
+            kwargs["keep_alive"] = self.keep_alive
+        return kwargs
+
+    @staticmethod
+    def _request_kind(format: str = None) -> str:
+        return "extract" if format == "json" else "report"
+
+    def _generate(self, model: str, prompt: str, options: Dict[str, Any], format: str = None,
+                  system: str = None) -> str:
+        """Call Ollama, serving identical requests from the response cache when enabled"""
+        key, cached = self._cache_lookup(model, prompt, options, format, system)
+        if cached is not None:
+            return cached
+
+        kind = self._request_kind(format)
+        with self.timings.span('ollama.generate', model=model, kind=kind):
+            response = ollama.generate(model=model, prompt=prompt, options=options,
+                                       **self._request_kwargs(format, system))
+        self.timings.record_llm(response, model, kind)
+        self.estimator.calibrate(model, len(system or "") + len(prompt), response.get("prompt_eval_count"))
+        text = response["response"]
+
+        self._cache_store(key, text, format)
+        return text
+
+    def split_transcript(self, transcript: str, chunk_size: int = None) -> List[str]:
+        """Split a transcript into overlapping windows on speaker/time boundaries"""
+        chunk_size = chunk_size or self.chunk_size
+        segments = []
+        for line in transcript.splitlines():
+            if not segments or (SEGMENT_BOUNDARY.match(line) and segments[-1].strip()):
+                segments.append(line)
+            else:
+                segments[-1] += "\n" + line
+
+        # Turns longer than a chunk (or transcripts without speakers) are broken up further
+        segments = [piece for segment in segments for piece in _split_oversized(segment, chunk_size)]
+
+        chunks = []
+        window = []
+        window_size = 0
+        for segment in segments:
+            if window and window_size + len(segment) > chunk_size:
+                chunks.append("\n".join(window))
+                # Carry the last few turns over so items spanning a boundary keep their context
+                window = window[-self.chunk_overlap:] if self.chunk_overlap else []
+                window_size = sum(len(s) for s in window)
+                # ...as far as they fit alongside the next segment
+                while window and window_size + len(segment) > chunk_size:
+                    window_size -= len(window.pop(0))
+            window.append(segment)
+            window_size += len(segment)
+        if window:
+            chunks.append("\n".join(window))
+        return chunks
+
+    def _normalize_issue(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in defaults for a single parsed issue"""
+        return {
+            "type": issue.get("type", "Task"),
+            "title": issue.get("title", ""),
+            "description": issue.get("description", ""),
+            "priority": issue.get("priority", "Medium"),
+            "labels": issue.get("labels", [])
+        }
+
+    def _normalize_issues(self, parsed: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fill in defaults for every issue in a parsed LLM response"""
+        return [self._normalize_issue(issue) for issue in parsed.get("issues", [])]
+
+    @staticmethod
+    def _issue_key(issue: Dict[str, Any]) -> str:
+        """Normalized title used to recognise the same issue across chunks"""
+        return " ".join(re.findall(r"\w+", issue["title"].lower()))
+
+    def _merge_issue(self, merged: Dict[str, Dict[str, Any]], issue: Dict[str, Any]) -> bool:
+        """Add issue to merged, folding it into an existing duplicate; returns True if it was new"""
+        key = self._issue_key(issue)
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = issue
+            return True
+        if len(issue["description"]) > len(existing["description"]):
+            existing["description"] = issue["description"]
+        existing["labels"] = existing["labels"] + [
+            label for label in issue["labels"] if label not in existing["labels"]
+        ]
+        return False
+
+    def _merge_issues(self, issue_lists: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Merge per-chunk issue lists, dropping issues repeated across overlapping chunks"""
+        merged = {}
+        for issues in issue_lists:
+            for issue in issues:
+                self._merge_issue(merged, issue)
+        return list(merged.values())
+
+    def _extract(self, transcript: str, model: str) -> Dict[str, Any]:
+        """Run a single extraction request and decode its JSON response"""
+        system, prompt = self._get_llm_prompt(transcript)
+        response = self._generate(model, prompt, self._options(model, prompt, EXTRACT_OUTPUT_TOKENS, system),
+                                  format="json", system=system)
+        return self._decode(response)
+
+    def _decode(self, response: str) -> Dict[str, Any]:
+        """Decode a JSON extraction response"""
+        try:
+            return json.loads(response)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Error parsing transcript: {str(e)}")
+            raise ValueError("Invalid response format") from e
+
+    def _merge_chunk_responses(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine decoded per-chunk responses into a single parse result"""
+        return {
+            "issues": self._merge_issues([self._normalize_issues(parsed) for parsed in responses]),
+            "raw_response": {"chunks": responses}
+        }
+
+    def _parse_chunked(self, transcript: str, model: str, chunk_size: int = None) -> Dict[str, Any]:
+        """Extract issues from each transcript window and merge the results"""
+        chunks = self.split_transcript(transcript, chunk_size)
+        self.logger.info(f"Parsing transcript in {len(chunks)} chunks "
+                         f"({min(self.max_workers, len(chunks))} concurrent)")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            responses = list(executor.map(lambda chunk: self._extract(chunk, model), chunks))
+
+        return self._merge_chunk_responses(responses)
+
+    def _chunk_size_for(self, transcript: str, model: str, warn: bool = True) -> int:
+        """Characters per chunk for this transcript, or 0 to send it in a single request
+
+        An explicit chunk_size always applies; otherwise a transcript whose
+        prompt would not fit in max_ctx is split into chunks that do.
+        """
+        if self.chunk_size:
+            return self.chunk_size if len(transcript) > self.chunk_size else 0
+        budget = self.max_ctx - EXTRACT_OUTPUT_TOKENS
+        overhead = self.estimator.estimate("".join(self._get_llm_prompt("")), model)
+        prompt_tokens = overhead + self.estimator.estimate(transcript, model)
+        if prompt_tokens <= budget:
+            return 0
+        # Leave headroom for estimation error and the overlap carried between chunks
+        chunk_size = max(1000, int((budget - overhead) * self.estimator.chars_per_token(model) * 0.8))
+        if warn:
+            self.logger.warning(f"Transcript needs ~{prompt_tokens} prompt tokens, more than fit in the "
+                                f"{self.max_ctx} token context; splitting it into chunks of {chunk_size} characters")
+        return chunk_size
 
     def parse(self, transcript: str, model: str = None) -> Dict[str, Any]:
         """Parse meeting transcript and extract actionable items using LLM"""
         if not transcript.strip():
             raise ValueError("Transcript cannot be empty")
-            
+
         # Use provided model or fall back to instance default
         model = model or self.model
+        transcript = self.preprocess(transcript, model)
         self.logger.info("Parsing meeting transcript with LLM")
-        
-        # Generate prompt and get LLM response
-        prompt = self._get_llm_prompt(transcript)
-        response = ollama.generate(
-            model=model,
-            prompt=prompt,
-            options={"num_ctx": 24576},
-            format="json"
-        )
-        
-        # Parse and return the JSON response
-        try:
-            parsed = json.loads(response["response"])
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Error parsing transcript: {str(e)}")
-            raise ValueError("Invalid response format") from e
-            
+
+        with self.timings.span('parser.parse', model=model, characters=len(transcript)):
+            chunk_size = self._chunk_size_for(transcript, model)
+            if chunk_size:
+                return self._parse_chunked(transcript, model, chunk_size)
+
+            # Generate prompt and get LLM response
+            parsed = self._extract(transcript, model)
+
         # Ensure proper JSON structure and formatting
         return {
-            "issues": [
-                {
-                    "type": issue.get("type", "Task"),
-                    "title": issue.get("title", ""),
-                    "description": issue.get("description", ""),
-                    "priority": issue.get("priority", "Medium"),
-                    "labels": issue.get("labels", [])
-                }
-                for issue in parsed.get("issues", [])
-            ],
+            "issues": self._normalize_issues(parsed),
+            "raw_response": parsed
+        }
+
+    def _stream_extract(self, transcript: str, model: str) -> Iterator[Dict[str, Any]]:
+        """Stream one extraction request, yielding raw issue objects as they close"""
+        system, prompt = self._get_llm_prompt(transcript)
+        options = self._options(model, prompt, EXTRACT_OUTPUT_TOKENS, system)
+        key, cached = self._cache_lookup(model, prompt, options, "json", system)
+        if cached is not None:
+            parsed = self._decode(cached)
+            self.last_raw_response = parsed
+            yield from parsed.get("issues", [])
+            return
+
+        decoder = IssueStreamDecoder()
+        emitted = 0
+        for part in ollama.generate(model=model, prompt=prompt, options=options, stream=True,
+                                    **self._request_kwargs("json", system)):
+            for issue in decoder.feed(part["response"]):
+                emitted += 1
+                yield issue
+            if part.get("done"):
+                # The final streamed part carries the token counts and durations
+                self.timings.record_llm(part, model, "extract")
+                self.estimator.calibrate(model, len(system) + len(prompt), part.get("prompt_eval_count"))
+
+        parsed = self._decode(decoder.text)
+        self._cache_store(key, decoder.text, "json")
+        self.last_raw_response = parsed
+        # Fall back to the decoded response if the model nested issues somewhere unexpected
+        yield from parsed.get("issues", [])[emitted:]
+
+    def _stream_chunked(self, transcript: str, model: str, chunk_size: int = None) -> Iterator[Dict[str, Any]]:
+        """Yield new, deduplicated issues as each transcript chunk finishes"""
+        chunks = self.split_transcript(transcript, chunk_size)
+        merged = {}
+        responses = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._extract, chunk, model) for chunk in chunks]
+            for future in as_completed(futures):
+                parsed = future.result()
+                responses.append(parsed)
+                for issue in self._normalize_issues(parsed):
+                    if self._merge_issue(merged, issue):
+                        yield issue
+        self.last_raw_response = {"chunks": responses}
+
+    def parse_stream(self, transcript: str, model: str = None) -> Iterator[Dict[str, Any]]:
+        """Yield each parsed issue as soon as the model finishes generating it"""
+        if not transcript.strip():
+            raise ValueError("Transcript cannot be empty")
+
+        model = model or self.model
+        transcript = self.preprocess(transcript, model)
+        self.logger.info("Streaming meeting transcript through LLM")
+        started = time.monotonic()
+        self.last_time_to_first_issue = None
+
+        chunk_size = self._chunk_size_for(transcript, model)
+        if chunk_size:
+            issues = self._stream_chunked(transcript, model, chunk_size)
+        else:
+            issues = (self._normalize_issue(issue) for issue in self._stream_extract(transcript, model))
+
+        for issue in issues:
+            if self.last_time_to_first_issue is None:
+                self.last_time_to_first_issue = time.monotonic() - started
+                self.logger.info(f"First issue after {self.last_time_to_first_issue:.2f}s")
+            yield issue
+
+
+class AsyncMeetingParser(MeetingParser):
+    """MeetingParser variant built on ollama.AsyncClient for concurrent requests
+
+    At most max_workers requests are in flight at once; match it to the
+    server's OLLAMA_NUM_PARALLEL so every parallel slot stays busy.
+    """
+
+    def __init__(self, model: str = 'llama2', host: str = None, **kwargs):
+        super().__init__(model=model, **kwargs)
+        self.host = host
+        self._loop = None
+        self._client = None
+        self._semaphore = None
+
+    def _loop_state(self):
+        """Return the client and semaphore bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._client = ollama.AsyncClient(host=self.host)
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        return self._client, self._semaphore
+
+    async def _generate_async(self, model: str, prompt: str, options: Dict[str, Any], format: str = None,
+                              system: str = None) -> str:
+        """Call Ollama asynchronously, bounded by the concurrency limit"""
+        key, cached = self._cache_lookup(model, prompt, options, format, system)
+        if cached is not None:
+            return cached
+
+        client, semaphore = self._loop_state()
+        kind = self._request_kind(format)
+        async with semaphore:
+            with self.timings.span('ollama.generate', model=model, kind=kind):
+                response = await client.generate(model=model, prompt=prompt, options=options,
+                                                 **self._request_kwargs(format, system))
+        self.timings.record_llm(response, model, kind)
+        self.estimator.calibrate(model, len(system or "") + len(prompt), response.get("prompt_eval_count"))
+        text = response["response"]
+
+        self._cache_store(key, text, format)
+        return text
+
+    async def _extract_async(self, transcript: str, model: str) -> Dict[str, Any]:
+        """Run a single extraction request asynchronously"""
+        system, prompt = self._get_llm_prompt(transcript)
+        response = await self._generate_async(model, prompt,
+                                              self._options(model, prompt, EXTRACT_OUTPUT_TOKENS, system),
+                                              format="json", system=system)
+        return self._decode(response)
+
+    async def parse_async(self, transcript: str, model: str = None) -> Dict[str, Any]:
+        """Parse a transcript, fanning chunks out concurrently"""
+        if not transcript.strip():
+            raise ValueError("Transcript cannot be empty")
+
+        model = model or self.model
+        transcript = self.preprocess(transcript, model)
+        self.logger.info("Parsing meeting transcript with LLM")
+
+        with self.timings.span('parser.parse', model=model, characters=len(transcript)):
+            chunk_size = self._chunk_size_for(transcript, model)
+            if chunk_size:
+                chunks = self.split_transcript(transcript, chunk_size)
+                self.logger.info(f"Parsing transcript in {len(chunks)} chunks ({self.max_workers} concurrent)")
+                responses = await asyncio.gather(*(self._extract_async(chunk, model) for chunk in chunks))
+                return self._merge_chunk_responses(list(responses))
+
+            parsed = await self._extract_async(transcript, model)
+        return {
+            "issues": self._normalize_issues(parsed),
             "raw_response": parsed
         }
+
+    async def parse_many(self, transcripts: List[str], model: str = None) -> List[Any]:
+        """Parse several transcripts concurrently; failures are returned as exceptions"""
+        return await asyncio.gather(
+            *(self.parse_async(transcript, model=model) for transcript in transcripts),
+            return_exceptions=True
+        )
+
+    async def generate_report_summary_async(self, context: Dict[str, Any], model: str = None) -> str:
+        """Generate a status report summary asynchronously"""
+        model = model or self.model
+        self.logger.info("Generating status report with LLM")
+
+        with self.timings.span('parser.report_summary', model=model):
+            system, prompt = self._get_report_prompt(context)
+            response = await self._generate_async(model, prompt,
+                                                  self._options(model, prompt, REPORT_OUTPUT_TOKENS, system),
+                                                  system=system)
+        return response.strip()
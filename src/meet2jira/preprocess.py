@@ -0,0 +1,217 @@
+import re
+from collections import deque
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# A turn is (timestamp, speaker, text); timestamp and speaker may be None
+Turn = Tuple[Optional[str], Optional[str], str]
+
+# "00:00:01.000 --> 00:00:04.000" (WebVTT) or "00:00:01,000 --> 00:00:04,000" (SRT), plus cue settings
+CUE_TIMING = re.compile(r"^\s*((?:\d{1,2}:)?\d{1,2}:\d{2}(?:[.,]\d{1,3})?)\s*-->")
+# "[00:12:31]", "(12:31)" or "00:12:31 -" at the start of a plain transcript line
+LEADING_TIMESTAMP = re.compile(r"^\s*[\[(]?((?:\d{1,2}:)?\d{1,2}:\d{2}(?:[.,]\d+)?)[\])]?\s*(?:[-–]\s*)?")
+# "Alex Carter: ..." — the same speaker shape parser.SEGMENT_BOUNDARY splits on
+SPEAKER = re.compile(r"^([A-Z][\w .'-]{0,40}?)\s*:\s+(.*)$")
+# "Alex Carter  0:03" on a line of its own, as exported by several note takers
+SPEAKER_HEADING = re.compile(r"^([A-Z][\w .'-]{0,40}?)\s+[\[(]?(?:\d{1,2}:)?\d{1,2}:\d{2}[\])]?\s*$")
+# WebVTT voice span "<v Alex Carter>" and any other markup tag
+VOICE = re.compile(r"<v(?:\.[^\s>]+)?\s+([^>]+)>")
+TAG = re.compile(r"</?[^>]+>")
+
+DEFAULT_FILLERS = ('um', 'umm', 'uh', 'uhh', 'uhm', 'erm', 'er', 'ah', 'hmm', 'mm', 'mhm', 'uh-huh')
+# Set off by commas only, so "do you know the date" is left alone
+DEFAULT_FILLER_PHRASES = ('you know', 'I mean', 'like I said', 'sort of', 'kind of')
+# Turns consisting only of acknowledgements ("Yeah, okay.") carry no content
+BACKCHANNEL = re.compile(r"^(?:(?:yeah|yes|yep|ok|okay|right|sure|cool|great|thanks|thank you|got it|mhm|"
+                         r"uh-huh|alright|all right|no|nope|sounds good)[\s,.!?]*)+$", re.IGNORECASE)
+# Words that mark a turn as likely to carry an action item
+DEFAULT_KEYWORDS = ('action', 'todo', 'to-do', 'follow up', 'follow-up', 'will ', "i'll", "we'll", 'need',
+                    'should', 'must', 'fix', 'bug', 'issue', 'ticket', 'task', 'deadline', 'due', 'by monday',
+                    'by friday', 'next week', 'tomorrow', 'blocked', 'blocker', 'owner', 'own ', 'assign',
+                    'review', 'deploy', 'release', 'ship', 'investigate', 'look into', 'decide', 'decision')
+
+def detect_format(lines: List[str]) -> str:
+    """Classify a transcript as "vtt", "srt" or "plain" from its first lines"""
+    content = [line.strip() for line in lines if line.strip()]
+    if content and content[0].lstrip('﻿').startswith('WEBVTT'):
+        return 'vtt'
+    for line in content:
+        match = CUE_TIMING.match(line)
+        if match:
+            return 'srt' if ',' in match.group(1) else 'vtt'
+    return 'plain'
+
+class TranscriptPreprocessor:
+    """Shrink a raw transcript before prompt construction
+
+    Each stage is a generator over turns, so a transcript is processed in a
+    single pass: caption cues (WebVTT/SRT) or plain lines become turns,
+    filler words and backchannel turns are dropped, consecutive turns by the
+    same speaker are merged, and optionally only turns mentioning a keyword
+    (plus their neighbours) are kept.
+    """
+
+    def __init__(self, strip_timestamps: bool = True, merge_speakers: bool = True, remove_fillers: bool = True,
+                 keywords: Optional[Iterable[str]] = None, context: int = 1,
+                 fillers: Iterable[str] = DEFAULT_FILLERS, filler_phrases: Iterable[str] = DEFAULT_FILLER_PHRASES):
+        self.strip_timestamps = strip_timestamps
+        self.merge_speakers = merge_speakers
+        self.remove_fillers = remove_fillers
+        # None disables the relevance filter; turns within context of a match are kept too
+        self.keywords = list(keywords) if keywords is not None else None
+        self.context = context
+        words = '|'.join(re.escape(word) for word in fillers)
+        phrases = '|'.join(re.escape(phrase) for phrase in filler_phrases)
+        self._filler_words = re.compile(rf"(?<![\w-])(?:{words})(?![\w-])[,.]?\s*", re.IGNORECASE) if words else None
+        self._filler_phrases = re.compile(rf",?\s*\b(?:{phrases}),\s*", re.IGNORECASE) if phrases else None
+        if self.keywords is not None:
+            self._keyword_pattern = re.compile(
+                '|'.join(rf"\b{re.escape(keyword)}" for keyword in self.keywords) or r"(?!)", re.IGNORECASE)
+
+    def process(self, transcript: str) -> Tuple[str, Dict[str, Any]]:
+        """Preprocess a whole transcript, returning the text and what each stage removed"""
+        stats = {}
+        text = "\n".join(self.process_lines(transcript.splitlines(), stats))
+        stats.update(input_characters=len(transcript), output_characters=len(text))
+        return text, stats
+
+    def process_lines(self, lines: Iterable[str], stats: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Lazily preprocess transcript lines, yielding one line per kept turn
+
+        stats, when given, receives the detected format and turn counts once
+        the generator is exhausted.
+        """
+        stats = stats if stats is not None else {}
+        lines = iter(lines)
+        head = list(islice(lines, 20))
+        stats['format'] = detect_format(head)
+        stats['input_turns'] = stats['output_turns'] = 0
+
+        turns = self._count(self._turns(chain(head, lines), stats['format']), stats, 'input_turns')
+        if self.remove_fillers:
+            turns = self._without_fillers(turns)
+        if self.merge_speakers:
+            turns = self._merge_runs(turns)
+        if self.keywords is not None:
+            turns = self._relevant(turns)
+        for timestamp, speaker, text in self._count(turns, stats, 'output_turns'):
+            line = f"{speaker}: {text}" if speaker else text
+            yield f"[{timestamp}] {line}" if timestamp and not self.strip_timestamps else line
+
+    @staticmethod
+    def _count(turns: Iterator[Turn], stats: Dict[str, Any], key: str) -> Iterator[Turn]:
+        for turn in turns:
+            stats[key] += 1
+            yield turn
+
+    def _turns(self, lines: Iterator[str], format: str) -> Iterator[Turn]:
+        if format == 'plain':
+            return self._plain_turns(lines)
+        return self._caption_turns(lines)
+
+    @staticmethod
+    def _split_speaker(text: str) -> Tuple[Optional[str], str]:
+        match = SPEAKER.match(text)
+        if match:
+            return match.group(1).strip(), match.group(2).strip()
+        return None, text
+
+    def _plain_turns(self, lines: Iterator[str]) -> Iterator[Turn]:
+        """One turn per non-empty line; a bare "Name 0:03" heading names the speaker of the lines below it"""
+        speaker = None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            heading = SPEAKER_HEADING.match(line)
+            if heading:
+                speaker = heading.group(1).strip()
+                continue
+            timestamp = None
+            match = LEADING_TIMESTAMP.match(line)
+            if match:
+                timestamp = match.group(1)
+                line = line[match.end():]
+            named, text = self._split_speaker(line)
+            if named:
+                speaker = named
+            if text:
+                yield timestamp, named or speaker, text
+
+    def _caption_turns(self, lines: Iterator[str]) -> Iterator[Turn]:
+        """One turn per WebVTT/SRT cue, dropping headers, NOTE/STYLE blocks, cue numbers and timings"""
+        timestamp = None
+        cue = []
+        skipping = False
+        for line in chain(lines, [""]):
+            line = line.strip().lstrip('﻿')
+            if not line:
+                if cue:
+                    yield from self._cue_turn(timestamp, cue)
+                cue, timestamp, skipping = [], None, False
+                continue
+            if skipping:
+                continue
+            match = CUE_TIMING.match(line)
+            if match:
+                if cue:
+                    yield from self._cue_turn(timestamp, cue)
+                    cue = []
+                timestamp = re.sub(r"[.,]\d+$", "", match.group(1))
+            elif timestamp is None:
+                # Header, NOTE/STYLE/REGION block or cue identifier before the timing line
+                skipping = line.startswith(('WEBVTT', 'NOTE', 'STYLE', 'REGION'))
+            else:
+                cue.append(line)
+
+    def _cue_turn(self, timestamp: Optional[str], cue: List[str]) -> Iterator[Turn]:
+        text = " ".join(cue)
+        voice = VOICE.search(text)
+        text = TAG.sub("", text).strip()
+        speaker, text = (voice.group(1).strip(), text) if voice else self._split_speaker(text)
+        if text:
+            yield timestamp, speaker, text
+
+    def _without_fillers(self, turns: Iterator[Turn]) -> Iterator[Turn]:
+        for timestamp, speaker, original in turns:
+            text = original
+            if self._filler_phrases is not None:
+                text = self._filler_phrases.sub(" ", text)
+            if self._filler_words is not None:
+                text = self._filler_words.sub("", text)
+            text = re.sub(r"\s{2,}", " ", text).strip(" ,")
+            if text and not BACKCHANNEL.match(text):
+                # Keep the sentence capitalised when a leading filler was removed
+                if original[0].isupper():
+                    text = text[0].upper() + text[1:]
+                yield timestamp, speaker, text
+
+    @staticmethod
+    def _merge_runs(turns: Iterator[Turn]) -> Iterator[Turn]:
+        """Join consecutive turns by the same speaker; unattributed turns continue the current one"""
+        current = None
+        for timestamp, speaker, text in turns:
+            if current is not None and (speaker is None or speaker == current[1]):
+                current = (current[0], current[1], f"{current[2]} {text}")
+                continue
+            if current is not None:
+                yield current
+            current = (timestamp, speaker, text)
+        if current is not None:
+            yield current
+
+    def _relevant(self, turns: Iterator[Turn]) -> Iterator[Turn]:
+        """Keep turns mentioning a keyword plus up to context turns either side"""
+        before = deque(maxlen=self.context)
+        after = 0
+        for turn in turns:
+            if self._keyword_pattern.search(turn[2]):
+                yield from before
+                before.clear()
+                after = self.context
+                yield turn
+            elif after:
+                after -= 1
+                yield turn
+            elif self.context:
+                before.append(turn)
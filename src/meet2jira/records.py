@@ -0,0 +1,51 @@
+from typing import Any, Optional, Tuple
+
+class IssueRecord:
+    """The flat fields reports and snapshots use for one issue, without the raw Jira payload
+
+    Slots keep a record to a few hundred bytes however many fields the search
+    returned. Fields can be read as attributes or by name (record['status'],
+    record.get('priority')), so code written for projected dicts accepts
+    records as well.
+    """
+
+    __slots__ = ('key', 'status', 'assignee', 'summary', 'priority', 'created', 'updated')
+
+    def __init__(self, key: str, status: str, assignee: Optional[str] = None, summary: Optional[str] = None,
+                 priority: Optional[str] = None, created: Optional[str] = None, updated: Optional[str] = None):
+        self.key = key
+        self.status = status
+        self.assignee = assignee
+        self.summary = summary
+        self.priority = priority
+        self.created = created
+        self.updated = updated
+
+    @classmethod
+    def from_raw(cls, issue: dict) -> 'IssueRecord':
+        """Project a raw Jira search result"""
+        fields = issue['fields']
+        assignee = fields['assignee']
+        priority = fields.get('priority')
+        return cls(issue['key'], fields['status']['name'], assignee['displayName'] if assignee else None,
+                   fields['summary'], priority['name'] if priority else None,
+                   fields.get('created'), fields.get('updated'))
+
+    def row(self) -> Tuple:
+        """Values in ReportStorage's ISSUE_COLUMNS order"""
+        return (self.key, self.status, self.assignee, self.summary, self.priority, self.created, self.updated)
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return getattr(self, name, default)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, IssueRecord) and self.row() == other.row()
+
+    def __repr__(self) -> str:
+        return f"IssueRecord({', '.join(repr(value) for value in self.row())})"
@@ -0,0 +1,39 @@
+from typing import Dict
+
+def load_report_set(path: str) -> Dict:
+    """Read a report set: a YAML list of named JQLs, optionally under 'reports' next to a 'superset' query
+
+        superset: project = APP          # optional; defaults to the OR of every report's JQL
+        reports:
+          - name: Platform
+            jql: project = APP AND component = Platform
+          - name: Mobile
+            jql: project = APP AND labels in (ios, android)
+
+    Returns {'superset': str or None, 'reports': [{'name', 'jql'}, ...]}.
+    """
+    # PyYAML is only needed for report sets
+    import yaml
+
+    with open(path, 'r') as f:
+        data = yaml.safe_load(f)
+    superset = None
+    if isinstance(data, dict):
+        superset = data.get('superset')
+        data = data.get('reports')
+    if not isinstance(data, list) or not data:
+        raise ValueError(f"Report set {path} must contain a non-empty list of reports")
+
+    reports = []
+    names = set()
+    for position, entry in enumerate(data, 1):
+        if isinstance(entry, str):
+            entry = {'jql': entry}
+        if not isinstance(entry, dict) or not entry.get('jql'):
+            raise ValueError(f"Report {position} in {path} has no jql")
+        name = str(entry.get('name') or entry['jql'])
+        if name in names:
+            raise ValueError(f"Report name {name!r} appears more than once in {path}")
+        names.add(name)
+        reports.append({'name': name, 'jql': entry['jql']})
+    return {'superset': superset, 'reports': reports}
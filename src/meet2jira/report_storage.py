@@ -1,90 +1,457 @@
+import os
 import sqlite3
-from datetime import datetime
-from typing import List, Optional
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
 from pathlib import Path
+from .records import IssueRecord
+from .timings import RunRecorder
+
+# Bump when the schema changes; _init_db skips all DDL for databases already at this version
+SCHEMA_VERSION = 4
+
+# Columns stored for every issue version, in insert order
+ISSUE_COLUMNS = ('issue_key', 'status', 'assignee', 'summary', 'priority', 'created', 'updated')
 
 class ReportStorage:
-    def __init__(self, db_path: str = "meet2jira_reports.db"):
+    """SQLite report history stored as issue versions valid over a range of report sequence numbers
+
+    A snapshot only writes rows for issues that were added or changed since
+    the previous report for the same JQL; every other issue keeps its open
+    version. The snapshot taken at seq S is every version of the series with
+    valid_from <= S and (valid_to IS NULL or valid_to > S).
+    """
+
+    def __init__(self, db_path: str = "meet2jira_reports.db", timings: Optional[RunRecorder] = None):
         self.db_path = db_path
+        self.timings = timings or RunRecorder(enabled=False)
+        # One long-lived connection shared by every call; the lock serialises threads
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._configure_connection()
         self._init_db()
 
-    def _init_db(self):
-        """Initialize database tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS reports (
-                    report_id TEXT PRIMARY KEY,
-                    jql_filter TEXT NOT NULL,
-                    created_at TIMESTAMP NOT NULL
-                )
-            """)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS report_issues (
-                    report_id TEXT,
-                    issue_key TEXT,
-                    status TEXT NOT NULL,
+    def _configure_connection(self):
+        """Tune the connection for a local, single-writer database"""
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        # Temp tables and the scratch tables SQLite builds for large statements spill to disk past the cache
+        self.conn.execute("PRAGMA temp_store=FILE")
+        for table in ('incoming', 'diff_old', 'diff_new'):
+            self.conn.execute(f"""
+                CREATE TEMP TABLE IF NOT EXISTS {table} (
+                    issue_key TEXT PRIMARY KEY,
+                    status TEXT,
                     assignee TEXT,
                     summary TEXT,
-                    PRIMARY KEY (report_id, issue_key),
-                    FOREIGN KEY (report_id) REFERENCES reports(report_id)
+                    priority TEXT,
+                    created TEXT,
+                    updated TEXT
                 )
             """)
-            conn.commit()
-
-    def save_report(self, report_id: str, jql: str, issues: List[dict]):
-        """Save a report and its issues to the database"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Save report metadata
-            cursor.execute(
-                "INSERT INTO reports VALUES (?, ?, ?)",
-                (report_id, jql, datetime.utcnow())
-            )
-            
-            # Save all issues
-            for issue in issues:
-                cursor.execute(
-                    "INSERT INTO report_issues VALUES (?, ?, ?, ?, ?)",
-                    (
-                        report_id,
-                        issue['key'],
-                        issue['fields']['status']['name'],
-                        issue['fields']['assignee']['displayName'] if issue['fields']['assignee'] else None,
-                        issue['fields']['summary']
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+    def _init_db(self):
+        """Initialize database tables if they don't exist"""
+        with self._lock:
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+            with self.conn:
+                cursor = self.conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS reports (
+                        report_id TEXT PRIMARY KEY,
+                        jql_filter TEXT NOT NULL,
+                        created_at TIMESTAMP NOT NULL
+                    )
+                """)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS report_series (
+                        series_id INTEGER PRIMARY KEY,
+                        jql_filter TEXT NOT NULL UNIQUE
                     )
+                """)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS issue_versions (
+                        series_id INTEGER NOT NULL,
+                        issue_key TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        assignee TEXT,
+                        summary TEXT,
+                        priority TEXT,
+                        created TEXT,
+                        updated TEXT,
+                        valid_from INTEGER NOT NULL,
+                        valid_to INTEGER,
+                        FOREIGN KEY (series_id) REFERENCES report_series(series_id)
+                    )
+                """)
+                columns = {row[1] for row in cursor.execute("PRAGMA table_info(reports)")}
+                if 'seq' not in columns:
+                    cursor.execute("ALTER TABLE reports ADD COLUMN series_id INTEGER")
+                    cursor.execute("ALTER TABLE reports ADD COLUMN seq INTEGER")
+                if 'prev_seq' not in columns:
+                    # Reports saved before schema 4 keep NULL, so their diffs never take the adjacent shortcut
+                    cursor.execute("ALTER TABLE reports ADD COLUMN prev_seq INTEGER")
+                cursor.execute("DROP INDEX IF EXISTS idx_reports_jql_created")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_reports_jql_seq ON reports(jql_filter, seq)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_reports_series_seq ON reports(series_id, seq)")
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_versions_open ON issue_versions(series_id, valid_to, issue_key)"
                 )
-            conn.commit()
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_versions_from ON issue_versions(series_id, valid_from)"
+                )
+                if 'seq' not in columns:
+                    self._migrate_full_snapshots(cursor)
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate_full_snapshots(self, cursor: sqlite3.Cursor):
+        """Convert report_issues (one full copy per report, schema <= 2) into issue versions"""
+        legacy = cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'report_issues'"
+        ).fetchone()
+        if legacy:
+            legacy_columns = {row[1] for row in cursor.execute("PRAGMA table_info(report_issues)")}
+        reports = cursor.execute("SELECT report_id, jql_filter FROM reports ORDER BY created_at").fetchall()
+        last_seq = {}
+        for seq, report in enumerate(reports, start=1):
+            series_id = self._series_id(cursor, report['jql_filter'])
+            cursor.execute("UPDATE reports SET series_id = ?, seq = ?, prev_seq = ? WHERE report_id = ?",
+                           (series_id, seq, last_seq.get(series_id), report['report_id']))
+            last_seq[series_id] = seq
+            if not legacy:
+                continue
+            select = ", ".join(column if column in legacy_columns else f"NULL AS {column}" for column in ISSUE_COLUMNS)
+            rows = cursor.execute(
+                f"SELECT {select} FROM report_issues WHERE report_id = ?", (report['report_id'],)
+            ).fetchall()
+            self._apply_snapshot(cursor, series_id, seq, (tuple(row) for row in rows))
+        if legacy:
+            cursor.execute("DROP TABLE report_issues")
 
-    def get_previous_report(self, jql: str) -> Optional[dict]:
+    @staticmethod
+    def _series_id(cursor: sqlite3.Cursor, jql: str) -> int:
+        """Return the series id for a JQL filter, creating it on first use"""
+        cursor.execute("INSERT OR IGNORE INTO report_series (jql_filter) VALUES (?)", (jql,))
+        return cursor.execute("SELECT series_id FROM report_series WHERE jql_filter = ?", (jql,)).fetchone()[0]
+
+    @staticmethod
+    def _apply_snapshot(cursor: sqlite3.Cursor, series_id: int, seq: int, rows: Optional[Iterable[tuple]] = None,
+                        source: str = 'temp.incoming'):
+        """Close versions that changed or disappeared and open versions for new or changed issues
+
+        rows are loaded into temp.incoming first; without rows, the snapshot
+        already staged in the source table is applied.
+        """
+        if rows is not None:
+            cursor.execute("DELETE FROM temp.incoming")
+            cursor.executemany("INSERT OR REPLACE INTO temp.incoming VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        cursor.execute(f"""
+            UPDATE issue_versions SET valid_to = :seq
+            WHERE series_id = :series AND valid_to IS NULL AND NOT EXISTS (
+                SELECT 1 FROM {source} i
+                WHERE i.issue_key = issue_versions.issue_key
+                  AND i.status IS issue_versions.status
+                  AND i.assignee IS issue_versions.assignee
+                  AND i.summary IS issue_versions.summary
+                  AND i.priority IS issue_versions.priority
+                  AND i.created IS issue_versions.created
+                  AND i.updated IS issue_versions.updated
+            )
+        """, {'seq': seq, 'series': series_id})
+        cursor.execute(f"""
+            INSERT INTO issue_versions
+            SELECT :series, i.issue_key, i.status, i.assignee, i.summary, i.priority, i.created, i.updated, :seq, NULL
+            FROM {source} i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM issue_versions v
+                WHERE v.series_id = :series AND v.valid_to IS NULL AND v.issue_key = i.issue_key
+            )
+        """, {'seq': seq, 'series': series_id})
+        if rows is not None:
+            cursor.execute("DELETE FROM temp.incoming")
+
+    def _stage_snapshot(self, issues: Iterable) -> str:
+        """Write issues to a scratch database file next to the report database and return its path
+
+        The file has its own connection and a small page cache, so staging
+        takes neither the storage lock nor memory in proportion to the
+        number of issues.
+        """
+        fd, path = tempfile.mkstemp(prefix='.meet2jira-staging-', suffix='.db',
+                                    dir=os.path.dirname(os.path.abspath(self.db_path)))
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(path)
+            try:
+                conn.execute("PRAGMA journal_mode=OFF")
+                conn.execute("PRAGMA synchronous=OFF")
+                conn.execute(f"""
+                    CREATE TABLE incoming (
+                        issue_key TEXT PRIMARY KEY,
+                        {', '.join(f'{column} TEXT' for column in ISSUE_COLUMNS[1:])}
+                    )
+                """)
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO incoming VALUES (?, ?, ?, ?, ?, ?, ?)", (
+                        issue.row() if isinstance(issue, IssueRecord) else (
+                            issue['key'],
+                            issue['status'],
+                            issue['assignee'],
+                            issue['summary'],
+                            issue['priority'],
+                            issue['created'],
+                            issue['updated']
+                        )
+                        for issue in issues
+                    ))
+            finally:
+                conn.close()
+        except BaseException:
+            os.remove(path)
+            raise
+        return path
+
+    def save_report(self, report_id: str, jql: str, issues: Iterable):
+        """Save a report and its projected issues (see jira_client.project_issue) to the database
+
+        issues may be a generator. It is drained into a scratch file before
+        the storage lock is taken, so a slow Jira search does not hold up
+        other storage calls, and an error while producing issues leaves no
+        report behind.
+        """
+        with self.timings.span('storage.save'):
+            staged = self._stage_snapshot(issues)
+            try:
+                with self._lock:
+                    self.conn.execute("ATTACH DATABASE ? AS staged", (staged,))
+                    try:
+                        with self.conn:
+                            cursor = self.conn.cursor()
+                            series_id = self._series_id(cursor, jql)
+                            seq = cursor.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM reports").fetchone()[0]
+                            prev_seq = cursor.execute("SELECT MAX(seq) FROM reports WHERE series_id = ?",
+                                                      (series_id,)).fetchone()[0]
+
+                            # Save report metadata
+                            cursor.execute(
+                                "INSERT INTO reports (report_id, jql_filter, created_at, series_id, seq, prev_seq) "
+                                "VALUES (?, ?, ?, ?, ?, ?)",
+                                (report_id, jql, datetime.utcnow(), series_id, seq, prev_seq)
+                            )
+
+                            # Only issues that changed since the previous snapshot are written
+                            self._apply_snapshot(cursor, series_id, seq, source='staged.incoming')
+                    finally:
+                        self.conn.execute("DETACH DATABASE staged")
+            finally:
+                os.remove(staged)
+
+    def _get_report_row(self, report_id: str) -> sqlite3.Row:
+        row = self.conn.execute("SELECT * FROM reports WHERE report_id = ?", (report_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown report: {report_id}")
+        return row
+
+    def _snapshot_query(self, latest: bool) -> str:
+        """SQL selecting the issue versions visible in a snapshot"""
+        if latest:
+            # The newest report of a series is exactly its open versions
+            return "SELECT * FROM issue_versions WHERE series_id = :series AND valid_to IS NULL"
+        return """
+            SELECT * FROM issue_versions
+            WHERE series_id = :series AND valid_from <= :seq AND (valid_to IS NULL OR valid_to > :seq)
+        """
+
+    def _is_latest(self, report: sqlite3.Row) -> bool:
+        latest = self.conn.execute(
+            "SELECT MAX(seq) FROM reports WHERE series_id = ?", (report['series_id'],)
+        ).fetchone()[0]
+        return latest == report['seq']
+
+    def get_report_issues(self, report_id: str) -> List[dict]:
+        """Reconstruct the issues stored for any report"""
+        with self._lock:
+            report = self._get_report_row(report_id)
+            rows = self.conn.execute(
+                f"SELECT :report_id AS report_id, {', '.join(ISSUE_COLUMNS)} "
+                f"FROM ({self._snapshot_query(self._is_latest(report))})",
+                {'series': report['series_id'], 'seq': report['seq'], 'report_id': report_id}
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+    def get_report_records(self, report_id: str, keys: Sequence[str]) -> Dict[str, IssueRecord]:
+        """The stored versions of the given issues in a report, by key; issues it did not contain are left out"""
+        if not keys:
+            return {}
+        params = {f'key{i}': key for i, key in enumerate(keys)}
+        placeholders = ", ".join(f":{name}" for name in params)
+        with self._lock:
+            report = self._get_report_row(report_id)
+            params.update(series=report['series_id'], seq=report['seq'])
+            rows = self.conn.execute(
+                f"SELECT {', '.join(ISSUE_COLUMNS)} FROM ({self._snapshot_query(self._is_latest(report))}) "
+                f"WHERE issue_key IN ({placeholders})", params
+            ).fetchall()
+        return {row['issue_key']: IssueRecord(*row) for row in rows}
+
+    def get_previous_report(self, jql: str, include_issues: bool = True) -> Optional[dict]:
         """Get the most recent report matching the given JQL filter"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
+        with self._lock, self.timings.span('storage.previous', include_issues=include_issues):
+            cursor = self.conn.cursor()
+
             # Get most recent report matching this JQL
             cursor.execute("""
-                SELECT * FROM reports 
+                SELECT report_id, jql_filter, created_at FROM reports
                 WHERE jql_filter = ?
-                ORDER BY created_at DESC
+                ORDER BY seq DESC
                 LIMIT 1
             """, (jql,))
             report = cursor.fetchone()
-            
+
             if not report:
                 return None
-                
-            # Get all issues for this report
-            cursor.execute("""
-                SELECT * FROM report_issues
-                WHERE report_id = ?
-            """, (report['report_id'],))
-            issues = cursor.fetchall()
-            
+            if not include_issues:
+                return dict(report)
+
             return {
                 'report_id': report['report_id'],
                 'jql_filter': report['jql_filter'],
                 'created_at': report['created_at'],
-                'issues': [dict(issue) for issue in issues]
+                'issues': self.get_report_issues(report['report_id'])
             }
+
+    def _load_diff_tables(self, old: sqlite3.Row, new: sqlite3.Row):
+        """Fill temp.diff_old/diff_new with the rows that can differ between two snapshots"""
+        self.conn.execute("DELETE FROM temp.diff_old")
+        self.conn.execute("DELETE FROM temp.diff_new")
+        columns = ", ".join(ISSUE_COLUMNS)
+        # Only reports saved one after the other qualify; compaction can remove the reports in between
+        if old['series_id'] == new['series_id'] and new['prev_seq'] == old['seq']:
+            # Adjacent snapshots only differ in versions closed or opened by the newer report
+            self.conn.execute(
+                f"INSERT INTO temp.diff_old SELECT {columns} FROM issue_versions "
+                f"WHERE series_id = ? AND valid_to = ?", (new['series_id'], new['seq'])
+            )
+            self.conn.execute(
+                f"INSERT INTO temp.diff_new SELECT {columns} FROM issue_versions "
+                f"WHERE series_id = ? AND valid_from = ?", (new['series_id'], new['seq'])
+            )
+            return
+        for table, report in (('diff_old', old), ('diff_new', new)):
+            self.conn.execute(
+                f"INSERT INTO temp.{table} SELECT {columns} FROM ({self._snapshot_query(self._is_latest(report))})",
+                {'series': report['series_id'], 'seq': report['seq']}
+            )
+
+    def diff_reports(self, old_id: str, new_id: str, limit: Optional[int] = None) -> dict:
+        """Compare two snapshots in SQL: added, removed, status-changed and reassigned issues"""
+        params = {'limit': -1 if limit is None else limit}
+        matched_join = """
+            FROM temp.diff_new n
+            JOIN temp.diff_old o ON o.issue_key = n.issue_key
+        """
+        queries = {
+            'added': ("n.issue_key AS key, n.summary, n.status, n.assignee", """
+                FROM temp.diff_new n
+                LEFT JOIN temp.diff_old o ON o.issue_key = n.issue_key
+                WHERE o.issue_key IS NULL
+            """),
+            'removed': ("o.issue_key AS key, o.summary, o.status, o.assignee", """
+                FROM temp.diff_old o
+                LEFT JOIN temp.diff_new n ON n.issue_key = o.issue_key
+                WHERE n.issue_key IS NULL
+            """),
+            'status_changed': ("n.issue_key AS key, n.summary, n.status, n.assignee, o.status AS previous_status",
+                               matched_join + " WHERE o.status != n.status"),
+            'reassigned': ("n.issue_key AS key, n.summary, n.status, n.assignee, o.assignee AS previous_assignee",
+                           matched_join + " WHERE o.assignee IS NOT n.assignee")
+        }
+
+        with self.timings.span('storage.diff'), self._lock, self.conn:
+            conn = self.conn
+            self._load_diff_tables(self._get_report_row(old_id), self._get_report_row(new_id))
+            # One pass over the matched issues yields every count; added/removed follow from the totals
+            transitions = {}
+            matched = status_changed = reassigned = 0
+            for row in conn.execute(f"""
+                SELECT o.status AS old_status, n.status AS new_status, COUNT(*) AS count,
+                       SUM(o.assignee IS NOT n.assignee) AS reassigned
+                {matched_join}
+                GROUP BY o.status, n.status
+            """):
+                matched += row['count']
+                reassigned += row['reassigned']
+                if row['old_status'] != row['new_status']:
+                    status_changed += row['count']
+                    transitions[f"{row['old_status']} -> {row['new_status']}"] = row['count']
+            counts = {
+                'added': conn.execute("SELECT COUNT(*) FROM temp.diff_new").fetchone()[0] - matched,
+                'removed': conn.execute("SELECT COUNT(*) FROM temp.diff_old").fetchone()[0] - matched,
+                'status_changed': status_changed,
+                'reassigned': reassigned
+            }
+
+            diff = {}
+            for name, (columns, body) in queries.items():
+                rows = []
+                if counts[name]:
+                    rows = conn.execute(f"SELECT {columns} {body} ORDER BY key LIMIT :limit", params).fetchall()
+                diff[name] = {'count': counts[name], 'issues': [dict(row) for row in rows]}
+            diff['status_changed']['transitions'] = dict(
+                sorted(transitions.items(), key=lambda item: item[1], reverse=True)
+            )
+            conn.execute("DELETE FROM temp.diff_old")
+            conn.execute("DELETE FROM temp.diff_new")
+            return diff
+
+    def compact(self, keep_days: Optional[int] = None, downsample_after_days: Optional[int] = None,
+                vacuum: bool = True) -> dict:
+        """Prune old reports, keep one report per day past a cutoff, drop unused versions and VACUUM
+
+        The newest report of every JQL is always kept.
+        """
+        now = datetime.utcnow()
+        with self._lock, self.timings.span('storage.compact'):
+            with self.conn:
+                latest = "(SELECT MAX(seq) FROM reports r2 WHERE r2.series_id = reports.series_id)"
+                removed_reports = 0
+                if keep_days is not None:
+                    removed_reports += self.conn.execute(
+                        f"DELETE FROM reports WHERE created_at < ? AND seq != {latest}",
+                        (now - timedelta(days=keep_days),)
+                    ).rowcount
+                if downsample_after_days is not None:
+                    # Keep the last report of each day for every JQL once reports pass the cutoff
+                    removed_reports += self.conn.execute(f"""
+                        DELETE FROM reports
+                        WHERE created_at < ? AND seq != {latest} AND seq NOT IN (
+                            SELECT MAX(seq) FROM reports GROUP BY series_id, date(created_at)
+                        )
+                    """, (now - timedelta(days=downsample_after_days),)).rowcount
+
+                # A version is still needed if some remaining report of its series falls in its interval
+                removed_versions = self.conn.execute("""
+                    DELETE FROM issue_versions
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM reports r
+                        WHERE r.series_id = issue_versions.series_id
+                          AND r.seq >= issue_versions.valid_from
+                          AND (issue_versions.valid_to IS NULL OR r.seq < issue_versions.valid_to)
+                    )
+                """).rowcount
+                self.conn.execute(
+                    "DELETE FROM report_series WHERE series_id NOT IN (SELECT series_id FROM reports)"
+                )
+            if vacuum:
+                self.conn.execute("VACUUM")
+        return {'removed_reports': removed_reports, 'removed_versions': removed_versions}
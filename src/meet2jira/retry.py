@@ -0,0 +1,205 @@
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+import requests
+from .config import setting
+from .timings import RunRecorder
+
+# Statuses meaning the server refused the request without acting on it, so even creates can be retried
+REFUSED_STATUSES = {429, 503}
+
+# Statuses worth retrying for reads; a create may already have happened behind them
+TRANSIENT_STATUSES = {500, 502, 504}
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a service that has failed repeatedly, until its reset timeout passes"""
+
+class TokenBucket:
+    """Client-side rate limiter shared by every thread of a client
+
+    Callers reserve a token and sleep for however long it takes to refill,
+    so concurrent callers queue at the configured rate instead of all
+    waking at once. pause() empties the bucket when the server asks
+    everyone to slow down.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds the caller must wait before using it"""
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def pause(self, seconds: float):
+        """Hold back every caller for at least seconds"""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+class CircuitBreaker:
+    """Stop calling a service after failure_threshold consecutive failures, then probe it once per reset_timeout"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def before_call(self):
+        """Raise CircuitOpenError while open; once the timeout passes let a single probe call through"""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0 or self._probing:
+                raise CircuitOpenError(f"Jira unavailable after {self.failures} consecutive failures; "
+                                       f"not retrying for another {max(remaining, 0):.0f}s")
+            self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+def _status(error: Exception) -> Optional[int]:
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None)
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Seconds requested by a Retry-After header (delta-seconds or HTTP date), if the error carries one"""
+    response = getattr(error, 'response', None)
+    value = response.headers.get('Retry-After') if response is not None and response.headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+def is_retryable(error: Exception, idempotent: bool = True) -> bool:
+    """Whether a failed request may be sent again
+
+    Non-idempotent requests (creates) are only retried when the server
+    certainly did not act on them: 429/503 responses and connections that
+    were never established.
+    """
+    status = _status(error)
+    if isinstance(error, requests.HTTPError) and status is not None:
+        return status in REFUSED_STATUSES or (idempotent and status in TRANSIENT_STATUSES)
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return idempotent
+    return False
+
+class RetryPolicy:
+    """Retry layer for Jira calls: rate limiting, Retry-After, jittered exponential backoff and a circuit breaker"""
+
+    def __init__(self, max_retries: int = 3, retry_delay: float = 5.0, max_delay: float = 60.0,
+                 limiter: Optional[TokenBucket] = None, breaker: Optional[CircuitBreaker] = None,
+                 timings: Optional[RunRecorder] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_delay = max_delay
+        self.limiter = limiter
+        self.breaker = breaker
+        self.timings = timings or RunRecorder(enabled=False)
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], timings: Optional[RunRecorder] = None) -> 'RetryPolicy':
+        """Build the policy from app.max_retries/retry_delay/max_retry_delay and the jira rate limit settings"""
+        rate = float(setting(settings, 'jira.rate_limit.requests_per_second', 10))
+        burst = float(setting(settings, 'jira.rate_limit.burst', 0)) or None
+        threshold = int(setting(settings, 'jira.circuit_breaker.failure_threshold', 5))
+        reset_timeout = float(setting(settings, 'jira.circuit_breaker.reset_timeout', 30))
+        return cls(
+            max_retries=int(setting(settings, 'app.max_retries', 3)),
+            retry_delay=float(setting(settings, 'app.retry_delay', 5)),
+            max_delay=float(setting(settings, 'app.max_retry_delay', 60)),
+            limiter=TokenBucket(rate, burst) if rate > 0 else None,
+            breaker=CircuitBreaker(threshold, reset_timeout) if threshold > 0 else None,
+            timings=timings
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number attempt (0-based): half fixed, half random, doubling up to max_delay"""
+        delay = min(self.max_delay, self.retry_delay * 2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _wait(self, stage: str, seconds: float, **attrs):
+        with self.timings.span(stage, **attrs):
+            time.sleep(seconds)
+
+    def call(self, func: Callable, *args, idempotent: bool = True, **kwargs):
+        """Call func, retrying transient failures; the last error is raised once retries run out"""
+        attempt = 0
+        while True:
+            if self.breaker is not None:
+                self.breaker.before_call()
+            if self.limiter is not None:
+                wait = self.limiter.reserve()
+                if wait:
+                    self._wait('jira.throttle', wait)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                status = _status(e)
+                retryable = is_retryable(e, idempotent)
+                # Client errors mean Jira is up; rate limiting is handled by slowing down, not by tripping
+                if self.breaker is not None:
+                    if retryable and status != 429:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                requested = retry_after(e)
+                delay = requested if requested is not None else self.backoff(attempt)
+                if self.limiter is not None and status == 429:
+                    self.limiter.pause(delay)
+                attempt += 1
+                self.logger.warning(f"Jira request failed ({status or type(e).__name__}); "
+                                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                self._wait('jira.backoff', delay, status=status, attempt=attempt)
+            else:
+                if self.breaker is not None:
+                    self.breaker.record_success()
+                return result
@@ -0,0 +1,175 @@
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+# Run states, in the order a run moves through them; a failure only records the error
+PARSING = 'parsing'
+PARSED = 'parsed'
+COMPLETED = 'completed'
+
+class RunJournal:
+    """SQLite journal of transcript runs so an interrupted run resumes instead of starting over
+
+    A run records its transcript and model, each parsed issue as it
+    arrives, every approval decision, and for approved issues whether
+    creation is in flight, succeeded (with the Jira key) or failed. Issues
+    are marked as in flight before the create request is sent. After a
+    crash, the issues left in flight are exactly the ones whose outcome
+    must be checked in Jira before anything is created again.
+    """
+
+    def __init__(self, db_path: str = "meet2jira_reports.db"):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    transcript TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    error TEXT,
+                    created_at TIMESTAMP NOT NULL,
+                    updated_at TIMESTAMP NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS run_issues (
+                    run_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    issue TEXT NOT NULL,
+                    approved INTEGER,
+                    creating_since TIMESTAMP,
+                    issue_key TEXT,
+                    issue_url TEXT,
+                    error TEXT,
+                    PRIMARY KEY (run_id, position)
+                ) WITHOUT ROWID
+            """)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def _set_status(self, run_id: str, status: str, error: Optional[str] = None):
+        self.conn.execute("UPDATE runs SET status = ?, error = ?, updated_at = ? WHERE run_id = ?",
+                          (status, error, datetime.utcnow(), run_id))
+
+    def start_run(self, transcript: str, model: str) -> str:
+        """Record a new run and return its id"""
+        run_id = uuid.uuid4().hex[:12]
+        now = datetime.utcnow()
+        with self._lock, self.conn:
+            self.conn.execute("INSERT INTO runs VALUES (?, ?, ?, ?, NULL, ?, ?)",
+                              (run_id, model, transcript, PARSING, now, now))
+        return run_id
+
+    def get_run(self, run_id: str) -> Optional[Dict]:
+        """Run metadata ({'run_id', 'model', 'transcript', 'status', 'error', ...}), or None if unknown"""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def restart_parsing(self, run_id: str):
+        """Forget issues (and decisions) from a parse that did not finish"""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM run_issues WHERE run_id = ?", (run_id,))
+            self._set_status(run_id, PARSING)
+
+    def add_issues(self, run_id: str, issues: Iterable[Dict], start: int = 1):
+        """Record parsed issues at consecutive 1-based positions from start"""
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO run_issues (run_id, position, issue) VALUES (?, ?, ?)",
+                [(run_id, position, json.dumps(issue, default=str)) for position, issue in enumerate(issues, start)]
+            )
+
+    def mark_parsed(self, run_id: str):
+        with self._lock, self.conn:
+            self._set_status(run_id, PARSED)
+
+    def issues(self, run_id: str) -> List[Dict]:
+        """The run's parsed issues in proposal order"""
+        with self._lock:
+            rows = self.conn.execute("SELECT issue FROM run_issues WHERE run_id = ? ORDER BY position",
+                                     (run_id,)).fetchall()
+        return [json.loads(row['issue']) for row in rows]
+
+    def decisions(self, run_id: str) -> Dict[int, bool]:
+        """Approval decisions already made, by 1-based proposal position"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT position, approved FROM run_issues WHERE run_id = ? AND approved IS NOT NULL", (run_id,)
+            ).fetchall()
+        return {row['position']: bool(row['approved']) for row in rows}
+
+    def record_decision(self, run_id: str, position: int, approved: bool):
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE run_issues SET approved = ? WHERE run_id = ? AND position = ?",
+                              (int(approved), run_id, position))
+
+    def created(self, run_id: str) -> Dict[int, Dict]:
+        """Issues created so far as {position: {'key', 'self'}}"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT position, issue_key, issue_url FROM run_issues "
+                "WHERE run_id = ? AND issue_key IS NOT NULL ORDER BY position", (run_id,)
+            ).fetchall()
+        return {row['position']: {'key': row['issue_key'], 'self': row['issue_url']} for row in rows}
+
+    def in_flight(self, run_id: str) -> Dict[int, datetime]:
+        """Issues whose create request was sent without its outcome being recorded, with the send time"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT position, creating_since FROM run_issues "
+                "WHERE run_id = ? AND creating_since IS NOT NULL AND issue_key IS NULL", (run_id,)
+            ).fetchall()
+        return {row['position']: datetime.fromisoformat(str(row['creating_since'])) for row in rows}
+
+    def mark_creating(self, run_id: str, positions: Iterable[int]):
+        now = datetime.utcnow()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "UPDATE run_issues SET creating_since = ?, error = NULL WHERE run_id = ? AND position = ?",
+                [(now, run_id, position) for position in positions]
+            )
+
+    def record_created(self, run_id: str, position: int, key: str, url: Optional[str] = None):
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE run_issues SET issue_key = ?, issue_url = ?, creating_since = NULL "
+                              "WHERE run_id = ? AND position = ?", (key, url, run_id, position))
+
+    def record_error(self, run_id: str, position: int, error: str):
+        """Record a create request Jira answered with an error, so a resume retries it"""
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE run_issues SET error = ?, creating_since = NULL "
+                              "WHERE run_id = ? AND position = ?", (error, run_id, position))
+
+    def prune(self, keep_days: int) -> int:
+        """Delete completed runs (transcript included) last touched more than keep_days ago"""
+        cutoff = datetime.utcnow() - timedelta(days=keep_days)
+        with self._lock, self.conn:
+            run_ids = [(row['run_id'],) for row in self.conn.execute(
+                "SELECT run_id FROM runs WHERE status = ? AND updated_at < ?", (COMPLETED, cutoff))]
+            self.conn.executemany("DELETE FROM run_issues WHERE run_id = ?", run_ids)
+            self.conn.executemany("DELETE FROM runs WHERE run_id = ?", run_ids)
+        return len(run_ids)
+
+    def finish_run(self, run_id: str, error: Optional[str] = None):
+        """Mark the run completed, or record the error that stopped it and leave it resumable"""
+        with self._lock, self.conn:
+            if error:
+                self.conn.execute("UPDATE runs SET error = ?, updated_at = ? WHERE run_id = ?",
+                                  (error, datetime.utcnow(), run_id))
+            else:
+                self._set_status(run_id, COMPLETED)
@@ -0,0 +1,218 @@
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8642
+
+class QueueFullError(Exception):
+    """Raised when the daemon's job queue has no room for another request"""
+
+class BadRequestError(Exception):
+    """Raised when a request payload is malformed or misses a required field"""
+
+class JobQueue:
+    """Bounded queue feeding a fixed pool of workers that share one warm orchestrator"""
+
+    def __init__(self, workers: int = 1, max_pending: int = 32):
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='meet2jira-job')
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+
+    def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Queue a job and block the calling request thread until it finishes"""
+        with self._lock:
+            if self.pending + self.running >= self.max_pending:
+                raise QueueFullError(f"Job queue is full ({self.max_pending} jobs)")
+            self.pending += 1
+        return self._executor.submit(self._execute, func, args, kwargs).result()
+
+    def _execute(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            self.pending -= 1
+            self.running += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+class Metrics:
+    """Request counters and latency totals exposed at GET /metrics"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests = Counter()
+        self.errors = Counter()
+        self.seconds = Counter()
+
+    def observe(self, endpoint: str, seconds: float, error: bool = False):
+        with self._lock:
+            self.requests[endpoint] += 1
+            self.seconds[endpoint] += seconds
+            if error:
+                self.errors[endpoint] += 1
+
+    def render(self, queue: JobQueue, cache_stats: Optional[dict] = None) -> str:
+        """Render the metrics in the Prometheus text format"""
+        lines = [
+            f"meet2jira_uptime_seconds {time.time() - self.started:.3f}",
+            f"meet2jira_jobs_pending {queue.pending}",
+            f"meet2jira_jobs_running {queue.running}"
+        ]
+        with self._lock:
+            for endpoint in sorted(self.requests):
+                labels = f'{{endpoint="{endpoint}"}}'
+                lines.append(f"meet2jira_requests_total{labels} {self.requests[endpoint]}")
+                lines.append(f"meet2jira_request_errors_total{labels} {self.errors[endpoint]}")
+                lines.append(f"meet2jira_request_seconds_sum{labels} {self.seconds[endpoint]:.3f}")
+        if cache_stats is not None:
+            lines.append(f"meet2jira_llm_cache_hits_total {cache_stats['hits']}")
+            lines.append(f"meet2jira_llm_cache_misses_total {cache_stats['misses']}")
+        return "\n".join(lines) + "\n"
+
+class Meet2JiraServer:
+    """Local HTTP daemon that keeps the orchestrator, Jira session, SQLite connection and model warm"""
+
+    def __init__(self, orchestrator, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, model: str = 'llama2',
+                 workers: int = 1, max_pending: int = 32):
+        self.logger = logging.getLogger(__name__)
+        self.orchestrator = orchestrator
+        self.model = model
+        self.queue = JobQueue(workers=workers, max_pending=max_pending)
+        self.metrics = Metrics()
+        self.httpd = ThreadingHTTPServer((host, port), _RequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.app = self
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.httpd.server_address[:2]
+
+    def handle_transcript(self, payload: dict) -> dict:
+        """Parse a transcript into proposed issues, creating the approved ones when "approve" is given"""
+        transcript = payload.get('transcript')
+        if not transcript or not isinstance(transcript, str):
+            raise BadRequestError("'transcript' is required")
+        approve = payload.get('approve')
+        if approve is not None:
+            approve = str(approve)
+            try:
+                self.orchestrator.parse_selection(approve)
+            except ValueError as e:
+                raise BadRequestError(str(e)) from None
+        results, _ = self.queue.run(
+            self.orchestrator.process_transcript, transcript, model=payload.get('model', self.model),
+            dry_run=approve is None, approve=approve
+        )
+        return {'created': results} if approve is not None else {'issues': results}
+
+    def handle_report(self, payload: dict) -> dict:
+        """Generate a status report for a JQL query"""
+        jql = payload.get('jql')
+        if not jql or not isinstance(jql, str):
+            raise BadRequestError("'jql' is required")
+        max_issues = payload.get('max_issues')
+        if max_issues is not None and (not isinstance(max_issues, int) or max_issues < 1):
+            raise BadRequestError("'max_issues' must be a positive integer")
+        return self.queue.run(
+            self.orchestrator.generate_status_report, jql, model=payload.get('model', self.model),
+            max_issues=max_issues, incremental=payload.get('incremental', False)
+        )
+
+    def render_metrics(self) -> str:
+        cache = self.orchestrator.cache
+        return self.metrics.render(self.queue, cache.stats() if cache is not None else None)
+
+    def serve_forever(self):
+        """Warm the pipeline, then serve requests until interrupted"""
+        self.orchestrator.start_ollama()
+        self.orchestrator.warm_up(self.model)
+        host, port = self.address
+        self.logger.info(f"meet2jira daemon listening on http://{host}:{port}")
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        self.httpd.server_close()
+        self.queue.shutdown()
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    routes = {'/transcripts': 'handle_transcript', '/reports': 'handle_report'}
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug(format % args)
+
+    def _send(self, status: int, body: str, content_type: str = 'application/json'):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status: int, payload: Any):
+        self._send(status, json.dumps(payload, default=str))
+
+    def do_GET(self):
+        app = self.server.app
+        if self.path == '/metrics':
+            self._send(200, app.render_metrics(), 'text/plain; version=0.0.4')
+        elif self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        else:
+            self._send_json(404, {'error': f"Unknown path: {self.path}"})
+
+    def _read_payload(self) -> dict:
+        """Decode the JSON request body; only problems with the body itself are client errors"""
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            raise BadRequestError(f"Invalid JSON body: {str(e)}") from None
+        if not isinstance(payload, dict):
+            raise BadRequestError("The request body must be a JSON object")
+        return payload
+
+    def do_POST(self):
+        app = self.server.app
+        handler = self.routes.get(self.path)
+        if handler is None:
+            self._send_json(404, {'error': f"Unknown path: {self.path}"})
+            return
+
+        started = time.monotonic()
+        status = 200
+        try:
+            response = getattr(app, handler)(self._read_payload())
+        except BadRequestError as e:
+            status, response = 400, {'error': str(e)}
+        except QueueFullError as e:
+            status, response = 503, {'error': str(e)}
+        except Exception as e:
+            app.logger.error(f"Request to {self.path} failed: {str(e)}")
+            status, response = 500, {'error': str(e)}
+        app.metrics.observe(self.path, time.monotonic() - started, error=status != 200)
+        self._send_json(status, response)
+
+def forward(server_url: str, path: str, payload: dict, timeout: float = 3600) -> Dict[str, Any]:
+    """Send a request to a running daemon and return its JSON response"""
+    import requests
+    response = requests.post(f"{server_url.rstrip('/')}{path}", json=payload, timeout=timeout)
+    body = response.json()
+    if not response.ok:
+        raise RuntimeError(f"meet2jira daemon returned {response.status_code}: {body.get('error')}")
+    return body
@@ -0,0 +1,68 @@
+import json
+from typing import Any, Dict, List, Optional
+
+class IssueStreamDecoder:
+    """Incrementally scan a streamed JSON response and emit each object of its top-level "issues" array as soon as it closes"""
+
+    def __init__(self, array_key: str = "issues"):
+        self.array_key = array_key
+        self.text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = None
+        self._last_string = None
+        self._key = None
+        self._array_depth = None
+        self._object_start = None
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume the next piece of the response and return any issues it completed"""
+        self.text += chunk
+        completed = []
+        text = self.text
+        while self._pos < len(text):
+            ch = text[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = text[self._string_start:self._pos + 1]
+            elif ch == '"':
+                self._in_string = True
+                self._string_start = self._pos
+            elif ch == ":" and self._depth == 1 and self._last_string is not None:
+                self._key = json.loads(self._last_string)
+            elif ch == "," and self._depth == 1:
+                self._key = None
+            elif ch in "{[":
+                if ch == "[" and self._depth == 1 and self._key == self.array_key:
+                    self._array_depth = self._depth + 1
+                elif ch == "{" and self._array_depth is not None and self._depth == self._array_depth:
+                    self._object_start = self._pos
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if ch == "}" and self._object_start is not None and self._depth == self._array_depth:
+                    issue = self._decode_object(text[self._object_start:self._pos + 1])
+                    if issue is not None:
+                        completed.append(issue)
+                    self._object_start = None
+                elif ch == "]" and self._array_depth is not None and self._depth == self._array_depth - 1:
+                    self._array_depth = None
+            self._pos += 1
+        return completed
+
+    @staticmethod
+    def _decode_object(fragment: str) -> Optional[Dict[str, Any]]:
+        """Decode a completed array element, ignoring anything that isn't a JSON object"""
+        try:
+            value = json.loads(fragment)
+        except json.JSONDecodeError:
+            return None
+        return value if isinstance(value, dict) else None
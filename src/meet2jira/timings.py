@@ -0,0 +1,106 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# Ollama reports durations in nanoseconds
+_NS = 1e9
+
+class RunRecorder:
+    """Collect per-stage timing spans and Ollama token counts for one run
+
+    A disabled recorder (the default for every component) records nothing,
+    so instrumented code can always call span() and record_llm().
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.spans = []
+        self.llm_calls = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Dict[str, Any]]:
+        """Time a block; the yielded dict can be updated with attributes known only at the end"""
+        if not self.enabled:
+            yield attrs
+            return
+        started = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            span = dict(attrs, name=name, start=started - self.started, seconds=time.perf_counter() - started)
+            with self._lock:
+                self.spans.append(span)
+
+    def record_llm(self, response: Any, model: str, kind: str):
+        """Keep the token counts and durations Ollama returns with a completed generate call"""
+        if not self.enabled or response is None:
+            return
+        def field(name: str) -> int:
+            value = response.get(name) if hasattr(response, 'get') else getattr(response, name, None)
+            return value or 0
+        call = {
+            'model': model,
+            'kind': kind,
+            'prompt_tokens': field('prompt_eval_count'),
+            'eval_tokens': field('eval_count'),
+            'prompt_eval_seconds': field('prompt_eval_duration') / _NS,
+            'eval_seconds': field('eval_duration') / _NS,
+            'load_seconds': field('load_duration') / _NS,
+            'total_seconds': field('total_duration') / _NS
+        }
+        with self._lock:
+            self.llm_calls.append(call)
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate the run into the structured record printed by --timings and written as JSON"""
+        with self._lock:
+            spans = list(self.spans)
+            calls = list(self.llm_calls)
+        stages = {}
+        for span in sorted(spans, key=lambda s: s['start']):
+            stage = stages.setdefault(span['name'], {'count': 0, 'seconds': 0.0})
+            stage['count'] += 1
+            stage['seconds'] += span['seconds']
+
+        llm = {key: sum(call[key] for call in calls) for key in (
+            'prompt_tokens', 'eval_tokens', 'prompt_eval_seconds', 'eval_seconds', 'load_seconds', 'total_seconds'
+        )}
+        llm['calls'] = len(calls)
+        llm['prompt_tokens_per_second'] = _rate(llm['prompt_tokens'], llm['prompt_eval_seconds'])
+        llm['eval_tokens_per_second'] = _rate(llm['eval_tokens'], llm['eval_seconds'])
+        return {
+            'total_seconds': time.perf_counter() - self.started,
+            'stages': stages,
+            'llm': llm,
+            'llm_calls': calls,
+            'spans': spans
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.summary(), indent=2, default=str)
+
+    def format_table(self) -> str:
+        """Render the summary as a short human-readable table"""
+        summary = self.summary()
+        lines = [f"{'STAGE':<28} {'CALLS':>6} {'SECONDS':>9}"]
+        for name, stage in summary['stages'].items():
+            lines.append(f"{name:<28} {stage['count']:>6} {stage['seconds']:>9.3f}")
+        llm = summary['llm']
+        if llm['calls']:
+            lines.append(
+                f"LLM: {llm['calls']} calls, {llm['prompt_tokens']} prompt tokens "
+                f"({_format_rate(llm['prompt_tokens_per_second'])}), {llm['eval_tokens']} generated tokens "
+                f"({_format_rate(llm['eval_tokens_per_second'])}), load {llm['load_seconds']:.2f}s"
+            )
+        lines.append(f"Total: {summary['total_seconds']:.3f}s")
+        return "\n".join(lines)
+
+def _rate(tokens: int, seconds: float) -> Optional[float]:
+    return tokens / seconds if seconds else None
+
+def _format_rate(rate: Optional[float]) -> str:
+    return f"{rate:.1f} tok/s" if rate is not None else "rate unknown"
@@ -0,0 +1,56 @@
+import math
+import threading
+from typing import Dict, Optional
+
+# Tokens reserved for the model's answer on top of the prompt
+EXTRACT_OUTPUT_TOKENS = 2048
+REPORT_OUTPUT_TOKENS = 1024
+
+# Smallest context requested; Ollama's own default is 2048
+MIN_CONTEXT = 2048
+
+class TokenEstimator:
+    """Estimate prompt tokens from text length and size num_ctx to fit the request
+
+    There is no tokenizer endpoint in the Ollama API, so estimates use a
+    characters-per-token ratio. The ratio starts at a conservative English
+    average and is calibrated per model from the prompt_eval_count Ollama
+    returns with each response.
+    """
+
+    def __init__(self, chars_per_token: float = 3.5, smoothing: float = 0.3):
+        self.default_chars_per_token = chars_per_token
+        self.smoothing = smoothing
+        self._ratios: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def chars_per_token(self, model: Optional[str] = None) -> float:
+        return self._ratios.get(model, self.default_chars_per_token)
+
+    def estimate(self, text: str, model: Optional[str] = None) -> int:
+        """Estimated token count of text for the given model"""
+        return math.ceil(len(text) / self.chars_per_token(model))
+
+    def calibrate(self, model: str, characters: int, prompt_tokens: Optional[int]):
+        """Fold an observed prompt_eval_count into the model's characters-per-token ratio"""
+        if not prompt_tokens or characters < 200:
+            return
+        observed = characters / prompt_tokens
+        # A prompt served partly from Ollama's prefix cache reports fewer evaluated tokens; ignore those
+        if not 0.5 * self.chars_per_token(model) <= observed <= 2 * self.chars_per_token(model):
+            return
+        with self._lock:
+            current = self._ratios.get(model, observed)
+            self._ratios[model] = current + self.smoothing * (observed - current)
+
+    @staticmethod
+    def context_size(tokens: int, max_ctx: int) -> int:
+        """Round a token requirement up to a power of two, capped at max_ctx
+
+        Ollama reloads the model whenever num_ctx changes, so a handful of
+        buckets keeps back-to-back requests on the already-loaded runner.
+        """
+        size = MIN_CONTEXT
+        while size < tokens:
+            size *= 2
+        return min(size, max_ctx)
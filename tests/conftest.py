@@ -0,0 +1,6 @@
+import pytest
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    # Orchestrators cache responses by default; keep tests out of the real ~/.cache
+    monkeypatch.setenv('MEET2JIRA_CACHE_DIR', str(tmp_path / 'cache'))
@@ -0,0 +1,45 @@
+from datetime import datetime, timezone
+from meet2jira.aggregation import ReportAggregator
+
+class TestReportAggregator:
+    def issue(self, key, status='To Do', assignee=None, priority='Major', updated='2024-03-01T10:00:00.000+0000'):
+        return {'key': key, 'status': status, 'assignee': assignee, 'summary': f'Summary {key}',
+                'priority': priority, 'created': '2024-01-01T10:00:00.000+0000', 'updated': updated}
+
+    def test_counts_and_changes(self):
+        """Test counts are exact and snapshot changes are folded into the context"""
+        aggregator = ReportAggregator(now=datetime(2024, 3, 2, tzinfo=timezone.utc))
+        aggregator.add(self.issue('T-1', status='Done', assignee='Ana'))
+        aggregator.add(self.issue('T-2', assignee='Ben', priority='Blocker'))
+        aggregator.add(self.issue('T-4', assignee='Ben'))
+        changes = {
+            'added': {'count': 1, 'issues': [{'key': 'T-4'}]},
+            'removed': {'count': 1, 'issues': [{'key': 'T-3'}]},
+            'status_changed': {'count': 1, 'issues': [{'key': 'T-1'}], 'transitions': {'To Do -> Done': 1}},
+            'reassigned': {'count': 1, 'issues': [{'key': 'T-2'}]}
+        }
+        context = aggregator.build({'created_at': '2024-03-01 09:00:00'}, changes)
+
+        assert context['issue_count'] == 3
+        assert context['counts']['by_status'] == {'To Do': 2, 'Done': 1}
+        assert context['open_issues_by_assignee'] == {'Ben': 2}
+        assert context['open_high_priority']['count'] == 1
+        assert context['stale_issues']['count'] == 0
+        assert context['changes']['status_changed']['transitions'] == {'To Do -> Done': 1}
+        assert context['previous_report'] == {'created_at': '2024-03-01 09:00:00', 'issue_count': 3}
+
+    def test_context_size_is_bounded(self):
+        """Test the context stays bounded regardless of issue count"""
+        aggregator = ReportAggregator(now=datetime(2024, 6, 1, tzinfo=timezone.utc), max_items=5, max_groups=3)
+        for i in range(2000):
+            aggregator.add(self.issue(f'T-{i}', assignee=f'user{i % 50}', priority='High',
+                                      updated=f'2024-01-{i % 28 + 1:02d}T00:00:00.000+0000'))
+        context = aggregator.build()
+
+        assert context['stale_issues']['count'] == 2000
+        assert len(context['stale_issues']['stalest']) == 5
+        assert context['stale_issues']['stalest'][0]['days_since_update'] >= 150
+        assert len(context['counts']['by_assignee']) == 4
+        assert context['counts']['by_assignee']['(other)'] == 2000 - 3 * 40
+        assert len(context['open_high_priority']['issues']) == 5
+        assert 'changes' not in context
@@ -0,0 +1,50 @@
+import pytest
+from unittest.mock import patch
+from meet2jira.cache import ResponseCache
+
+class TestResponseCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ResponseCache(db_path=str(tmp_path / 'cache.db'))
+
+    def test_get_miss_then_hit(self, cache):
+        """Test stored responses are returned and counted"""
+        key = cache.make_key('digest', 'prompt', {'num_ctx': 1024}, 'json')
+        assert cache.get(key) is None
+        cache.put(key, '{"issues": []}')
+
+        assert cache.get(key) == '{"issues": []}'
+        assert cache.stats() == {'hits': 1, 'misses': 1}
+
+    def test_key_depends_on_inputs(self, cache):
+        """Test any change in model digest, prompt or options changes the key"""
+        base = cache.make_key('digest', 'prompt', {'num_ctx': 1024}, None)
+        assert base == cache.make_key('digest', 'prompt', {'num_ctx': 1024}, None)
+        assert base != cache.make_key('other-digest', 'prompt', {'num_ctx': 1024}, None)
+        assert base != cache.make_key('digest', 'prompt 2', {'num_ctx': 1024}, None)
+        assert base != cache.make_key('digest', 'prompt', {'num_ctx': 2048}, None)
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Test entries older than the TTL are treated as misses"""
+        cache = ResponseCache(db_path=str(tmp_path / 'cache.db'), ttl=60)
+        with patch('meet2jira.cache.time.time', return_value=1000.0):
+            cache.put('key', 'value')
+        with patch('meet2jira.cache.time.time', return_value=1061.0):
+            assert cache.get('key') is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted beyond max_bytes"""
+        cache = ResponseCache(db_path=str(tmp_path / 'cache.db'), max_bytes=10)
+        with patch('meet2jira.cache.time.time', return_value=1000.0):
+            cache.put('a', 'aaaa')
+        with patch('meet2jira.cache.time.time', return_value=1001.0):
+            cache.put('b', 'bbbb')
+        with patch('meet2jira.cache.time.time', return_value=1002.0):
+            cache.get('a')
+        with patch('meet2jira.cache.time.time', return_value=1003.0):
+            cache.put('c', 'cccc')
+
+        with patch('meet2jira.cache.time.time', return_value=1004.0):
+            assert cache.get('a') == 'aaaa'
+            assert cache.get('b') is None
+            assert cache.get('c') == 'cccc'
@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from meet2jira.cli import main
@@ -5,7 +6,7 @@ from meet2jira.cli import main
 class TestCLI:
     @pytest.fixture
     def mock_orchestrator(self):
-        with patch('meet2jira.cli.Meet2JiraOrchestrator') as mock:
+        with patch('meet2jira.orchestrator.Meet2JiraOrchestrator') as mock:
             mock_instance = MagicMock()
             mock.return_value = mock_instance
             mock_instance.process_transcript.return_value = ([{
@@ -31,7 +32,7 @@ class TestCLI:
         args, kwargs = mock_orchestrator.process_transcript.call_args
         assert len(args) == 1  # Should have one positional argument (file object)
         assert isinstance(args[0], MagicMock)  # Verify file object was passed
-        assert kwargs == {'model': 'test-model', 'dry_run': False}
+        assert kwargs == {'model': 'test-model', 'dry_run': False, 'approve': None}
         captured = capsys.readouterr()
         assert 'Created 1 Jira issues:' in captured.out
         assert 'TEST-123: https://example.com/issue/TEST-123' in captured.out
@@ -45,7 +46,8 @@ class TestCLI:
         mock_orchestrator.process_transcript.assert_called_once_with(
             'direct text',
             model='test-model',
-            dry_run=False
+            dry_run=False,
+            approve=None
         )
 
     def test_cli_missing_arguments(self, capsys):
@@ -69,7 +71,7 @@ class TestCLI:
         args, kwargs = mock_orchestrator.process_transcript.call_args
         assert len(args) == 1  # Should have one positional argument (file object)
         assert isinstance(args[0], MagicMock)  # Verify file object was passed
-        assert kwargs == {'model': 'test-model', 'dry_run': True}
+        assert kwargs == {'model': 'test-model', 'dry_run': True, 'approve': None}
         captured = capsys.readouterr()
         assert 'Would create 1 Jira issues:' in captured.out
         assert 'Title: Test issue' in captured.out
@@ -118,3 +120,160 @@ class TestCLI:
         
         captured = capsys.readouterr()
         assert '--transcript and --report are mutually exclusive' in captured.err
+
+    def test_cli_batch_mode(self, mock_orchestrator, tmp_path, capsys):
+        """Test batch mode collects transcripts from a directory"""
+        (tmp_path / 'one.txt').write_text('one')
+        (tmp_path / 'two.txt').write_text('two')
+        (tmp_path / 'notes.md').write_text('skip')
+        mock_orchestrator.process_batch.return_value = {
+            'processed': 2, 'failed': 0, 'elapsed_seconds': 30.0, 'transcripts_per_minute': 4.0
+        }
+        test_args = ['meet2jira', '--transcript-dir', str(tmp_path), '--pattern', '*.txt',
+                     '--dry-run', '--workers', '3']
+        with patch('sys.argv', test_args):
+            main()
+
+        args, kwargs = mock_orchestrator.process_batch.call_args
+        assert args[0] == [str(tmp_path / 'one.txt'), str(tmp_path / 'two.txt')]
+        assert kwargs['dry_run'] is True
+        assert kwargs['max_workers'] == 3
+        captured = capsys.readouterr()
+        assert '4.00 transcripts/minute' in captured.err
+
+    def test_cli_batch_requires_approval_mode(self, capsys):
+        """Test batch mode refuses to prompt for approvals"""
+        test_args = ['meet2jira', '--transcript-dir', '.']
+        with patch('sys.argv', test_args), pytest.raises(SystemExit):
+            main()
+
+        captured = capsys.readouterr()
+        assert 'Batch mode requires --dry-run or --yes' in captured.err
+
+    def test_cli_sync_duplicates_needs_duplicate_check(self, mock_orchestrator, capsys):
+        """Test syncing the duplicate index is refused when duplicate checks are turned off"""
+        test_args = ['meet2jira', '--sync-duplicates', 'project = APP', '--no-duplicate-check']
+        with patch('sys.argv', test_args), pytest.raises(SystemExit):
+            main()
+
+        mock_orchestrator.sync_duplicate_index.assert_not_called()
+        assert '--sync-duplicates builds the duplicate index' in capsys.readouterr().err
+
+    def test_cli_compact_reports(self, mock_orchestrator, capsys):
+        """Test report compaction runs without starting the orchestrator"""
+        test_args = ['meet2jira', '--compact-reports', '--keep-days', '30', '--downsample-after-days', '7']
+        with patch('sys.argv', test_args), patch('meet2jira.report_storage.ReportStorage') as mock_storage, \
+             patch('meet2jira.run_journal.RunJournal') as mock_journal:
+            mock_storage.return_value.compact.return_value = {'removed_reports': 3, 'removed_versions': 12}
+            mock_journal.return_value.prune.return_value = 2
+            main()
+
+        mock_storage.return_value.compact.assert_called_once_with(keep_days=30, downsample_after_days=7)
+        mock_journal.return_value.prune.assert_called_once_with(30)
+        mock_orchestrator.process_transcript.assert_not_called()
+        output = capsys.readouterr().out
+        assert 'Removed 3 reports and 12 stored issue versions' in output
+        assert 'Removed 2 completed transcript runs' in output
+
+    def test_cli_resident_keep_alive(self):
+        """Test --resident and --keep-alive reach the orchestrator"""
+        test_args = ['meet2jira', '--transcript', 'direct text', '--resident', '--keep-alive', '-1']
+        with patch('sys.argv', test_args), patch('meet2jira.orchestrator.Meet2JiraOrchestrator') as mock_class:
+            mock_class.return_value.process_transcript.return_value = ([], '')
+            main()
+
+        kwargs = mock_class.call_args.kwargs
+        assert kwargs['resident'] is True
+        assert kwargs['keep_alive'] == -1
+
+    def test_cli_relevance_filter_builds_preprocessor(self):
+        """Test --relevance-filter hands the orchestrator a preprocessor with the given keywords"""
+        test_args = ['meet2jira', '--transcript', 'direct text', '--relevance-filter', 'deploy, rollback']
+        with patch('sys.argv', test_args), patch('meet2jira.orchestrator.Meet2JiraOrchestrator') as mock_class:
+            mock_class.return_value.process_transcript.return_value = ([], '')
+            main()
+
+        preprocessor = mock_class.call_args.kwargs['preprocessor']
+        assert preprocessor.keywords == ['deploy', 'rollback']
+
+    def test_cli_report_set(self, mock_orchestrator, tmp_path, capsys):
+        """Test --report-set loads the YAML file and prints every report"""
+        path = tmp_path / 'reports.yaml'
+        path.write_text("- name: Platform\n  jql: component = Platform\n- name: Web\n  jql: labels = web\n")
+        mock_orchestrator.generate_report_set.return_value = [
+            {'name': 'Platform', 'jql': 'component = Platform', 'summary': 'Platform summary', 'issue_count': 3},
+            {'name': 'Web', 'jql': 'labels = web', 'error': 'No issues found matching the JQL query'}
+        ]
+
+        with patch('sys.argv', ['meet2jira', '--report-set', str(path), '--workers', '4']):
+            main()
+
+        mock_orchestrator.generate_report_set.assert_called_once_with(
+            [{'name': 'Platform', 'jql': 'component = Platform'}, {'name': 'Web', 'jql': 'labels = web'}],
+            model='llama2', superset=None, max_workers=4)
+        output = capsys.readouterr().out
+        assert '=== Platform ===' in output and 'Platform summary' in output
+        assert 'Error: No issues found matching the JQL query (labels = web)' in output
+
+    def test_cli_resume(self, mock_orchestrator, capsys):
+        """Test --resume continues the run by id and prints the created issues"""
+        mock_orchestrator.resume_run.return_value = ([{'key': 'TEST-5', 'self': 'https://example.com/TEST-5'}], '')
+
+        with patch('sys.argv', ['meet2jira', '--resume', 'abc123', '--yes']):
+            main()
+
+        mock_orchestrator.resume_run.assert_called_once_with('abc123', approve='all')
+        mock_orchestrator.process_transcript.assert_not_called()
+        assert '- TEST-5: https://example.com/TEST-5' in capsys.readouterr().out
+
+    def test_cli_interrupted_run_prints_resume_hint(self, mock_orchestrator, capsys):
+        """Test a failed run tells the user how to resume it"""
+        mock_orchestrator.process_transcript.side_effect = RuntimeError('Jira timed out')
+        mock_orchestrator.last_run_id = 'abc123'
+
+        with patch('sys.argv', ['meet2jira', '--transcript', 'direct text', '--yes']), \
+             pytest.raises(RuntimeError):
+            main()
+
+        assert 'meet2jira --resume abc123' in capsys.readouterr().err
+
+    def test_cli_forwards_to_daemon(self, mock_orchestrator, capsys):
+        """Test --server sends reports to a running daemon instead of building an orchestrator"""
+        test_args = ['meet2jira', '--report', '--jql', 'project = TEST', '--server', 'http://localhost:8642']
+        with patch('sys.argv', test_args), patch('meet2jira.server.forward') as mock_forward, \
+             patch('meet2jira.orchestrator.Meet2JiraOrchestrator') as mock_class:
+            mock_forward.return_value = {'summary': 'Daemon summary', 'issue_count': 2, 'jql': 'project = TEST'}
+            main()
+
+        mock_forward.assert_called_once_with('http://localhost:8642', '/reports', {
+            'jql': 'project = TEST', 'model': 'llama2', 'max_issues': None, 'incremental': False
+        })
+        mock_class.assert_not_called()
+        assert 'Daemon summary' in capsys.readouterr().out
+
+    def test_cli_import_is_lightweight(self):
+        """Test importing the CLI does not load the LLM, Jira or HTTP client libraries"""
+        import subprocess
+        import sys
+        code = ("import sys, meet2jira.cli; "
+                "print(','.join(m for m in ('ollama', 'atlassian', 'requests', 'httpx') if m in sys.modules))")
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                                capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == ''
+        # -X importtime reports "self | cumulative | module" in microseconds on stderr
+        cumulative = next(int(line.split('|')[1]) for line in result.stderr.splitlines()
+                          if line.rstrip().endswith(' meet2jira.cli'))
+        assert cumulative < 250_000
+
+    def test_cli_timings_json(self, mock_orchestrator, tmp_path):
+        """Test --timings-json hands a recorder to the orchestrator and writes its record"""
+        output = tmp_path / 'timings.json'
+        test_args = ['meet2jira', '--transcript', 'direct text', '--dry-run', '--timings-json', str(output)]
+        with patch('sys.argv', test_args), patch('meet2jira.orchestrator.Meet2JiraOrchestrator') as mock_class:
+            mock_class.return_value.process_transcript.return_value = ([], '')
+            main()
+
+        timings = mock_class.call_args.kwargs['timings']
+        assert timings.enabled
+        assert json.loads(output.read_text())['stages'] == {}
@@ -0,0 +1,26 @@
+from meet2jira.config import load_settings, setting
+
+class TestLoadSettings:
+    def test_expands_environment_references(self, tmp_path, monkeypatch):
+        """Test ${VAR:default} references are expanded and single references keep their scalar type"""
+        path = tmp_path / 'settings.yaml'
+        path.write_text("app:\n  max_retries: ${RETRIES:3}\n  retry_delay: ${DELAY:0.5}\n"
+                        "jira:\n  url: ${JIRA_URL}/rest\n  project_key: ${JIRA_PROJECT_KEY}\n")
+        monkeypatch.setenv('RETRIES', '6')
+        monkeypatch.setenv('JIRA_URL', 'https://jira.example.com')
+        monkeypatch.delenv('DELAY', raising=False)
+        monkeypatch.delenv('JIRA_PROJECT_KEY', raising=False)
+
+        settings = load_settings(str(path))
+
+        assert settings['app'] == {'max_retries': 6, 'retry_delay': 0.5}
+        assert settings['jira']['url'] == 'https://jira.example.com/rest'
+        assert setting(settings, 'jira.project_key', 'NONE') == 'NONE'
+        assert setting(settings, 'jira.rate_limit.burst', 20) == 20
+
+    def test_missing_file_gives_empty_settings(self, tmp_path, monkeypatch):
+        """Test defaults apply when no settings file exists"""
+        monkeypatch.delenv('MEET2JIRA_CONFIG', raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        assert load_settings() == {}
@@ -0,0 +1,70 @@
+import pytest
+from datetime import datetime
+from meet2jira.dedupe import DuplicateIndex, shingles
+
+class TestDuplicateIndex:
+    @pytest.fixture
+    def index(self, tmp_path):
+        index = DuplicateIndex(str(tmp_path / 'test.db'))
+        yield index
+        index.close()
+
+    def test_shingles_drop_stopwords_and_case(self):
+        """Test only lower-cased content words are compared"""
+        assert shingles("Fix the Login timeout", "on the mobile app") == {'fix', 'login', 'timeout', 'mobile', 'app'}
+
+    def test_reworded_issue_is_flagged(self, index):
+        """Test a re-raised action item matches the indexed issue with its key"""
+        index.add('APP-1', 'Fix the login timeout on the mobile app', 'Users get logged out after resume on iOS')
+        index.add('APP-2', 'Write the quarterly billing report', 'Summarise revenue by region for finance')
+
+        match = index.find('Fix login timeout in mobile app', 'Users are logged out when resuming the iOS app')
+
+        assert match['key'] == 'APP-1'
+        assert match['summary'] == 'Fix the login timeout on the mobile app'
+        assert 0.5 <= match['similarity'] < 1
+
+    def test_unrelated_issue_is_not_flagged(self, index):
+        """Test issues sharing only a generic word are not reported"""
+        index.add('APP-1', 'Fix the login timeout on the mobile app', 'Users get logged out after resume on iOS')
+
+        assert index.find('Fix flaky CI pipeline', 'Integration tests time out on the build agents') is None
+        assert index.find('', '') is None
+
+    def test_reindexing_replaces_previous_entry(self, index):
+        """Test adding an existing key again drops its old buckets"""
+        index.add('APP-1', 'Fix the login timeout on the mobile app', '')
+        index.add('APP-1', 'Migrate billing exports to the new warehouse', '')
+
+        assert index.count() == 1
+        assert index.find('Fix the login timeout on the mobile app', '') is None
+        assert index.find('Migrate billing exports to the new warehouse', '')['key'] == 'APP-1'
+
+    def test_add_many_keeps_last_of_repeated_keys(self, index):
+        """Test a key repeated in one batch is indexed once, from its last occurrence"""
+        indexed = index.add_many([('APP-1', 'Fix the login timeout on the mobile app', ''),
+                                  ('APP-2', 'Write the quarterly billing report', ''),
+                                  ('APP-1', 'Migrate billing exports to the new warehouse', '')])
+
+        assert indexed == 2
+        assert index.count() == 2
+        assert index.find('Migrate billing exports to the new warehouse', '')['key'] == 'APP-1'
+        sizes = index.conn.execute("SELECT SUM(size) FROM duplicate_bucket_sizes").fetchone()[0]
+        assert sizes == index.conn.execute("SELECT COUNT(*) FROM duplicate_buckets").fetchone()[0]
+
+    def test_signatures_are_stable_across_instances(self, index, tmp_path):
+        """Test a fresh index over the same database finds what an earlier one stored"""
+        index.add('APP-1', 'Rotate the staging database credentials', 'Old password leaked in a screenshot')
+        reopened = DuplicateIndex(index.db_path)
+
+        assert reopened.find('Rotate staging database credentials', '')['key'] == 'APP-1'
+        reopened.close()
+
+    def test_sync_times_are_recorded_per_jql(self, index):
+        """Test the last sync time is remembered for incremental syncs"""
+        synced_at = datetime(2024, 5, 1, 12, 0)
+        assert index.last_synced('project = APP') is None
+
+        index.mark_synced('project = APP', synced_at)
+
+        assert index.last_synced('project = APP') == synced_at
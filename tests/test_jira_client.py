@@ -5,7 +5,7 @@ from meet2jira.jira_client import JiraClient
 class TestJiraClient:
     @pytest.fixture
     def mock_jira(self):
-        with patch('meet2jira.jira_client.Jira') as mock:
+        with patch('atlassian.Jira') as mock:
             mock_instance = MagicMock()
             mock.return_value = mock_instance
             yield mock_instance
@@ -69,3 +69,111 @@ class TestJiraClient:
             
             with pytest.raises(Exception, match='API error'):
                 client.create_issue(issue_data)
+
+    def test_create_issues_bulk_with_partial_failure(self, mock_jira):
+        """Test bulk creation batches requests and maps errors back to inputs"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_PAT': 'token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            client = JiraClient()
+            issues = [
+                {'title': f'Issue {i}', 'type': 'Task', 'priority': 'Major', 'labels': [], 'description': ''}
+                for i in range(3)
+            ]
+            mock_jira.create_issues.side_effect = [
+                {
+                    'issues': [{'key': 'TEST-1', 'self': 'url-1'}],
+                    'errors': [{
+                        'status': 400,
+                        'failedElementNumber': 0,
+                        'elementErrors': {'errors': {'priority': 'Priority is invalid'}}
+                    }]
+                },
+                {'issues': [{'key': 'TEST-2', 'self': 'url-2'}], 'errors': []}
+            ]
+
+            result = client.create_issues(issues, batch_size=2)
+
+            assert mock_jira.create_issues.call_count == 2
+            first_batch = mock_jira.create_issues.call_args_list[0].args[0]
+            assert [item['fields']['summary'] for item in first_batch] == ['Issue 0', 'Issue 1']
+            assert result['created'] == [
+                {'key': 'TEST-1', 'self': 'url-1', 'index': 1},
+                {'key': 'TEST-2', 'self': 'url-2', 'index': 2}
+            ]
+            assert result['errors'] == [{'index': 0, 'title': 'Issue 0', 'error': 'Priority is invalid'}]
+
+    def test_iter_issues_by_jql_pages_concurrently(self, mock_jira):
+        """Test pagination projects fields and walks every page after the first"""
+        def jql(query, fields, start, limit):
+            total = 120
+            keys = range(start, min(start + limit, total))
+            return {'total': total, 'issues': [{'key': f'TEST-{i}'} for i in keys]}
+
+        mock_jira.jql.side_effect = jql
+        with patch.dict('os.environ', {'JIRA_URL': 'https://test.atlassian.net', 'JIRA_PAT': 'token'}):
+            client = JiraClient()
+            issues = client.iter_issues_by_jql('project = TEST', page_size=50)
+
+            assert [issue['key'] for issue in issues] == [f'TEST-{i}' for i in range(120)]
+            starts = sorted(call.kwargs['start'] for call in mock_jira.jql.call_args_list)
+            assert starts == [0, 50, 100]
+            assert mock_jira.jql.call_args_list[0].kwargs['fields'] == 'status,assignee,summary,priority,created,updated'
+
+    def test_get_issues_by_jql_respects_max_results(self, mock_jira):
+        """Test a max_results limit stops pagination early"""
+        mock_jira.jql.side_effect = lambda query, fields, start, limit: {
+            'total': 500, 'issues': [{'key': f'TEST-{i}'} for i in range(start, start + limit)]
+        }
+        with patch.dict('os.environ', {'JIRA_URL': 'https://test.atlassian.net', 'JIRA_PAT': 'token'}):
+            client = JiraClient()
+            issues = client.get_issues_by_jql('project = TEST', max_results=75)
+
+            assert len(issues) == 75
+            assert mock_jira.jql.call_count == 2
+
+    def test_project_issue_keeps_only_report_fields(self):
+        """Test raw issues are reduced to compact records readable by attribute or by name"""
+        from meet2jira.jira_client import project_issue
+        record = project_issue({'key': 'TEST-1', 'expand': 'names', 'fields': {
+            'status': {'name': 'To Do', 'statusCategory': {'key': 'new'}}, 'assignee': None,
+            'summary': 'Fix login', 'priority': {'name': 'High'}, 'created': '2024-01-01', 'updated': None
+        }})
+
+        assert not hasattr(record, '__dict__')
+        assert record.status == record['status'] == 'To Do'
+        assert record.get('priority') == 'High' and record['assignee'] is None
+        assert record.row() == ('TEST-1', 'To Do', None, 'Fix login', 'High', '2024-01-01', None)
+
+    def test_iter_recently_created_searches_own_recent_issues(self, mock_jira):
+        """Test the lookup behind resumed runs only asks for the user's recent issues in the project"""
+        mock_jira.jql.return_value = {'total': 1, 'issues': [{'key': 'TEST-9', 'fields': {'summary': 'Fix CI'}}]}
+        with patch.dict('os.environ', {'JIRA_URL': 'https://test.atlassian.net', 'JIRA_PAT': 'token',
+                                       'JIRA_PROJECT_KEY': 'TEST'}):
+            issues = list(JiraClient().iter_recently_created(15))
+
+        assert [issue['key'] for issue in issues] == ['TEST-9']
+        mock_jira.jql.assert_called_once_with(
+            'project = "TEST" AND reporter = currentUser() AND created >= "-15m"', fields='summary', start=0, limit=50)
+
+    def test_bulk_create_waits_out_rate_limits(self, mock_jira):
+        """Test a rate-limited bulk create is retried after Retry-After instead of dropping the batch"""
+        import requests
+        from meet2jira.retry import RetryPolicy
+        response = requests.Response()
+        response.status_code = 429
+        response.headers['Retry-After'] = '1'
+        mock_jira.create_issues.side_effect = [
+            requests.HTTPError('Too Many Requests', response=response),
+            {'issues': [{'key': 'TEST-1'}], 'errors': []}
+        ]
+        issue = {'title': 'Test issue', 'type': 'Task', 'priority': 'Major', 'labels': [], 'description': ''}
+
+        with patch.dict('os.environ', {'JIRA_URL': 'https://test.atlassian.net', 'JIRA_PAT': 'token'}), \
+             patch('meet2jira.retry.time.sleep') as mock_sleep:
+            result = JiraClient(retry=RetryPolicy(max_retries=2)).create_issues([issue])
+
+        assert result == {'created': [{'key': 'TEST-1', 'index': 0}], 'errors': []}
+        mock_sleep.assert_called_once_with(1.0)
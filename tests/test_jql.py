@@ -0,0 +1,65 @@
+import pytest
+from meet2jira.jql import JQLNotSupported, compile_jql, split_order_by, union_jql
+
+ISSUE = {'id': '10042', 'key': 'APP-7', 'fields': {
+    'project': {'id': '10000', 'key': 'APP', 'name': 'Mobile App'},
+    'status': {'id': '3', 'name': 'In Progress',
+               'statusCategory': {'id': 4, 'key': 'indeterminate', 'name': 'In Progress'}},
+    'resolution': None,
+    'assignee': None,
+    'priority': {'name': 'High'},
+    'labels': ['ios', 'release'],
+    'components': [{'name': 'Platform'}]
+}}
+
+class TestJQL:
+    @pytest.mark.parametrize('jql,expected', [
+        ('project = APP', True),
+        ('project = "mobile app" AND labels in (android, IOS)', True),
+        ('project = APP AND component = Web', False),
+        ('NOT (component = Web) OR priority = Low ORDER BY key', True),
+        ('assignee is EMPTY and statusCategory != Done', True),
+        ('key in (APP-1, APP-7)', True)
+    ])
+    def test_matches_like_jira(self, jql, expected):
+        """Test supported clauses match case-insensitively on keys, names and list fields"""
+        assert compile_jql(jql).matches(ISSUE) is expected
+
+    @pytest.mark.parametrize('jql,expected', [
+        ('project = 10000 AND status = 3', True),
+        ('statusCategory = 4 AND key = 10042', True),
+        ('status in (1, 5)', False),
+        ('resolution = Unresolved', True),
+        ('resolution != unresolved', False),
+        ('resolution in (Unresolved, Fixed)', True),
+        ('resolution not in (Unresolved, Fixed)', False),
+        ('assignee in (EMPTY, "Sam Lee")', True),
+        ('priority not in (EMPTY, Low)', True)
+    ])
+    def test_ids_and_empty_values(self, jql, expected):
+        """Test numeric ids match and Unresolved and EMPTY in value lists stand for an empty field"""
+        assert compile_jql(jql).matches(ISSUE) is expected
+
+    def test_negations_never_match_empty_fields(self):
+        """Test != and not in exclude issues where the field is empty, as Jira does"""
+        assert compile_jql('assignee != "Sam Lee"').matches(ISSUE) is False
+        assert compile_jql('assignee not in ("Sam Lee")').matches(ISSUE) is False
+        assert compile_jql('labels not in (android)').matches(ISSUE) is True
+
+    @pytest.mark.parametrize('jql', [
+        'assignee = currentUser()', 'updated >= -7d', 'summary ~ "login"', 'project = APP AND', '(project = APP',
+        'resolution = "Unresolved"'
+    ])
+    def test_unsupported_queries_raise(self, jql):
+        """Test functions, unknown fields and malformed queries are left to Jira"""
+        with pytest.raises(JQLNotSupported):
+            compile_jql(jql)
+
+    def test_compiled_query_lists_the_fields_it_reads(self):
+        """Test the fields needed for local evaluation are reported for the shared search"""
+        assert compile_jql('project = APP AND component = Platform OR key = APP-1').fields == {'project', 'components'}
+
+    def test_union_drops_order_by_and_repeats(self):
+        """Test the shared search ORs each distinct filter without their ORDER BY clauses"""
+        assert split_order_by('project = APP ORDER BY key') == ('project = APP', ' ORDER BY key')
+        assert union_jql(['labels = a ORDER BY key', 'labels = b', 'labels = a']) == '(labels = a) OR (labels = b)'
@@ -3,6 +3,11 @@ from unittest.mock import patch, MagicMock, call
 from meet2jira.orchestrator import Meet2JiraOrchestrator
 
 class TestMeet2JiraOrchestrator:
+    @pytest.fixture(autouse=True)
+    def isolated_cwd(self, tmp_path, monkeypatch):
+        # The report database and duplicate index live in the working directory
+        monkeypatch.chdir(tmp_path)
+
     @pytest.fixture
     def mock_parser(self):
         with patch('meet2jira.orchestrator.MeetingParser') as mock:
@@ -48,7 +53,7 @@ class TestMeet2JiraOrchestrator:
         mock_parser.return_value = mock_parser_instance
 
         mock_jira_instance = MagicMock()
-        mock_jira_instance.create_issue.return_value = {'key': 'TEST-123'}
+        mock_jira_instance.create_issues.return_value = {'created': [{'key': 'TEST-123', 'index': 0}], 'errors': []}
         mock_jira.return_value = mock_jira_instance
 
         with patch('builtins.input', return_value='y'):
@@ -112,7 +117,7 @@ class TestMeet2JiraOrchestrator:
         """Test successful status report generation"""
         # Mock Jira client to return test issues
         mock_jira_instance = MagicMock()
-        mock_jira_instance.get_issues_by_jql.return_value = [
+        mock_jira_instance.iter_issues_by_jql.return_value = [
             {'key': 'TEST-1', 'fields': {'summary': 'Test issue 1'}},
             {'key': 'TEST-2', 'fields': {'summary': 'Test issue 2'}}
         ]
@@ -129,12 +134,12 @@ class TestMeet2JiraOrchestrator:
         assert report['issue_count'] == 2
         assert report['summary'] == "Test summary"
         assert report['jql'] == "project = TEST"
-        mock_jira_instance.get_issues_by_jql.assert_called_once_with("project = TEST")
+        mock_jira_instance.iter_issues_by_jql.assert_called_once_with("project = TEST", max_results=None)
 
     def test_generate_status_report_no_issues(self, mock_jira):
         """Test report generation with no matching issues"""
         mock_jira_instance = MagicMock()
-        mock_jira_instance.get_issues_by_jql.return_value = []
+        mock_jira_instance.iter_issues_by_jql.return_value = []
         mock_jira.return_value = mock_jira_instance
 
         orchestrator = Meet2JiraOrchestrator()
@@ -147,7 +152,7 @@ class TestMeet2JiraOrchestrator:
         """Test report generation with previous report comparison"""
         # Mock Jira client and report storage
         mock_jira_instance = MagicMock()
-        mock_jira_instance.get_issues_by_jql.return_value = [
+        mock_jira_instance.iter_issues_by_jql.return_value = [
             {'key': 'TEST-1', 'fields': {'summary': 'Test issue 1'}}
         ]
         mock_jira.return_value = mock_jira_instance
@@ -164,3 +169,348 @@ class TestMeet2JiraOrchestrator:
         report = orchestrator.generate_status_report("project = TEST", model='test-model')
 
         assert report['summary'] == "Test summary with comparison"
+
+    def test_process_batch_writes_jsonl(self, mock_parser, mock_jira, mock_requests, tmp_path):
+        """Test batch mode reuses one parser and writes one JSON line per transcript"""
+        import io
+        import json
+        mock_requests.return_value.ok = True
+        mock_parser_instance = MagicMock()
+        mock_parser_instance.model = 'test-model'
+        mock_parser_instance.parse.return_value = {
+            'issues': [{'title': 'Test issue'}],
+            'raw_response': ''
+        }
+        mock_parser.return_value = mock_parser_instance
+
+        paths = []
+        for name in ('a.txt', 'b.txt'):
+            path = tmp_path / name
+            path.write_text(f"Transcript {name}")
+            paths.append(str(path))
+        paths.append(str(tmp_path / 'missing.txt'))
+
+        output = io.StringIO()
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+        summary = orchestrator.process_batch(paths, model='test-model', dry_run=True, max_workers=2, output=output)
+
+        records = {r['transcript']: r for r in map(json.loads, output.getvalue().splitlines())}
+        assert mock_parser.call_count == 1
+        assert records[paths[0]]['issues'] == [{'title': 'Test issue'}]
+        assert records[paths[2]]['status'] == 'error'
+        assert summary['processed'] == 3
+        assert summary['failed'] == 1
+        mock_jira.return_value.create_issue.assert_not_called()
+
+    def test_process_transcript_collects_approvals_before_bulk_create(self, mock_parser, mock_jira, mock_requests):
+        """Test approvals are gathered first and approved issues are created in one bulk call"""
+        mock_requests.return_value.ok = True
+        issues = [
+            {'title': f'Issue {i}', 'type': 'Task', 'priority': 'Major', 'labels': [], 'description': ''}
+            for i in range(4)
+        ]
+        mock_parser.return_value.parse.return_value = {'issues': issues, 'raw_response': ''}
+        mock_jira_instance = mock_jira.return_value
+        mock_jira_instance.create_issues.return_value = {
+            'created': [{'key': 'TEST-1', 'index': 0}, {'key': 'TEST-3', 'index': 1}, {'key': 'TEST-4', 'index': 2}],
+            'errors': []
+        }
+
+        with patch('builtins.input', side_effect=['y', 'n', 'a']) as mock_input:
+            orchestrator = Meet2JiraOrchestrator(use_cache=False)
+            created, _ = orchestrator.process_transcript("Test transcript", model='test-model')
+
+        assert mock_input.call_count == 3
+        mock_jira_instance.create_issue.assert_not_called()
+        mock_jira_instance.create_issues.assert_called_once_with([issues[0], issues[2], issues[3]])
+        assert [issue['key'] for issue in created] == ['TEST-1', 'TEST-3', 'TEST-4']
+
+    def test_process_transcript_approve_by_index(self, mock_parser, mock_jira, mock_requests):
+        """Test selecting proposals by number skips the interactive prompt"""
+        mock_requests.return_value.ok = True
+        issues = [{'title': f'Issue {i}'} for i in range(5)]
+        mock_parser.return_value.parse.return_value = {'issues': issues, 'raw_response': ''}
+        mock_jira.return_value.create_issues.return_value = {'created': [], 'errors': []}
+
+        with patch('builtins.input') as mock_input:
+            orchestrator = Meet2JiraOrchestrator(use_cache=False)
+            orchestrator.process_transcript("Test transcript", model='test-model', approve='1,3-4')
+
+        mock_input.assert_not_called()
+        mock_jira.return_value.create_issues.assert_called_once_with([issues[0], issues[2], issues[3]])
+
+    def test_invalid_approve_records_no_run(self, mock_parser, mock_jira, mock_requests):
+        """Test a malformed selection is rejected before a run is journaled or the transcript parsed"""
+        mock_requests.return_value.ok = True
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+
+        with pytest.raises(ValueError, match="Invalid approve value"):
+            orchestrator.process_transcript("Test transcript", model='test-model', approve='1,x')
+
+        assert orchestrator.last_run_id is None
+        assert orchestrator.journal.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 0
+        mock_parser.return_value.parse.assert_not_called()
+
+    def test_resume_reuses_parse_and_decisions(self, mock_parser, mock_jira, mock_requests):
+        """Test an interrupted approval resumes without re-parsing or asking about decided issues again"""
+        mock_requests.return_value.ok = True
+        issues = [{'title': f'Issue {i}', 'type': 'Task', 'priority': 'Major', 'labels': [], 'description': ''}
+                  for i in range(3)]
+        mock_parser.return_value.parse.return_value = {'issues': issues, 'raw_response': ''}
+        mock_jira.return_value.create_issues.return_value = {'created': [{'key': 'TEST-1', 'index': 0},
+                                                                         {'key': 'TEST-3', 'index': 1}],
+                                                             'errors': []}
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+
+        with patch('builtins.input', side_effect=['y', KeyboardInterrupt()]), pytest.raises(KeyboardInterrupt):
+            orchestrator.process_transcript("Test transcript", model='test-model')
+        run_id = orchestrator.last_run_id
+        with patch('builtins.input', side_effect=['n', 'y']) as mock_input:
+            created, _ = Meet2JiraOrchestrator(use_cache=False).resume_run(run_id)
+
+        assert mock_parser.return_value.parse.call_count == 1
+        assert mock_input.call_count == 2
+        mock_jira.return_value.create_issues.assert_called_once_with([issues[0], issues[2]])
+        assert [issue['key'] for issue in created] == ['TEST-1', 'TEST-3']
+        assert Meet2JiraOrchestrator(use_cache=False).resume_run(run_id)[0] == [
+            {'key': 'TEST-1', 'self': None}, {'key': 'TEST-3', 'self': None}
+        ]
+
+    def test_resume_does_not_recreate_issues_from_an_interrupted_request(self, mock_parser, mock_jira, mock_requests):
+        """Test issues Jira created before a timeout are found and only the rest are created on resume"""
+        import requests
+        mock_requests.return_value.ok = True
+        issues = [{'title': f'Issue {i}', 'description': ''} for i in range(3)]
+        mock_parser.return_value.parse.return_value = {'issues': issues, 'raw_response': ''}
+        jira = mock_jira.return_value
+        jira.create_issues.side_effect = requests.Timeout('read timed out')
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+
+        with pytest.raises(requests.Timeout):
+            orchestrator.process_transcript("Test transcript", model='test-model', approve='all')
+
+        jira.create_issues.side_effect = None
+        jira.create_issues.return_value = {'created': [{'key': 'TEST-12', 'index': 0},
+                                                       {'key': 'TEST-13', 'index': 1}], 'errors': []}
+        jira.iter_recently_created.return_value = iter([
+            {'id': '10011', 'key': 'TEST-11', 'fields': {'summary': 'Issue 0'}},
+            {'id': '10010', 'key': 'TEST-10', 'fields': {'summary': 'Unrelated'}}
+        ])
+        created, _ = orchestrator.resume_run(orchestrator.last_run_id)
+
+        assert mock_parser.return_value.parse.call_count == 1
+        assert jira.create_issues.call_args_list[-1] == call([issues[1], issues[2]])
+        assert [issue['key'] for issue in created] == ['TEST-11', 'TEST-12', 'TEST-13']
+        assert orchestrator.journal.get_run(orchestrator.last_run_id)['status'] == 'completed'
+
+    def test_created_issues_flag_later_duplicates(self, mock_parser, mock_jira, mock_requests):
+        """Test issues created from one meeting are flagged when the next meeting proposes them again"""
+        mock_requests.return_value.ok = True
+        first = [{'title': 'Fix the login timeout on the mobile app', 'description': 'Users get logged out'}]
+        again = [{'title': 'Fix login timeout in the mobile app', 'description': 'Users get logged out'},
+                 {'title': 'Draft the onboarding email', 'description': 'Welcome sequence for new customers'}]
+        mock_parser.return_value.parse.side_effect = [
+            {'issues': first, 'raw_response': ''}, {'issues': again, 'raw_response': ''}
+        ]
+        mock_jira.return_value.create_issues.return_value = {'created': [{'key': 'APP-7', 'index': 0}], 'errors': []}
+
+        orchestrator = Meet2JiraOrchestrator(use_cache=False, skip_duplicates=True)
+        orchestrator.process_transcript("Monday standup", model='test-model', approve='all')
+        orchestrator.process_transcript("Tuesday standup", model='test-model', approve='all')
+
+        assert again[0]['duplicate_of']['key'] == 'APP-7'
+        assert 'duplicate_of' not in again[1]
+        assert mock_jira.return_value.create_issues.call_args_list[1] == call([again[1]])
+
+    def test_sync_duplicate_index_is_incremental(self, mock_parser, mock_jira):
+        """Test the first sync indexes the whole JQL and later syncs only fetch updated issues"""
+        mock_jira.return_value.iter_issues_by_jql.return_value = [
+            {'key': 'APP-1', 'fields': {'summary': 'Rotate staging credentials', 'description': None}}
+        ]
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+
+        assert orchestrator.sync_duplicate_index('project = APP') == 1
+        orchestrator.sync_duplicate_index('project = APP')
+
+        queries = [c.args[0] for c in mock_jira.return_value.iter_issues_by_jql.call_args_list]
+        assert queries[0] == 'project = APP'
+        assert queries[1].startswith('(project = APP) AND updated >= "-')
+        assert orchestrator.duplicate_index.find('Rotate the staging credentials')['key'] == 'APP-1'
+
+    def test_generate_status_report_incremental(self, mock_parser, mock_jira, mock_requests, tmp_path):
+        """Test incremental refresh merges updated issues into the stored snapshot"""
+        from meet2jira.report_storage import ReportStorage
+        mock_requests.return_value.ok = True
+
+        def raw_issue(key, status, summary):
+            return {'key': key, 'fields': {
+                'status': {'name': status}, 'assignee': None, 'summary': summary,
+                'priority': {'name': 'Major'}, 'created': '2024-01-01', 'updated': '2024-01-02'
+            }}
+
+        mock_jira_instance = mock_jira.return_value
+        mock_jira_instance.iter_issues_by_jql.return_value = iter([
+            raw_issue('TEST-1', 'To Do', 'First'),
+            raw_issue('TEST-2', 'To Do', 'Second'),
+            raw_issue('TEST-3', 'To Do', 'Third')
+        ])
+        mock_parser.return_value.generate_report_summary.return_value = "Summary"
+
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+        orchestrator.report_storage = ReportStorage(db_path=str(tmp_path / 'reports.db'))
+        orchestrator.generate_status_report("project = TEST ORDER BY key", model='test-model')
+
+        queries = []
+        def iter_issues(jql, fields=None, max_results=None):
+            queries.append(jql)
+            if fields == ('key',):
+                return iter([{'key': 'TEST-1'}, {'key': 'TEST-2'}, {'key': 'TEST-4'}])
+            if jql.startswith('key in'):
+                return iter([raw_issue('TEST-4', 'To Do', 'Fourth')])
+            return iter([raw_issue('TEST-2', 'Done', 'Second')])
+        mock_jira_instance.iter_issues_by_jql.side_effect = iter_issues
+
+        report = orchestrator.generate_status_report("project = TEST ORDER BY key", model='test-model',
+                                                     incremental=True)
+
+        assert queries[0] == '(project = TEST) AND updated >= "-6m" ORDER BY key'
+        assert queries[2] == 'key in (TEST-4)'
+        context = mock_parser.return_value.generate_report_summary.call_args.args[0]
+        assert context['counts']['by_status'] == {'To Do': 2, 'Done': 1}
+        assert context['changes']['status_changed']['transitions'] == {'To Do -> Done': 1}
+        assert context['changes']['added']['count'] == 1
+        assert [i['key'] for i in context['changes']['removed']['issues']] == ['TEST-3']
+        assert report['issue_count'] == 3
+        stored = orchestrator.report_storage.get_previous_report("project = TEST ORDER BY key")
+        assert sorted(row['issue_key'] for row in stored['issues']) == ['TEST-1', 'TEST-2', 'TEST-4']
+
+    def test_generate_status_report_streams_issues(self, mock_parser, mock_jira, mock_requests):
+        """Test issues are aggregated as they stream in and a failed search stores no partial report"""
+        mock_requests.return_value.ok = True
+
+        def search(jql, max_results=None, fail_after=None):
+            for n in range(1, 121):
+                if n == fail_after:
+                    raise ConnectionError('search failed')
+                yield {'key': f'TEST-{n}', 'fields': {
+                    'status': {'name': 'Done' if n % 4 == 0 else 'To Do'}, 'assignee': None, 'summary': f'Issue {n}',
+                    'priority': {'name': 'Major'}, 'created': '2024-01-01', 'updated': '2024-01-02'
+                }}
+        mock_parser.return_value.generate_report_summary.return_value = "Summary"
+
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+        mock_jira.return_value.iter_issues_by_jql.side_effect = lambda jql, **kwargs: search(jql, fail_after=60)
+        with pytest.raises(ConnectionError):
+            orchestrator.generate_status_report("project = TEST", model='test-model')
+        assert orchestrator.report_storage.get_previous_report("project = TEST") is None
+
+        mock_jira.return_value.iter_issues_by_jql.side_effect = search
+        report = orchestrator.generate_status_report("project = TEST", model='test-model')
+
+        context = mock_parser.return_value.generate_report_summary.call_args.args[0]
+        assert report['issue_count'] == context['issue_count'] == 120
+        assert context['counts']['by_status'] == {'To Do': 90, 'Done': 30}
+        assert len(orchestrator.report_storage.get_report_issues(report['report_id'])) == 120
+
+    def test_generate_report_set_shares_one_search(self, mock_parser, mock_jira, mock_requests):
+        """Test a report set fetches the union once, splits it locally and summarises every report"""
+        mock_requests.return_value.ok = True
+
+        def raw_issue(key, labels):
+            return {'key': key, 'fields': {
+                'project': {'key': 'APP'}, 'status': {'name': 'To Do'}, 'assignee': None, 'summary': key,
+                'priority': {'name': 'Major'}, 'labels': labels, 'created': '2024-01-01', 'updated': '2024-01-02'
+            }}
+
+        queries = []
+        def iter_issues(jql, fields=None):
+            queries.append((jql, fields))
+            if fields == ('key',):
+                return iter([{'key': 'APP-1'}, {'key': 'APP-9'}])
+            if jql.startswith('key in'):
+                return iter([raw_issue('APP-9', [])])
+            return iter([raw_issue('APP-1', ['ios']), raw_issue('APP-2', ['web']), raw_issue('APP-3', ['ios'])])
+        mock_jira.return_value.iter_issues_by_jql.side_effect = iter_issues
+        mock_parser.return_value.generate_report_summary.side_effect = \
+            lambda context, model: f"{context['issue_count']} issues"
+
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+        reports = orchestrator.generate_report_set([
+            {'name': 'iOS', 'jql': 'project = APP AND labels = ios ORDER BY key'},
+            {'name': 'Web', 'jql': 'project = APP AND labels = web'},
+            {'name': 'Android', 'jql': 'project = APP AND labels = android'},
+            {'name': 'Mine', 'jql': 'assignee = currentUser()'}
+        ], model='test-model', max_workers=2)
+
+        union, fields = queries[0]
+        assert union == ('(project = APP AND labels = ios) OR (project = APP AND labels = web) OR '
+                         '(project = APP AND labels = android) OR (assignee = currentUser())')
+        assert 'labels' in fields and 'project' in fields
+        assert [q for q, _ in queries[1:]] == ['assignee = currentUser()', 'key in (APP-9)']
+        assert [r['name'] for r in reports] == ['iOS', 'Web', 'Android', 'Mine']
+        assert [r.get('summary') for r in reports] == ['2 issues', '1 issues', None, '2 issues']
+        assert reports[2]['error'] == "No issues found matching the JQL query"
+        stored = orchestrator.report_storage.get_previous_report('project = APP AND labels = ios ORDER BY key')
+        assert sorted(row['issue_key'] for row in stored['issues']) == ['APP-1', 'APP-3']
+
+    def test_ollama_readiness_poll_backs_off(self, mock_ollama, mock_jira):
+        """Test the server is polled with growing delays until it answers"""
+        mock_ollama.return_value.poll.return_value = None
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+        with patch('meet2jira.orchestrator.requests.get') as mock_get, \
+             patch('meet2jira.orchestrator.time.sleep') as mock_sleep:
+            mock_get.side_effect = [MagicMock(ok=False)] * 4 + [MagicMock(ok=True)]
+            orchestrator.start_ollama()
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1, 0.2]
+        orchestrator.ollama_process = None
+
+    def test_resident_mode_leaves_server_running(self, mock_ollama, mock_jira):
+        """Test resident mode keeps the model loaded and does not stop the server at exit"""
+        orchestrator = Meet2JiraOrchestrator(use_cache=False, resident=True)
+        orchestrator.ollama_process = MagicMock()
+        orchestrator.cleanup_ollama()
+
+        orchestrator.ollama_process.terminate.assert_not_called()
+        assert orchestrator.keep_alive == -1
+        assert orchestrator.parser_options['keep_alive'] == -1
+
+    def test_warm_up_preloads_model(self, mock_jira):
+        """Test warm-up loads the model at the first request's num_ctx and skips models already loaded at it"""
+        orchestrator = Meet2JiraOrchestrator(use_cache=False, keep_alive='30m')
+        transcript = "Alex: follow up with the vendor"
+        num_ctx = orchestrator._get_parser('test-model').warm_up_options('test-model', transcript)['num_ctx']
+        with patch('meet2jira.orchestrator.ollama') as mock_ollama:
+            mock_ollama.ps.return_value = {'models': []}
+            orchestrator.warm_up('test-model', transcript)
+            mock_ollama.generate.assert_called_once_with(model='test-model', prompt='',
+                                                         options={'num_ctx': num_ctx}, keep_alive='30m')
+
+        orchestrator.keep_alive = None
+        with patch('meet2jira.orchestrator.ollama') as mock_ollama:
+            mock_ollama.ps.return_value = {'models': [{'model': 'test-model:latest', 'context_length': num_ctx}]}
+            orchestrator.warm_up('test-model', transcript)
+            mock_ollama.generate.assert_not_called()
+
+            # Loaded with another context size, the runner would be reloaded by the first request
+            mock_ollama.ps.return_value = {'models': [{'model': 'test-model:latest', 'context_length': 32768}]}
+            orchestrator.warm_up('test-model', transcript)
+            mock_ollama.generate.assert_called_once_with(model='test-model', prompt='', options={'num_ctx': num_ctx})
+
+    def test_ollama_base_url_honours_host(self, monkeypatch):
+        """Test OLLAMA_HOST is normalised into the status URL"""
+        from meet2jira.orchestrator import ollama_base_url
+        monkeypatch.delenv('OLLAMA_HOST', raising=False)
+        assert ollama_base_url() == 'http://localhost:11434'
+        monkeypatch.setenv('OLLAMA_HOST', 'gpu-box')
+        assert ollama_base_url() == 'http://gpu-box:11434'
+        monkeypatch.setenv('OLLAMA_HOST', 'https://gpu-box:8443/')
+        assert ollama_base_url() == 'https://gpu-box:8443'
+
+    def test_jira_client_created_on_first_use(self, mock_jira):
+        """Test the Jira session is only built when Jira is actually needed"""
+        orchestrator = Meet2JiraOrchestrator(use_cache=False)
+        mock_jira.assert_not_called()
+
+        assert orchestrator.jira_client is orchestrator.jira_client
+        mock_jira.assert_called_once_with(timings=orchestrator.timings)
@@ -1,7 +1,8 @@
 import json
 import pytest
 from unittest.mock import patch, MagicMock, ANY
-from meet2jira.parser import MeetingParser
+from meet2jira.parser import MeetingParser, AsyncMeetingParser
+from meet2jira.cache import ResponseCache
 
 class TestMeetingParser:
     @pytest.fixture
@@ -31,8 +32,9 @@ class TestMeetingParser:
         mock_ollama.generate.assert_called_once_with(
             model='test-model',
             prompt=ANY,
-            options={'num_ctx': 24576},
-            format='json'
+            options={'num_ctx': 4096},
+            format='json',
+            system=ANY
         )
         assert len(result['issues']) == 1
         assert result['issues'][0]['title'] == 'Test issue'
@@ -47,6 +49,119 @@ class TestMeetingParser:
             'raw_response': 'test raw response'
         }
 
+    def test_parse_passes_keep_alive(self, mock_ollama):
+        """Test keep_alive is sent with every request when configured"""
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []})}
+
+        MeetingParser(model='test-model', keep_alive='30m').parse("Test meeting transcript")
+
+        assert mock_ollama.generate.call_args.kwargs['keep_alive'] == '30m'
+
+    def test_instructions_sent_as_stable_system_prefix(self, mock_ollama):
+        """Test the fixed instructions go in the system field, identical across requests, and load once"""
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []})}
+        parser = MeetingParser(model='test-model')
+
+        with patch('meet2jira.parser.resources') as mock_resources:
+            mock_resources.files.return_value.joinpath.return_value.read_text.return_value = (
+                "Extract action items.\n\nMeeting Transcript:\n{transcript}")
+            parser.parse("Alex: first meeting")
+            parser.parse("Sam: second meeting")
+
+        first, second = mock_ollama.generate.call_args_list
+        assert first.kwargs['system'] == second.kwargs['system'] == "Extract action items."
+        assert first.kwargs['prompt'] == "Meeting Transcript:\nAlex: first meeting"
+        assert mock_resources.files.return_value.joinpath.return_value.read_text.call_count == 1
+
+    def test_prompt_dir_overrides_packaged_templates(self, mock_ollama, tmp_path):
+        """Test templates are read from prompt_dir, with the data appended when they lack a placeholder"""
+        (tmp_path / 'system_prompt.txt').write_text("Only list bugs.\n")
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []})}
+
+        MeetingParser(model='test-model', prompt_dir=str(tmp_path)).parse("Alex: the build is broken")
+
+        call = mock_ollama.generate.call_args
+        assert call.kwargs['system'] == "Only list bugs."
+        assert call.kwargs['prompt'] == "Meeting Transcript:\nAlex: the build is broken"
+
+    def test_prompt_dir_from_settings(self, mock_ollama, tmp_path, monkeypatch):
+        """Test llm.prompt_dir in settings.yaml overrides the packaged templates when nothing else does"""
+        (tmp_path / 'prompts').mkdir()
+        (tmp_path / 'prompts' / 'system_prompt.txt').write_text("Only list bugs.\n")
+        (tmp_path / 'settings.yaml').write_text(f"llm:\n  prompt_dir: {tmp_path / 'prompts'}\n")
+        monkeypatch.setenv('MEET2JIRA_CONFIG', str(tmp_path / 'settings.yaml'))
+        monkeypatch.delenv('MEET2JIRA_PROMPT_DIR', raising=False)
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []})}
+
+        MeetingParser(model='test-model').parse("Alex: the build is broken")
+
+        assert mock_ollama.generate.call_args.kwargs['system'] == "Only list bugs."
+
+    def test_parse_records_timings(self, mock_ollama):
+        """Test parse spans and Ollama token counts reach the run recorder"""
+        from meet2jira.timings import RunRecorder
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []}), 'prompt_eval_count': 900,
+                                             'eval_count': 40, 'prompt_eval_duration': 300_000_000,
+                                             'eval_duration': 400_000_000}
+        timings = RunRecorder()
+
+        MeetingParser(model='test-model', timings=timings).parse("Test meeting transcript")
+
+        summary = timings.summary()
+        assert list(summary['stages']) == ['parser.parse', 'ollama.generate']
+        assert summary['llm']['prompt_tokens'] == 900
+        assert summary['llm']['eval_tokens_per_second'] == 100
+
+    def test_preprocessor_shrinks_prompt_and_reports_reduction(self, mock_ollama):
+        """Test the transcript is preprocessed before prompt construction and the token saving recorded"""
+        from meet2jira.preprocess import TranscriptPreprocessor
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []})}
+        transcript = "[00:00:01] Alex: Um, we need to fix CI.\n[00:00:04] Alex: Uh, before Friday.\n[00:00:06] Sam: Okay."
+        parser = MeetingParser(model='test-model', preprocessor=TranscriptPreprocessor())
+
+        parser.parse(transcript)
+
+        assert mock_ollama.generate.call_args.kwargs['prompt'].endswith("Alex: We need to fix CI. Before Friday.")
+        stats = parser.last_preprocess_stats
+        assert stats['format'] == 'plain'
+        assert stats['tokens_after'] < stats['tokens_before']
+
+    def test_num_ctx_sized_to_prompt(self, mock_ollama):
+        """Test small prompts get a small context and large ones step up through power-of-two buckets"""
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []})}
+        parser = MeetingParser(model='test-model')
+
+        parser.parse("Short meeting")
+        small = mock_ollama.generate.call_args.kwargs['options']['num_ctx']
+        parser.parse("Alex: we need to ship the release notes today.\n" * 400)
+        large = mock_ollama.generate.call_args.kwargs['options']['num_ctx']
+
+        assert small == 4096
+        assert large == 8192
+        assert parser.last_prompt_estimate['num_ctx'] == 8192
+
+    def test_oversized_transcript_is_chunked(self, mock_ollama):
+        """Test a transcript that cannot fit in max_ctx is split instead of silently truncated"""
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []})}
+        parser = MeetingParser(model='test-model', max_ctx=4096)
+
+        parser.parse("Alex: we need to ship the release notes today.\n" * 400)
+
+        assert mock_ollama.generate.call_count > 1
+        assert all(c.kwargs['options']['num_ctx'] <= 4096 for c in mock_ollama.generate.call_args_list)
+
+    def test_estimator_calibrates_from_prompt_eval_count(self, mock_ollama):
+        """Test observed prompt_eval_count adjusts the characters-per-token ratio"""
+        from meet2jira.tokens import TokenEstimator
+        estimator = TokenEstimator(chars_per_token=3.5, smoothing=1.0)
+        estimator.calibrate('test-model', 4000, 1000)
+        assert estimator.estimate('x' * 400, 'test-model') == 100
+        # Counts shrunk by Ollama's prefix cache are ignored
+        estimator.calibrate('test-model', 4000, 50)
+        assert estimator.chars_per_token('test-model') == 4.0
+        assert estimator.context_size(9000, 24576) == 16384
+        assert estimator.context_size(20000, 24576) == 24576
+
     def test_parse_empty_transcript(self, mock_ollama):
         """Test parsing empty transcript"""
         parser = MeetingParser(model='test-model')
@@ -71,3 +186,152 @@ class TestMeetingParser:
         parser = MeetingParser(model='test-model')
         with pytest.raises(Exception, match='LLM error'):
             parser.parse('Test transcript')
+
+
+    def test_split_transcript_on_speaker_boundaries(self):
+        """Test transcripts are split between speaker turns with overlap"""
+        parser = MeetingParser(model='test-model', chunk_size=50, chunk_overlap=1)
+        transcript = "Alex:\nfirst point here\nJamie:\nsecond point here\nSam:\nthird point"
+        chunks = parser.split_transcript(transcript)
+
+        assert chunks == [
+            "Alex:\nfirst point here\nJamie:\nsecond point here",
+            "Jamie:\nsecond point here\nSam:\nthird point"
+        ]
+
+    def test_split_transcript_without_speakers(self):
+        """Test transcripts without speaker or timestamp lines still split within the chunk size"""
+        parser = MeetingParser(model='test-model', chunk_size=200, chunk_overlap=1)
+        paragraph = "We agreed the vendor contract needs a security review before renewal. " * 4
+        transcript = "\n\n".join([paragraph] * 6) + "\n" + "x" * 450
+
+        chunks = parser.split_transcript(transcript)
+
+        assert len(chunks) > 6
+        assert all(len(chunk) <= 200 for chunk in chunks)
+        assert "".join(chunks).count("vendor contract") >= 24
+        assert "x" * 450 in "".join(chunks)
+
+    @pytest.mark.parametrize('lines', [5, 3000])
+    def test_warm_up_options_match_first_request(self, mock_ollama, lines):
+        """Test warm-up asks for the num_ctx of the first extraction request, chunked or not"""
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []})}
+        parser = MeetingParser(model='test-model', max_ctx=8192, max_workers=1)
+        transcript = "\n".join(f"Speaker {i % 3}: we should follow up on item {i}" for i in range(lines))
+
+        options = parser.warm_up_options('test-model', transcript)
+        parser.parse(transcript)
+
+        assert mock_ollama.generate.call_args_list[0].kwargs['options'] == options
+        assert parser.warm_up_options('test-model') == {'num_ctx': parser.last_prompt_estimate['num_ctx']}
+
+    def test_warm_up_options_after_preprocessing(self, mock_ollama):
+        """Test warm-up sizes the transcript the preprocessor leaves, as the real request does"""
+        from meet2jira.preprocess import TranscriptPreprocessor
+        mock_ollama.generate.return_value = {'response': json.dumps({'issues': []})}
+        parser = MeetingParser(model='test-model', max_workers=1, preprocessor=TranscriptPreprocessor())
+        filler = "um, you know, like, so, I mean, " * 40
+        transcript = "\n".join(f"00:{i % 60:02d}:00 Speaker {i % 3}: {filler}follow up on item {i}"
+                                for i in range(60))
+
+        options = parser.warm_up_options('test-model', transcript)
+        parser.parse(transcript)
+
+        assert parser.last_preprocess_stats['tokens_after'] < parser.last_preprocess_stats['tokens_before']
+        assert mock_ollama.generate.call_args_list[0].kwargs['options'] == options
+
+    def test_parse_chunked_merges_duplicates(self, mock_ollama):
+        """Test chunked parsing merges issues repeated across chunks"""
+        mock_ollama.generate.side_effect = [
+            {'response': json.dumps({'issues': [
+                {'title': 'Follow up with vendor', 'description': 'Short', 'labels': ['api']}
+            ]})},
+            {'response': json.dumps({'issues': [
+                {'title': 'Follow up with vendor!', 'description': 'Longer description', 'labels': ['vendor']},
+                {'title': 'Update mockups', 'description': 'Design work'}
+            ]})}
+        ]
+
+        parser = MeetingParser(model='test-model', chunk_size=50, chunk_overlap=1, max_workers=2)
+        result = parser.parse("Alex:\nfirst point here\nJamie:\nsecond point here\nSam:\nthird point")
+
+        assert mock_ollama.generate.call_count == 2
+        assert [issue['title'] for issue in result['issues']] == ['Follow up with vendor', 'Update mockups']
+        assert result['issues'][0]['description'] == 'Longer description'
+        assert result['issues'][0]['labels'] == ['api', 'vendor']
+        assert len(result['raw_response']['chunks']) == 2
+
+    def test_parse_uses_cache(self, mock_ollama, tmp_path):
+        """Test identical transcripts are served from the response cache"""
+        mock_ollama.list.return_value = {'models': [{'model': 'test-model', 'digest': 'abc123'}]}
+        mock_ollama.generate.return_value = {
+            'response': json.dumps({'issues': [{'title': 'Cached issue'}]})
+        }
+        cache = ResponseCache(db_path=str(tmp_path / 'cache.db'))
+
+        first = MeetingParser(model='test-model', cache=cache).parse('Test transcript')
+        second = MeetingParser(model='test-model', cache=cache).parse('Test transcript')
+
+        mock_ollama.generate.assert_called_once()
+        assert first == second
+        assert cache.stats() == {'hits': 1, 'misses': 1}
+
+    def test_parse_does_not_cache_invalid_response(self, mock_ollama, tmp_path):
+        """Test malformed responses are not cached"""
+        mock_ollama.generate.return_value = {'response': 'invalid json'}
+        cache = ResponseCache(db_path=str(tmp_path / 'cache.db'))
+
+        parser = MeetingParser(model='test-model', cache=cache)
+        for _ in range(2):
+            with pytest.raises(ValueError, match='Invalid response format'):
+                parser.parse('Test transcript')
+
+        assert mock_ollama.generate.call_count == 2
+
+    def test_async_parse_many_respects_concurrency_limit(self, mock_ollama):
+        """Test the async parser never exceeds its concurrency limit"""
+        import asyncio
+        in_flight = 0
+        peak = 0
+
+        async def generate(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {'response': json.dumps({'issues': [{'title': kwargs['prompt'][-1]}]})}
+
+        mock_ollama.AsyncClient.return_value.generate = generate
+
+        parser = AsyncMeetingParser(model='test-model', max_workers=2)
+        results = asyncio.run(parser.parse_many(['Transcript 1', 'Transcript 2', 'Transcript 3', '']))
+
+        assert peak == 2
+        assert [r['issues'][0]['title'] for r in results[:3]] == ['1', '2', '3']
+        assert isinstance(results[3], ValueError)
+        mock_ollama.generate.assert_not_called()
+
+    def test_parse_stream_yields_issues_incrementally(self, mock_ollama):
+        """Test streamed issues are yielded before generation finishes"""
+        response = json.dumps({'issues': [{'title': 'First'}, {'title': 'Second'}]})
+        split = response.index('}, {') + 1
+        generated = []
+
+        def stream():
+            for part in (response[:split], response[split:]):
+                generated.append(part)
+                yield {'response': part}
+
+        mock_ollama.generate.return_value = stream()
+
+        parser = MeetingParser(model='test-model')
+        issues = parser.parse_stream('Test transcript')
+        first = next(issues)
+
+        assert first['title'] == 'First'
+        assert len(generated) == 1
+        assert [issue['title'] for issue in issues] == ['Second']
+        assert parser.last_raw_response == json.loads(response)
+        assert parser.last_time_to_first_issue is not None
+        assert mock_ollama.generate.call_args.kwargs['stream'] is True
@@ -0,0 +1,111 @@
+import pytest
+from meet2jira.preprocess import TranscriptPreprocessor, detect_format
+
+VTT = """WEBVTT
+Kind: captions
+
+NOTE recorded by the meeting bot
+
+1
+00:00:01.000 --> 00:00:04.000 align:start
+<v Alex Carter>Um, so, you know, we need to fix the login timeout.</v>
+
+2
+00:00:04.500 --> 00:00:06.000
+<v Alex Carter>Uh, before Friday.</v>
+
+00:00:06.500 --> 00:00:07.000
+<v Sam Lee>Yeah, okay.</v>
+
+00:00:07.500 --> 00:00:09.000
+<v Priya Shah>How was everyone's weekend?</v>
+"""
+
+SRT = """1
+00:00:01,000 --> 00:00:04,000
+Alex: I think we should
+ship the release.
+
+2
+00:00:04,000 --> 00:00:05,000
+And update the docs.
+"""
+
+class TestTranscriptPreprocessor:
+    @pytest.mark.parametrize('text,expected', [
+        (VTT, 'vtt'),
+        (SRT, 'srt'),
+        ("[00:00:01] Alex: hello\n[00:00:05] Sam: hi", 'plain')
+    ])
+    def test_detect_format(self, text, expected):
+        """Test caption formats are recognised from their first lines"""
+        assert detect_format(text.splitlines()) == expected
+
+    def test_vtt_cues_become_merged_speaker_turns(self):
+        """Test timings, markup, fillers and backchannel turns are dropped and speaker runs merged"""
+        text, stats = TranscriptPreprocessor().process(VTT)
+
+        assert text.splitlines() == [
+            "Alex Carter: So we need to fix the login timeout. Before Friday.",
+            "Priya Shah: How was everyone's weekend?"
+        ]
+        assert stats['format'] == 'vtt'
+        assert stats['input_turns'] == 4
+        assert stats['output_turns'] == 2
+        assert stats['output_characters'] < stats['input_characters']
+
+    def test_srt_cue_without_speaker_continues_previous_turn(self):
+        """Test multi-line SRT cues are joined and unattributed cues stay with the current speaker"""
+        text, _ = TranscriptPreprocessor().process(SRT)
+
+        assert text == "Alex: I think we should ship the release. And update the docs."
+
+    def test_plain_transcript_keeps_first_timestamp_when_requested(self):
+        """Test leading timestamps are stripped by default and kept per merged turn otherwise"""
+        transcript = "[00:00:01] Alex: We need to fix CI.\n[00:00:05] Alex: It's flaky.\nSam Lee  0:12\nI'll take it."
+
+        stripped, _ = TranscriptPreprocessor().process(transcript)
+        kept, _ = TranscriptPreprocessor(strip_timestamps=False).process(transcript)
+
+        assert stripped == "Alex: We need to fix CI. It's flaky.\nSam Lee: I'll take it."
+        assert kept.splitlines()[0] == "[00:00:01] Alex: We need to fix CI. It's flaky."
+
+    def test_filler_phrases_only_removed_when_set_off(self):
+        """Test "you know" is kept when it is part of the sentence"""
+        text, _ = TranscriptPreprocessor(merge_speakers=False).process(
+            "Alex: Do you know the release date?\nSam: It is, you know, next week.")
+
+        assert text == "Alex: Do you know the release date?\nSam: It is next week."
+
+    def test_relevance_filter_keeps_matches_and_context(self):
+        """Test only keyword turns and their neighbours survive the relevance filter"""
+        transcript = "\n".join([
+            "Alex: Did anyone watch the game?",
+            "Sam: The weather was great.",
+            "Priya: Anyway, the export is broken.",
+            "Jordan: I'll fix the export tomorrow.",
+            "Alex: Great, thanks Jordan.",
+            "Sam: Lunch anyone?"
+        ])
+
+        text, stats = TranscriptPreprocessor(keywords=['fix'], context=1).process(transcript)
+
+        assert text.splitlines() == [
+            "Priya: Anyway, the export is broken.",
+            "Jordan: I'll fix the export tomorrow.",
+            "Alex: Great, thanks Jordan."
+        ]
+        assert stats['output_turns'] == 3
+
+    def test_process_lines_is_lazy(self):
+        """Test lines are pulled from the source only as output is consumed"""
+        def source():
+            yield "Alex: first point"
+            yield "Sam: second point"
+            for i in range(1000):
+                yield f"Speaker{i % 2}: point {i}"
+            raise AssertionError("read past the lines that were needed")
+
+        lines = TranscriptPreprocessor().process_lines(source())
+
+        assert next(lines) == "Alex: first point"
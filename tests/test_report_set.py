@@ -0,0 +1,31 @@
+import pytest
+from meet2jira.report_set import load_report_set
+
+class TestLoadReportSet:
+    def test_load_named_reports_with_superset(self, tmp_path):
+        """Test reports and the optional superset query are read from YAML"""
+        path = tmp_path / 'reports.yaml'
+        path.write_text("superset: project = APP\n"
+                        "reports:\n"
+                        "  - name: Platform\n"
+                        "    jql: project = APP AND component = Platform\n"
+                        "  - jql: project = APP AND labels = ios\n")
+
+        report_set = load_report_set(str(path))
+
+        assert report_set['superset'] == 'project = APP'
+        assert report_set['reports'] == [
+            {'name': 'Platform', 'jql': 'project = APP AND component = Platform'},
+            {'name': 'project = APP AND labels = ios', 'jql': 'project = APP AND labels = ios'}
+        ]
+
+    def test_rejects_reports_without_jql_or_repeated_names(self, tmp_path):
+        """Test invalid report sets fail before anything is fetched"""
+        path = tmp_path / 'reports.yaml'
+        path.write_text("- name: Platform\n")
+        with pytest.raises(ValueError, match='has no jql'):
+            load_report_set(str(path))
+
+        path.write_text("- {name: Team, jql: labels = a}\n- {name: Team, jql: labels = b}\n")
+        with pytest.raises(ValueError, match='more than once'):
+            load_report_set(str(path))
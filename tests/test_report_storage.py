@@ -0,0 +1,168 @@
+import pytest
+from meet2jira.report_storage import ReportStorage
+
+class TestReportStorage:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return ReportStorage(db_path=str(tmp_path / 'reports.db'))
+
+    def issue(self, key, status='To Do', assignee=None):
+        return {'key': key, 'status': status, 'assignee': assignee, 'summary': f'Summary {key}',
+                'priority': 'Major', 'created': '2024-01-01', 'updated': '2024-01-02'}
+
+    def test_get_previous_report(self, storage):
+        """Test the latest snapshot for a JQL is returned with its issues"""
+        storage.save_report('r1', 'project = TEST', [self.issue('T-1')])
+        storage.save_report('r2', 'project = TEST', [self.issue('T-1', 'Done'), self.issue('T-2')])
+        storage.save_report('r3', 'project = OTHER', [self.issue('O-1')])
+
+        report = storage.get_previous_report('project = TEST')
+        assert report['report_id'] == 'r2'
+        assert sorted((row['issue_key'], row['status']) for row in report['issues']) == [
+            ('T-1', 'Done'), ('T-2', 'To Do')
+        ]
+        assert 'issues' not in storage.get_previous_report('project = TEST', include_issues=False)
+        assert storage.get_previous_report('project = NONE') is None
+
+    def test_diff_reports(self, storage):
+        """Test snapshot diffs are computed in SQL"""
+        storage.save_report('old', 'project = TEST', [
+            self.issue('T-1'), self.issue('T-2', assignee='Ana'), self.issue('T-3'), self.issue('T-4')
+        ])
+        storage.save_report('new', 'project = TEST', [
+            self.issue('T-1', 'Done'), self.issue('T-2', assignee='Ben'), self.issue('T-4', 'Done'), self.issue('T-5')
+        ])
+
+        diff = storage.diff_reports('old', 'new')
+        assert [i['key'] for i in diff['added']['issues']] == ['T-5']
+        assert [i['key'] for i in diff['removed']['issues']] == ['T-3']
+        assert diff['status_changed']['count'] == 2
+        assert diff['status_changed']['transitions'] == {'To Do -> Done': 2}
+        assert diff['reassigned']['issues'] == [{
+            'key': 'T-2', 'summary': 'Summary T-2', 'status': 'To Do', 'assignee': 'Ben', 'previous_assignee': 'Ana'
+        }]
+
+        limited = storage.diff_reports('old', 'new', limit=1)
+        assert limited['status_changed']['count'] == 2
+        assert len(limited['status_changed']['issues']) == 1
+
+    def test_schema_version_skips_ddl_on_reopen(self, tmp_path):
+        """Test an up-to-date database is opened without re-running DDL"""
+        from meet2jira import report_storage
+        db_path = str(tmp_path / 'reports.db')
+        ReportStorage(db_path=db_path).close()
+
+        storage = ReportStorage(db_path=db_path)
+        assert storage.conn.execute("PRAGMA user_version").fetchone()[0] == report_storage.SCHEMA_VERSION
+        assert storage.conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+    def test_migrates_legacy_schema(self, tmp_path):
+        """Test databases created by older versions gain the new snapshot columns"""
+        import sqlite3
+        db_path = str(tmp_path / 'reports.db')
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE reports (report_id TEXT PRIMARY KEY, jql_filter TEXT NOT NULL, created_at TIMESTAMP NOT NULL)")
+            conn.execute("CREATE TABLE report_issues (report_id TEXT, issue_key TEXT, status TEXT NOT NULL, "
+                         "assignee TEXT, summary TEXT, PRIMARY KEY (report_id, issue_key))")
+
+        storage = ReportStorage(db_path=db_path)
+        storage.save_report('r1', 'project = TEST', [self.issue('T-1')])
+        assert storage.get_previous_report('project = TEST')['issues'][0]['priority'] == 'Major'
+
+    def test_snapshots_store_only_changed_issues(self, storage):
+        """Test unchanged issues are not rewritten and older snapshots are reconstructed on read"""
+        storage.save_report('r1', 'project = TEST', [self.issue('T-1'), self.issue('T-2'), self.issue('T-3')])
+        storage.save_report('r2', 'project = TEST', [self.issue('T-1', 'Done'), self.issue('T-2'), self.issue('T-4')])
+        storage.save_report('r3', 'project = TEST', [self.issue('T-1', 'Done'), self.issue('T-2')])
+
+        assert storage.conn.execute("SELECT COUNT(*) FROM issue_versions").fetchone()[0] == 5
+        assert sorted((i['issue_key'], i['status']) for i in storage.get_report_issues('r1')) == [
+            ('T-1', 'To Do'), ('T-2', 'To Do'), ('T-3', 'To Do')
+        ]
+        assert sorted(i['issue_key'] for i in storage.get_report_issues('r2')) == ['T-1', 'T-2', 'T-4']
+        assert sorted(i['issue_key'] for i in storage.get_report_issues('r3')) == ['T-1', 'T-2']
+
+        # Non-adjacent snapshots are diffed from their reconstructed contents
+        diff = storage.diff_reports('r1', 'r3')
+        assert diff['removed']['issues'][0]['key'] == 'T-3'
+        assert diff['added']['count'] == 0
+        assert diff['status_changed']['transitions'] == {'To Do -> Done': 1}
+
+    def test_compact_prunes_and_downsamples(self, storage):
+        """Test compaction drops old reports and the versions only they used, keeping the latest"""
+        storage.save_report('r1', 'project = TEST', [self.issue('T-1')])
+        storage.save_report('r2', 'project = TEST', [self.issue('T-1', 'Done')])
+        storage.save_report('r3', 'project = TEST', [self.issue('T-1', 'Done'), self.issue('T-2')])
+        storage.save_report('o1', 'project = OTHER', [self.issue('O-1')])
+        storage.conn.execute("UPDATE reports SET created_at = '2020-01-01 10:00:00' WHERE report_id IN ('r1', 'o1')")
+        storage.conn.execute("UPDATE reports SET created_at = '2020-01-01 11:00:00' WHERE report_id = 'r2'")
+        storage.conn.commit()
+
+        assert storage.compact(downsample_after_days=1) == {'removed_reports': 1, 'removed_versions': 1}
+        assert storage.compact(keep_days=1) == {'removed_reports': 1, 'removed_versions': 0}
+
+        assert [row[0] for row in storage.conn.execute("SELECT report_id FROM reports ORDER BY seq")] == ['r3', 'o1']
+        assert sorted(i['issue_key'] for i in storage.get_previous_report('project = TEST')['issues']) == ['T-1', 'T-2']
+        assert storage.get_previous_report('project = OTHER')['report_id'] == 'o1'
+
+    def test_diff_across_compacted_gap(self, storage):
+        """Test reports that were not saved one after the other diff correctly once the reports between are gone"""
+        storage.save_report('r1', 'project = TEST', [self.issue('T-1'), self.issue('T-2')])
+        storage.save_report('r2', 'project = TEST', [self.issue('T-1', 'Done'), self.issue('T-2'), self.issue('T-3')])
+        storage.save_report('r3', 'project = TEST', [self.issue('T-1', 'Done'), self.issue('T-3'), self.issue('T-4')])
+        counts = lambda diff: {name: change['count'] for name, change in diff.items()}
+        before = counts(storage.diff_reports('r1', 'r3'))
+
+        storage.conn.execute("DELETE FROM reports WHERE report_id = 'r2'")
+        storage.conn.commit()
+        storage.compact(vacuum=False)
+
+        assert before == {'added': 2, 'removed': 1, 'status_changed': 1, 'reassigned': 0}
+        assert counts(storage.diff_reports('r1', 'r3')) == before
+
+    def test_migrates_full_snapshots(self, tmp_path):
+        """Test reports stored as full copies by schema version 2 are converted to issue versions"""
+        import sqlite3
+        db_path = str(tmp_path / 'reports.db')
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE reports (report_id TEXT PRIMARY KEY, jql_filter TEXT NOT NULL, created_at TIMESTAMP NOT NULL)")
+            conn.execute("CREATE TABLE report_issues (report_id TEXT, issue_key TEXT, status TEXT NOT NULL, assignee TEXT, "
+                         "summary TEXT, priority TEXT, created TEXT, updated TEXT, PRIMARY KEY (report_id, issue_key))")
+            conn.execute("INSERT INTO reports VALUES ('r1', 'project = TEST', '2024-01-01 00:00:00')")
+            conn.execute("INSERT INTO reports VALUES ('r2', 'project = TEST', '2024-01-02 00:00:00')")
+            conn.execute("INSERT INTO report_issues VALUES ('r1', 'T-1', 'To Do', NULL, 'S', 'Major', NULL, NULL)")
+            conn.execute("INSERT INTO report_issues VALUES ('r2', 'T-1', 'Done', NULL, 'S', 'Major', NULL, NULL)")
+            conn.execute("PRAGMA user_version = 2")
+
+        storage = ReportStorage(db_path=db_path)
+        assert storage.get_previous_report('project = TEST')['issues'][0]['status'] == 'Done'
+        assert storage.get_report_issues('r1')[0]['status'] == 'To Do'
+        assert storage.diff_reports('r1', 'r2')['status_changed']['count'] == 1
+
+    def test_save_report_streams_records(self, storage, tmp_path):
+        """Test records stream in without holding the storage lock and a failing stream leaves no partial report"""
+        import threading
+        from meet2jira.records import IssueRecord
+        storage.save_report('o1', 'project = OTHER', [self.issue('O-1')])
+
+        def streamed():
+            for i in range(3):
+                yield IssueRecord(f'T-{i}', 'To Do', summary=f'S{i}')
+            # Another thread can use the storage while issues are still arriving
+            reader = threading.Thread(target=storage.get_previous_report, args=('project = OTHER',))
+            reader.start()
+            reader.join(timeout=5)
+            assert not reader.is_alive()
+        storage.save_report('r1', 'project = TEST', streamed())
+
+        def failing():
+            yield IssueRecord('T-1', 'Done')
+            raise ConnectionError('search failed')
+        with pytest.raises(ConnectionError):
+            storage.save_report('r2', 'project = TEST', failing())
+
+        assert storage.get_previous_report('project = TEST', include_issues=False)['report_id'] == 'r1'
+        records = storage.get_report_records('r1', ['T-0', 'T-2', 'T-9'])
+        assert records == {'T-0': IssueRecord('T-0', 'To Do', summary='S0'),
+                           'T-2': IssueRecord('T-2', 'To Do', summary='S2')}
+        assert [path.name for path in tmp_path.iterdir() if 'staging' in path.name] == []
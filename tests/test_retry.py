@@ -0,0 +1,97 @@
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from meet2jira.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, TokenBucket, retry_after
+
+def http_error(status, retry_after=None):
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return requests.HTTPError(f"HTTP {status}", response=response)
+
+class TestRetryPolicy:
+    @pytest.fixture
+    def mock_sleep(self):
+        with patch('meet2jira.retry.time.sleep') as mock:
+            yield mock
+
+    def test_honours_retry_after_even_for_creates(self, mock_sleep):
+        """Test a 429 is retried after the server's Retry-After, including for non-idempotent calls"""
+        func = MagicMock(side_effect=[http_error(429, '7'), {'key': 'TEST-1'}])
+
+        result = RetryPolicy(max_retries=3).call(func, 'payload', idempotent=False)
+
+        assert result == {'key': 'TEST-1'}
+        assert func.call_count == 2
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_reads_back_off_exponentially_with_jitter(self, mock_sleep):
+        """Test transient errors on reads wait a growing, jittered delay and the last error is raised"""
+        func = MagicMock(side_effect=http_error(502))
+
+        with pytest.raises(requests.HTTPError):
+            RetryPolicy(max_retries=3, retry_delay=1, max_delay=3).call(func)
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert func.call_count == 4
+        assert 0.5 <= delays[0] <= 1 and 1 <= delays[1] <= 2 and 1.5 <= delays[2] <= 3
+
+    @pytest.mark.parametrize('error', [http_error(500), requests.ReadTimeout('timed out'), http_error(400)])
+    def test_creates_are_not_resent_when_jira_may_have_acted(self, mock_sleep, error):
+        """Test ambiguous failures and client errors are raised at once for non-idempotent calls"""
+        func = MagicMock(side_effect=error)
+
+        with pytest.raises(type(error)):
+            RetryPolicy(max_retries=3).call(func, idempotent=False)
+
+        assert func.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_circuit_breaker_fails_fast_then_probes(self, mock_sleep):
+        """Test the breaker opens after consecutive failures and lets one probe through after the timeout"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        policy = RetryPolicy(max_retries=5, retry_delay=0, breaker=breaker)
+        func = MagicMock(side_effect=http_error(503))
+
+        with pytest.raises(CircuitOpenError):
+            policy.call(func)
+        assert func.call_count == 2
+
+        with patch('meet2jira.retry.time.monotonic', return_value=breaker.opened_at + 31):
+            assert policy.call(MagicMock(return_value='ok')) == 'ok'
+        assert not breaker.is_open
+
+    def test_rate_limiting_does_not_trip_the_breaker(self, mock_sleep):
+        """Test 429 responses slow callers down instead of counting as outages"""
+        breaker = CircuitBreaker(failure_threshold=1)
+        limiter = TokenBucket(rate=10, capacity=10)
+        func = MagicMock(side_effect=[http_error(429, '2'), 'ok'])
+
+        assert RetryPolicy(breaker=breaker, limiter=limiter).call(func) == 'ok'
+        assert not breaker.is_open
+        assert limiter.reserve() > 0
+
+    def test_token_bucket_spaces_out_bursts(self):
+        """Test callers beyond the burst capacity are told to wait one interval each"""
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_retry_after_accepts_http_dates(self):
+        """Test Retry-After given as an HTTP date becomes a delay in seconds"""
+        assert retry_after(http_error(429, 'Wed, 21 Oct 2015 07:28:00 GMT')) == 0.0
+        assert retry_after(http_error(429)) is None
+
+    def test_policy_from_settings(self):
+        """Test app retry settings and the Jira rate limit configure the policy"""
+        policy = RetryPolicy.from_settings({'app': {'max_retries': 5, 'retry_delay': 2},
+                                            'jira': {'rate_limit': {'requests_per_second': 0}}})
+
+        assert (policy.max_retries, policy.retry_delay, policy.max_delay) == (5, 2.0, 60.0)
+        assert policy.limiter is None
+        assert policy.breaker.failure_threshold == 5
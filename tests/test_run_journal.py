@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+from meet2jira.run_journal import RunJournal, PARSED, COMPLETED
+
+class TestRunJournal:
+    def test_run_steps_survive_reopening(self, tmp_path):
+        """Test issues, decisions and created keys are read back by a fresh journal"""
+        journal = RunJournal(str(tmp_path / 'runs.db'))
+        run_id = journal.start_run("Alex: fix CI", 'test-model')
+        journal.add_issues(run_id, [{'title': 'Fix CI'}, {'title': 'Write notes'}])
+        journal.mark_parsed(run_id)
+        journal.record_decision(run_id, 1, True)
+        journal.record_decision(run_id, 2, False)
+        journal.mark_creating(run_id, [1])
+        journal.close()
+
+        reopened = RunJournal(str(tmp_path / 'runs.db'))
+        assert reopened.get_run(run_id)['status'] == PARSED
+        assert reopened.issues(run_id) == [{'title': 'Fix CI'}, {'title': 'Write notes'}]
+        assert reopened.decisions(run_id) == {1: True, 2: False}
+        assert list(reopened.in_flight(run_id)) == [1]
+
+        reopened.record_created(run_id, 1, 'APP-1', 'https://jira/APP-1')
+        assert reopened.in_flight(run_id) == {}
+        assert reopened.created(run_id) == {1: {'key': 'APP-1', 'self': 'https://jira/APP-1'}}
+        assert reopened.get_run('missing') is None
+
+    def test_failure_keeps_run_resumable_and_prune_skips_it(self, tmp_path):
+        """Test a failed run keeps its status and only old completed runs are pruned"""
+        journal = RunJournal(str(tmp_path / 'runs.db'))
+        failed = journal.start_run("transcript", 'test-model')
+        done = journal.start_run("transcript", 'test-model')
+        journal.finish_run(failed, error='Jira timed out')
+        journal.finish_run(done)
+        journal.conn.execute("UPDATE runs SET updated_at = ?", (datetime.utcnow() - timedelta(days=40),))
+
+        assert journal.get_run(failed)['error'] == 'Jira timed out'
+        assert journal.get_run(done)['status'] == COMPLETED
+        assert journal.prune(keep_days=30) == 1
+        assert journal.get_run(done) is None
+        assert journal.get_run(failed) is not None
@@ -0,0 +1,93 @@
+import threading
+import pytest
+import requests
+from unittest.mock import MagicMock
+from meet2jira.server import Meet2JiraServer, JobQueue, QueueFullError, forward
+
+class TestMeet2JiraServer:
+    @pytest.fixture
+    def orchestrator(self):
+        orchestrator = MagicMock()
+        orchestrator.cache.stats.return_value = {'hits': 3, 'misses': 1}
+        orchestrator.process_transcript.return_value = ([{'title': 'Test issue'}], '')
+        orchestrator.generate_status_report.return_value = {
+            'report_id': 'r1', 'jql': 'project = TEST', 'issue_count': 2, 'summary': 'Summary', 'previous_report': None
+        }
+        return orchestrator
+
+    @pytest.fixture
+    def server(self, orchestrator):
+        server = Meet2JiraServer(orchestrator, port=0, model='test-model')
+        thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+        thread.start()
+        host, port = server.address
+        server.url = f"http://{host}:{port}"
+        yield server
+        server.httpd.shutdown()
+        server.shutdown()
+
+    def test_transcripts_returns_proposals(self, server, orchestrator):
+        """Test POST /transcripts proposes issues without creating them"""
+        response = forward(server.url, '/transcripts', {'transcript': 'We should fix login'})
+
+        assert response == {'issues': [{'title': 'Test issue'}]}
+        orchestrator.process_transcript.assert_called_once_with(
+            'We should fix login', model='test-model', dry_run=True, approve=None
+        )
+
+    def test_transcripts_creates_approved_issues(self, server, orchestrator):
+        """Test an approve selection creates issues through the shared orchestrator"""
+        response = forward(server.url, '/transcripts', {'transcript': 'text', 'approve': 'all', 'model': 'other'})
+
+        assert response == {'created': [{'title': 'Test issue'}]}
+        orchestrator.process_transcript.assert_called_once_with('text', model='other', dry_run=False, approve='all')
+
+    def test_reports(self, server, orchestrator):
+        """Test POST /reports runs a JQL report"""
+        response = forward(server.url, '/reports', {'jql': 'project = TEST', 'incremental': True})
+
+        assert response['summary'] == 'Summary'
+        orchestrator.generate_status_report.assert_called_once_with(
+            'project = TEST', model='test-model', max_issues=None, incremental=True
+        )
+
+    def test_bad_request_and_metrics(self, server):
+        """Test validation errors return 400 and are counted in /metrics"""
+        response = requests.post(f"{server.url}/reports", json={})
+        assert response.status_code == 400
+        forward(server.url, '/transcripts', {'transcript': 'text'})
+
+        metrics = requests.get(f"{server.url}/metrics").text
+        assert 'meet2jira_requests_total{endpoint="/reports"} 1' in metrics
+        assert 'meet2jira_request_errors_total{endpoint="/reports"} 1' in metrics
+        assert 'meet2jira_requests_total{endpoint="/transcripts"} 1' in metrics
+        assert 'meet2jira_llm_cache_hits_total 3' in metrics
+        assert requests.get(f"{server.url}/unknown").status_code == 404
+
+    def test_pipeline_errors_are_server_errors(self, server, orchestrator):
+        """Test only payload problems return 400; a ValueError from the pipeline is a 500"""
+        orchestrator.process_transcript.side_effect = ValueError("Invalid response format")
+        assert requests.post(f"{server.url}/transcripts", json={'transcript': 'text'}).status_code == 500
+
+        orchestrator.parse_selection.side_effect = ValueError("Invalid approve value '1,x'")
+        response = requests.post(f"{server.url}/transcripts", json={'transcript': 'text', 'approve': '1,x'})
+        assert response.status_code == 400
+        assert requests.post(f"{server.url}/reports", data=b'{"jql": ').status_code == 400
+        response = requests.post(f"{server.url}/reports", json={'jql': 'project = TEST', 'max_issues': 'ten'})
+        assert response.status_code == 400
+
+    def test_job_queue_rejects_when_full(self):
+        """Test the queue refuses work beyond max_pending instead of growing without bound"""
+        queue = JobQueue(workers=1, max_pending=1)
+        release = threading.Event()
+        worker = threading.Thread(target=queue.run, args=(release.wait,))
+        worker.start()
+        while queue.running == 0:
+            pass
+
+        with pytest.raises(QueueFullError):
+            queue.run(lambda: None)
+        release.set()
+        worker.join()
+        assert queue.run(lambda: 'done') == 'done'
+        queue.shutdown()
@@ -0,0 +1,29 @@
+import json
+from meet2jira.streaming import IssueStreamDecoder
+
+class TestIssueStreamDecoder:
+    def test_emits_issues_as_they_close(self):
+        """Test each issue is emitted as soon as its closing brace arrives"""
+        response = json.dumps({'issues': [
+            {'title': 'First {tricky} "title"', 'labels': ['a']},
+            {'title': 'Second', 'meta': {'nested': [1, 2]}}
+        ]})
+        split = response.index('}, {') + 1
+
+        decoder = IssueStreamDecoder()
+        first = decoder.feed(response[:split])
+        second = decoder.feed(response[split:])
+
+        assert first == [{'title': 'First {tricky} "title"', 'labels': ['a']}]
+        assert second == [{'title': 'Second', 'meta': {'nested': [1, 2]}}]
+        assert decoder.text == response
+
+    def test_emits_across_single_character_chunks(self):
+        """Test decoding works when the response arrives one character at a time"""
+        response = '{"summary": {"issues": [{"title": "ignored"}]}, "issues": [{"title": "A"}, {"title": "B"}]}'
+        decoder = IssueStreamDecoder()
+        issues = []
+        for ch in response:
+            issues.extend(decoder.feed(ch))
+
+        assert issues == [{'title': 'A'}, {'title': 'B'}]
@@ -0,0 +1,48 @@
+import json
+import pytest
+from meet2jira.timings import RunRecorder
+
+class TestRunRecorder:
+    def test_spans_are_aggregated_by_stage(self):
+        """Test spans record their attributes and sum per stage"""
+        recorder = RunRecorder()
+        with recorder.span('jira.search_page', start=0):
+            pass
+        with recorder.span('jira.search_page', start=50) as span:
+            span['issues'] = 50
+
+        summary = recorder.summary()
+        assert summary['stages']['jira.search_page']['count'] == 2
+        assert summary['spans'][1]['issues'] == 50
+        assert summary['spans'][1]['start'] >= summary['spans'][0]['start']
+
+    def test_span_recorded_when_block_raises(self):
+        """Test a failing stage still shows up in the timings"""
+        recorder = RunRecorder()
+        with pytest.raises(RuntimeError):
+            with recorder.span('ollama.generate'):
+                raise RuntimeError('boom')
+        assert recorder.summary()['stages']['ollama.generate']['count'] == 1
+
+    def test_llm_token_rates(self):
+        """Test Ollama's counts and nanosecond durations become token rates"""
+        recorder = RunRecorder()
+        recorder.record_llm({'prompt_eval_count': 2000, 'prompt_eval_duration': 500_000_000,
+                             'eval_count': 300, 'eval_duration': 3_000_000_000, 'load_duration': 0,
+                             'total_duration': 3_600_000_000}, 'llama2', 'extract')
+        recorder.record_llm({'response': 'cached stub without counts'}, 'llama2', 'report')
+
+        llm = json.loads(recorder.to_json())['llm']
+        assert llm['calls'] == 2
+        assert llm['prompt_tokens'] == 2000
+        assert llm['prompt_tokens_per_second'] == 4000
+        assert llm['eval_tokens_per_second'] == 100
+        assert 'LLM: 2 calls, 2000 prompt tokens (4000.0 tok/s)' in recorder.format_table()
+
+    def test_disabled_recorder_records_nothing(self):
+        """Test components can always call the recorder without collecting data"""
+        recorder = RunRecorder(enabled=False)
+        with recorder.span('storage.save') as span:
+            span['rows'] = 1
+        recorder.record_llm({'eval_count': 1}, 'llama2', 'extract')
+        assert recorder.spans == [] and recorder.llm_calls == []